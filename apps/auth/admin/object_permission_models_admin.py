@@ -1,6 +1,9 @@
 from django.contrib import admin
 
-from apps.auth.models.object_permission_models import UserObjectPermission
+from apps.auth.models.object_permission_models import (
+    GroupObjectPermission,
+    UserObjectPermission,
+)
 from apps.common.admins.base import _HatchUpBaseAdmin, admin_site
 
 
@@ -11,3 +14,12 @@ class UserObjectPermissionAdmin(_HatchUpBaseAdmin):
     search_fields = ("perm_codename", "object_id", "user__email")
     raw_id_fields = ("user", "content_type")
     ordering = ("-id",)
+
+
+@admin.register(GroupObjectPermission, site=admin_site)
+class GroupObjectPermissionAdmin(_HatchUpBaseAdmin):
+    list_display = ("id", "group", "perm_codename", "content_type", "object_id")
+    list_filter = ("content_type", "group")
+    search_fields = ("perm_codename", "object_id", "group__name")
+    raw_id_fields = ("content_type",)
+    ordering = ("-id",)
@@ -4,13 +4,14 @@ from typing import Iterable
 
 from rest_framework.permissions import BasePermission
 
+from apps.auth.configs.constants.roles import RoleName
+from apps.auth.services.authorization_context import get_authorization_context
 from apps.auth.services.object_permissions import user_has_object_perms
-from apps.auth.services.roles import has_any_role, is_platform_admin
 
 
 class IsAdminRole(BasePermission):
     def has_permission(self, request, view) -> bool:
-        return is_platform_admin(request.user)
+        return get_authorization_context(request).is_platform_admin
 
 
 class IsStartupRole(BasePermission):
@@ -20,7 +21,7 @@ class IsStartupRole(BasePermission):
     """
 
     def has_permission(self, request, view) -> bool:
-        return has_any_role(request.user, ["Startup"])
+        return get_authorization_context(request).has_any_role([RoleName.STARTUP])
 
 
 class IsInvestorRole(BasePermission):
@@ -30,7 +31,7 @@ class IsInvestorRole(BasePermission):
     """
 
     def has_permission(self, request, view) -> bool:
-        return has_any_role(request.user, ["Investor"])
+        return get_authorization_context(request).has_any_role([RoleName.INVESTOR])
 
 
 class DenyIfRoleNotAllowedForEndpoint(BasePermission):
@@ -45,7 +46,8 @@ class DenyIfRoleNotAllowedForEndpoint(BasePermission):
     message = "Your role is not allowed to access this endpoint."
 
     def has_permission(self, request, view) -> bool:
-        if is_platform_admin(request.user):
+        authz = get_authorization_context(request)
+        if authz.is_platform_admin:
             return True
 
         # Support both names for backwards compatibility:
@@ -58,8 +60,7 @@ class DenyIfRoleNotAllowedForEndpoint(BasePermission):
             # Explicit by default: if the view didn't declare its boundary, deny.
             return False
 
-        allowed_group_names = [str(r) for r in allowed]
-        return has_any_role(request.user, allowed_group_names)
+        return authz.has_any_role(allowed)
 
 
 class HasObjectPermission(BasePermission):
@@ -76,7 +77,7 @@ class HasObjectPermission(BasePermission):
     message = "You do not have permission to access this object."
 
     def has_object_permission(self, request, view, obj) -> bool:
-        if is_platform_admin(request.user):
+        if get_authorization_context(request).is_platform_admin:
             return True
 
         action = getattr(view, "action", None) or ""
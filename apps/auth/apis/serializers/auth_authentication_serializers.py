@@ -1,7 +1,11 @@
-from rest_framework import serializers
+import time
+
+from rest_framework import exceptions, serializers
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 
 from apps.auth.services.auth_token_generator_services import generate_token_for_user
+from apps.auth.services.password_verification import PasswordVerificationBusy
+from apps.auth.services.role_claims import add_role_claims
 
 
 class TokenObtainSerializer(TokenObtainPairSerializer):
@@ -10,12 +14,16 @@ class TokenObtainSerializer(TokenObtainPairSerializer):
     @classmethod
     def get_token(cls, user):
         token = super().get_token(user)
-        token["roles"] = [role.name for role in user.roles.all()]
+        add_role_claims(token, user.roles.values_list("name", flat=True), time.time())
         token["username"] = user.email
+        token["is_superuser"] = user.is_superuser
         return token
 
     def validate(self, attrs):
-        data = super().validate(attrs)
+        try:
+            super().validate(attrs)
+        except PasswordVerificationBusy as exc:
+            raise exceptions.Throttled(wait=exc.retry_after) from exc
         return generate_token_for_user(self.user)
 
 
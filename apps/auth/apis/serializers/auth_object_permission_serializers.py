@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from rest_framework import serializers
+
+from apps.auth.services.object_permissions import (
+    default_object_perms_for_model,
+    prefetch_object_perms,
+    user_has_object_perms,
+)
+
+
+class ObjectPermissionsField(serializers.Field):
+    """
+    Read-only per-object permission flags for the requesting user.
+
+    Usage:
+        permissions = ObjectPermissionsField()
+        # -> {"can_view": True, "can_change": False, "can_delete": False}
+        permissions = ObjectPermissionsField(perms={"can_edit": "document.change_document"})
+
+    Performance:
+    - Inside a list serializer the whole page is loaded on first use via
+      `prefetch_object_perms`, so N rows cost one lookup, not N queries.
+    - Flags are then answered from the request-scoped permission cache.
+    """
+
+    def __init__(self, perms: dict[str, str] | None = None, **kwargs) -> None:
+        kwargs["source"] = "*"
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+        self.perms = perms
+
+    def _flags(self, obj) -> dict[str, str]:
+        if self.perms:
+            return self.perms
+        view, change, delete = default_object_perms_for_model(type(obj))
+        return {"can_view": view, "can_change": change, "can_delete": delete}
+
+    def _prefetch_page(self, request) -> None:
+        list_serializer = getattr(self.parent, "parent", None)
+        if not isinstance(list_serializer, serializers.ListSerializer):
+            return
+        if getattr(list_serializer, "_objperm_prefetched", False):
+            return
+        list_serializer._objperm_prefetched = True
+        if list_serializer.instance is not None:
+            prefetch_object_perms(request=request, objs=list_serializer.instance)
+
+    def to_representation(self, obj) -> dict[str, bool]:
+        flags = self._flags(obj)
+        request = self.context.get("request")
+        user = getattr(request, "user", None)
+        if not getattr(user, "is_authenticated", False):
+            return {flag: False for flag in flags}
+
+        self._prefetch_page(request)
+        return {
+            flag: user_has_object_perms(request=request, obj=obj, required_perms=[perm])
+            for flag, perm in flags.items()
+        }
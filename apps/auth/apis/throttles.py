@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from apps.common.configs.classes.common_throttles_classes import (
+    ScopedSlidingWindowThrottle,
+)
+
+
+def _request_field(request, name: str) -> str | None:
+    data = request.data
+    value = data.get(name) if hasattr(data, "get") else None
+    if not isinstance(value, str) or not value.strip():
+        return None
+    return value.strip().lower()
+
+
+class EmailRateThrottle(ScopedSlidingWindowThrottle):
+    """
+    Per submitted `email`, whether or not an account exists (so the limit
+    cannot be used to enumerate users). Requests without one are left to
+    validation and the IP throttle.
+    """
+
+    scope_suffix = "email"
+
+    def get_cache_key(self, request, view):
+        email = _request_field(request, "email")
+        if email is None:
+            return None
+        return self.cache_format % {"scope": self.scope, "ident": email}
+
+
+class EmailPurposeRateThrottle(EmailRateThrottle):
+    """Per (`email`, `purpose`): login and register codes are limited apart."""
+
+    def get_cache_key(self, request, view):
+        email = _request_field(request, "email")
+        if email is None:
+            return None
+        purpose = _request_field(request, "purpose") or ""
+        return self.cache_format % {"scope": self.scope, "ident": f"{email}:{purpose}"}
@@ -8,7 +8,9 @@ from apps.auth.apis.serializers.auth_authentication_serializers import (
     RefreshTokenSerializer,
     TokenObtainSerializer,
 )
+from apps.auth.apis.throttles import EmailRateThrottle
 from apps.common.apis.views.common_base_views import HatchupAPIView
+from apps.common.configs.classes.common_throttles_classes import IPRateThrottle
 from drf_spectacular.utils import extend_schema
 
 
@@ -16,6 +18,8 @@ class LoginAPIView(HatchupAPIView):
     authentication_classes = []
     permission_classes = [AllowAny]
     serializer_class = TokenObtainSerializer
+    throttle_classes = [IPRateThrottle, EmailRateThrottle]
+    throttle_scope = "login"
 
     @extend_schema(
         tags=["Authentication"],
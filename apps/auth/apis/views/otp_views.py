@@ -12,6 +12,7 @@ from apps.auth.apis.serializers.auth_otp_serializers import OTPRequestSuccessSer
 from apps.auth.apis.serializers.auth_otp_serializers import OTPTokenExchangeSerializer
 from apps.auth.apis.serializers.auth_otp_serializers import OTPVerifyResponseSerializer
 from apps.auth.apis.serializers.auth_otp_serializers import OTPVerifySerializer
+from apps.auth.apis.throttles import EmailPurposeRateThrottle
 from apps.auth.services.auth_token_generator_services import generate_token_for_user
 from apps.auth.services.otp_service import OTP_PURPOSE_LOGIN
 from apps.auth.services.otp_service import OTP_PURPOSE_REGISTER
@@ -21,6 +22,7 @@ from apps.auth.services.otp_service import send_otp_email
 from apps.auth.services.otp_service import store_otp
 from apps.auth.services.otp_service import verify_otp_and_issue_verification_id
 from apps.common.apis.views.common_base_views import HatchupAPIView
+from apps.common.configs.classes.common_throttles_classes import IPRateThrottle
 
 User = get_user_model()
 
@@ -28,6 +30,8 @@ User = get_user_model()
 class OTPRequestView(HatchupAPIView):
     permission_classes = [AllowAny]
     authentication_classes = []
+    throttle_classes = [IPRateThrottle, EmailPurposeRateThrottle]
+    throttle_scope = "otp_request"
 
     @extend_schema(
         tags=["Authentication - OTP"],
@@ -50,14 +54,17 @@ class OTPRequestView(HatchupAPIView):
             if User.objects.filter(email__iexact=email).exists():
                 return Response({"message": generic_message}, status=status.HTTP_200_OK)
         otp = generate_otp()
-        store_otp(email, otp, purpose)
-        send_otp_email(email, otp, purpose)
+        # Over the per-email request limit: same response, no email.
+        if store_otp(email, otp, purpose):
+            send_otp_email(email, otp, purpose)
         return Response({"message": generic_message}, status=status.HTTP_200_OK)
 
 
 class OTPVerifyView(HatchupAPIView):
     permission_classes = [AllowAny]
     authentication_classes = []
+    throttle_classes = [IPRateThrottle, EmailPurposeRateThrottle]
+    throttle_scope = "otp_verify"
 
     @extend_schema(
         tags=["Authentication - OTP"],
@@ -5,3 +5,6 @@ class AuthConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.auth"
     label = "authz"
+
+    def ready(self):
+        from apps.auth import signals  # noqa: F401
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+from apps.auth.services.password_verification import (
+    amake_password,
+    averify_password,
+    make_password,
+    verify_password,
+)
+
+UserModel = get_user_model()
+
+
+class PooledModelBackend(ModelBackend):
+    """
+    `ModelBackend` whose password hashing runs on the bounded pool of
+    `password_verification`; raises `PasswordVerificationBusy` when it is full.
+    The user lookup and the rehash save stay on the calling thread, so the
+    workers never touch the database.
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        try:
+            user = UserModel._default_manager.get_by_natural_key(username)
+        except UserModel.DoesNotExist:
+            # Hash once anyway so unknown users take as long (Django #20760).
+            make_password(password)
+            return None
+        is_correct, must_update = verify_password(password, user.password)
+        if not is_correct:
+            return None
+        if must_update:
+            user.password = make_password(password)
+            user.save(update_fields=["password"])
+        return user if self.user_can_authenticate(user) else None
+
+    async def aauthenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        try:
+            user = await UserModel._default_manager.aget_by_natural_key(username)
+        except UserModel.DoesNotExist:
+            await amake_password(password)
+            return None
+        is_correct, must_update = await averify_password(password, user.password)
+        if not is_correct:
+            return None
+        if must_update:
+            user.password = await amake_password(password)
+            await user.asave(update_fields=["password"])
+        return user if self.user_can_authenticate(user) else None
@@ -0,0 +1,128 @@
+"""Compare `filter_queryset_by_object_perm` strategies on synthetic permission tables."""
+
+import statistics
+import time
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from apps.auth.models.object_permission_models import UserObjectPermission
+from apps.auth.services.object_permissions import (
+    OBJECT_PERM_BULK_BATCH_SIZE,
+    OBJECT_PERM_FILTER_STRATEGIES,
+    filter_queryset_by_object_perm,
+)
+from apps.common.configs.constants.type_enums import TypeScopeChoices
+from apps.common.models.common_type_models import Type
+
+User = get_user_model()
+
+_PERM = "common.view_type"
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed --rows UserObjectPermission rows inside a transaction, time every "
+        "filter strategy for one user, then roll everything back. "
+        "Example: benchmark_object_perm_filters --rows 1000000 --rows 10000000"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows",
+            action="append",
+            type=int,
+            dest="row_counts",
+            help="Permission rows to seed (repeatable). Default: 1000000.",
+        )
+        parser.add_argument("--users", type=int, default=1000)
+        parser.add_argument("--objects", type=int, default=20000)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument(
+            "--explain", action="store_true", help="Print EXPLAIN ANALYZE per strategy."
+        )
+
+    def handle(self, *args, **options):
+        for rows in options["row_counts"] or [1_000_000]:
+            per_user = rows // options["users"]
+            if not 0 < per_user <= options["objects"]:
+                raise CommandError(
+                    "--rows / --users must be between 1 and --objects "
+                    f"(got {per_user} grants per user)."
+                )
+            try:
+                with transaction.atomic():
+                    self._run(rows=rows, per_user=per_user, **options)
+                    raise _Rollback
+            except _Rollback:
+                pass
+
+    def _run(self, *, rows, per_user, users, objects, repeat, explain, **_):
+        self.stdout.write(f"Seeding {rows} rows ({users} users x {per_user})...")
+        run_id = uuid.uuid4().hex[:8]
+        user_objs = User.objects.bulk_create(
+            [User(email=f"bench-{run_id}-{i}@example.com") for i in range(users)],
+            batch_size=OBJECT_PERM_BULK_BATCH_SIZE,
+        )
+        type_objs = Type.objects.bulk_create(
+            [
+                Type(title=f"bench-{i}", scope=TypeScopeChoices.DOCUMENT)
+                for i in range(objects)
+            ],
+            batch_size=OBJECT_PERM_BULK_BATCH_SIZE,
+        )
+        ct = ContentType.objects.get_for_model(Type)
+
+        def _grants():
+            # Users get overlapping, evenly spread windows over the objects.
+            for u, user in enumerate(user_objs):
+                start = (u * per_user) % objects
+                for k in range(per_user):
+                    yield UserObjectPermission(
+                        user_id=user.pk,
+                        content_type_id=ct.pk,
+                        object_id=str(type_objs[(start + k) % objects].pk),
+                        perm_codename=_PERM,
+                    )
+
+        batch = []
+        for grant in _grants():
+            batch.append(grant)
+            if len(batch) >= OBJECT_PERM_BULK_BATCH_SIZE:
+                UserObjectPermission.objects.bulk_create(batch)
+                batch = []
+        if batch:
+            UserObjectPermission.objects.bulk_create(batch)
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute(f"ANALYZE {UserObjectPermission._meta.db_table}")
+
+        user = user_objs[0]
+        for strategy in OBJECT_PERM_FILTER_STRATEGIES:
+            # First run is cold: "auto" builds the snapshot that "ids" then reuses.
+            timings = []
+            for _ in range(max(repeat, 2)):
+                started = time.perf_counter()
+                qs = filter_queryset_by_object_perm(
+                    user=user,
+                    queryset=Type.objects.all(),
+                    perm=_PERM,
+                    strategy=strategy,
+                )
+                page = list(qs.order_by("pk").values_list("pk", flat=True)[:50])
+                total = qs.count()
+                timings.append((time.perf_counter() - started) * 1000)
+            self.stdout.write(
+                f"rows={rows} strategy={strategy:<8} matched={total} "
+                f"page={len(page)} cold={timings[0]:.2f}ms "
+                f"warm_median={statistics.median(timings[1:]):.2f}ms"
+            )
+            if explain:
+                self.stdout.write(qs.explain(analyze=connection.vendor == "postgresql"))
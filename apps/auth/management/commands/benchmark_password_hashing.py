@@ -0,0 +1,95 @@
+"""Measure password checks per second per core under the current hasher."""
+
+import os
+import threading
+import time
+
+from django.contrib.auth.hashers import get_hasher
+from django.core.management.base import BaseCommand
+
+from apps.auth.services.password_verification import (
+    PASSWORD_QUEUE_DEPTH,
+    PasswordHashPool,
+    PasswordVerificationBusy,
+)
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+class Command(BaseCommand):
+    help = (
+        "Verify one password --checks times with the first PASSWORD_HASHERS "
+        "entry (or --hasher): inline on one thread, then from --clients "
+        "threads through a PasswordHashPool of --workers threads. Reports "
+        "checks/s per core (the login capacity one core adds), latency, and "
+        "how many checks the pool refused as busy."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--hasher", default="default")
+        parser.add_argument("--checks", type=int, default=200)
+        parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+        parser.add_argument("--queue-depth", type=int, default=PASSWORD_QUEUE_DEPTH)
+        parser.add_argument("--clients", type=int, default=32)
+
+    def handle(self, *args, **options):
+        hasher = get_hasher(options["hasher"])
+        encoded = hasher.encode("correct horse battery", hasher.salt())
+        checks = options["checks"]
+        cores = os.cpu_count() or 1
+
+        started = time.perf_counter()
+        for _ in range(checks):
+            hasher.verify("correct horse battery", encoded)
+        inline = time.perf_counter() - started
+        self.stdout.write(
+            f"hasher={hasher.algorithm} cores={cores} inline: "
+            f"{inline / checks * 1000:.1f}ms per check, "
+            f"{checks / inline:,.1f} checks/s on one core"
+        )
+
+        pool = PasswordHashPool(options["workers"], options["queue_depth"])
+        latencies: list[float] = []
+        rejected = 0
+        lock = threading.Lock()
+        per_client = max(1, checks // options["clients"])
+
+        def client() -> None:
+            nonlocal rejected
+            for _ in range(per_client):
+                begun = time.perf_counter()
+                try:
+                    pool.run(hasher.verify, "correct horse battery", encoded)
+                except PasswordVerificationBusy:
+                    with lock:
+                        rejected += 1
+                    # A refused client backs off briefly, as on a 429.
+                    time.sleep(0.01)
+                    continue
+                with lock:
+                    latencies.append(time.perf_counter() - begun)
+
+        threads = [threading.Thread(target=client) for _ in range(options["clients"])]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+        pool.shutdown()
+
+        busy_cores = min(pool.workers, cores)
+        self.stdout.write(
+            f"pool workers={pool.workers} queue={pool.queue_depth} "
+            f"clients={options['clients']}: {len(latencies):,} checks in "
+            f"{elapsed:.2f}s ({len(latencies) / elapsed:,.1f}/s, "
+            f"{len(latencies) / elapsed / busy_cores:,.1f}/s per core), "
+            f"p50={_percentile(latencies, 0.5) * 1000:.0f}ms "
+            f"p99={_percentile(latencies, 0.99) * 1000:.0f}ms, "
+            f"rejected busy={rejected:,}"
+        )
@@ -0,0 +1,25 @@
+"""Rebuild the JWT revocation bitmap from the users table."""
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from apps.auth.services.revocation import rebuild_revocations
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the revocation bitmap used by JWT token-user mode from inactive "
+        "and deleted users (e.g. after a cache flush)."
+    )
+
+    def handle(self, *args, **options):
+        revoked_ids = (
+            User.objects.filter(Q(is_active=False) | Q(is_deleted=True))
+            .values_list("id", flat=True)
+            .iterator(chunk_size=10_000)
+        )
+        count = rebuild_revocations(revoked_ids)
+        self.stdout.write(self.style.SUCCESS(f"Revoked users written: {count}"))
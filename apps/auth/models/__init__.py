@@ -1 +1,5 @@
 """Authentication app models."""
+
+from .object_permission_models import GroupObjectPermission, UserObjectPermission
+
+__all__ = ["GroupObjectPermission", "UserObjectPermission"]
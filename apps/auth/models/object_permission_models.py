@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from django.conf import settings
+from django.contrib.auth.models import Group
 from django.contrib.contenttypes.models import ContentType
 from django.db import models
 
@@ -15,10 +16,15 @@ class UserObjectPermission(HatchUpBaseModel):
     - One row means: `user` has `perm_codename` on (content_type, object_id).
     - `perm_codename` is a full permission string: "{app_label}.{codename}"
       e.g. "users.view_user"
+    - `object_id` is the target's primary key as text (`str(pk)`, the same
+      form as Postgres `pk::text`), so integer and UUID keyed models share it.
 
     Performance:
-    - LIST filtering uses a subquery against this table (single query, no N+1).
-    - DETAIL permission checks can be cached per request in the service layer.
+    - LIST filtering uses a correlated EXISTS (or an id list) against this
+      table; the partial composite index makes that an index-only lookup.
+    - DETAIL permission checks are served from a per-user snapshot cached across
+      requests (`auth.services.object_permission_snapshots`); any write here
+      must invalidate it (signals do for per-row writes).
     """
 
     user = models.ForeignKey(
@@ -30,7 +36,7 @@ class UserObjectPermission(HatchUpBaseModel):
     content_type = models.ForeignKey(
         ContentType, on_delete=models.CASCADE, db_index=True
     )
-    object_id = models.BigIntegerField(db_index=True)
+    object_id = models.CharField(max_length=64, db_index=True)
     perm_codename = models.CharField(max_length=255, db_index=True)
 
     class Meta:
@@ -40,6 +46,60 @@ class UserObjectPermission(HatchUpBaseModel):
                 name="uniq_user_object_perm",
             )
         ]
+        indexes = [
+            # Covers the LIST filter probe (user, type, perm) -> object ids.
+            # Partial on the manager's filter so live grants are index-only.
+            models.Index(
+                fields=["user", "content_type", "perm_codename", "object_id"],
+                name="objperm_user_ct_perm_obj_idx",
+                condition=models.Q(is_active=True, is_deleted=False),
+            )
+        ]
 
     def __str__(self) -> str:
         return f"{self.user_id}:{self.perm_codename}:{self.content_type_id}:{self.object_id}"
+
+
+class GroupObjectPermission(HatchUpBaseModel):
+    """
+    Role-wide object-level permission record.
+
+    Design:
+    - One row means: every member of `group` (a role) has `perm_codename` on
+      (content_type, object_id). Membership changes need no permission writes.
+    - Same `perm_codename` / `object_id` conventions as `UserObjectPermission`.
+
+    Performance:
+    - Resolved together with user grants in a single query (EXISTS / UNION),
+      keyed by the caller's cached role set (`auth.services.roles`).
+    """
+
+    group = models.ForeignKey(
+        Group,
+        on_delete=models.CASCADE,
+        related_name="object_perms",
+        db_index=True,
+    )
+    content_type = models.ForeignKey(
+        ContentType, on_delete=models.CASCADE, db_index=True
+    )
+    object_id = models.CharField(max_length=64, db_index=True)
+    perm_codename = models.CharField(max_length=255, db_index=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["group", "content_type", "object_id", "perm_codename"],
+                name="uniq_group_object_perm",
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["group", "content_type", "perm_codename", "object_id"],
+                name="objperm_grp_ct_perm_obj_idx",
+                condition=models.Q(is_active=True, is_deleted=False),
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.group_id}:{self.perm_codename}:{self.content_type_id}:{self.object_id}"
@@ -1,5 +1,8 @@
+import time
+
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from apps.auth.services.role_claims import add_role_claims
 from apps.users.models.users_user_models import User
 
 
@@ -7,11 +10,17 @@ def generate_token_for_user(user: User) -> dict:
     refresh = RefreshToken.for_user(user)
     access = refresh.access_token
 
-    refresh["roles"] = [role.name for role in user.roles.all()]
+    # Taken before the read: a change committed meanwhile is then >= roles_at.
+    roles_at = time.time()
+    role_names = list(user.roles.values_list("name", flat=True))
+
+    add_role_claims(refresh, role_names, roles_at)
     refresh["username"] = user.email
+    refresh["is_superuser"] = user.is_superuser
 
-    access["roles"] = [role.name for role in user.roles.all()]
+    add_role_claims(access, role_names, roles_at)
     access["username"] = user.email
+    access["is_superuser"] = user.is_superuser
     return {
         "refresh": str(refresh),
         "access": str(access),
@@ -0,0 +1,98 @@
+"""
+Request-scoped authorization context.
+
+`HatchupJWTAuthentication` attaches an `AuthorizationContext` to every
+authenticated request as `request.authz`. Permission classes, view helpers and
+serializers read roles / admin status from it instead of calling
+`get_user_roles` (and rebuilding sets) on each check.
+
+Performance:
+- Roles are resolved lazily, at most once per request.
+- `has_any_role` results are memoized per allowed-role set.
+"""
+
+from __future__ import annotations
+
+from enum import Enum
+from typing import Iterable
+
+from apps.auth.configs.constants.roles import RoleName
+from apps.auth.services.roles import get_user_roles, is_platform_admin
+
+_UNSET = object()
+
+
+def _role_name(role) -> str:
+    # `str(RoleName.ADMIN)` is "RoleName.ADMIN"; group names are the values.
+    return role.value if isinstance(role, Enum) else str(role)
+
+
+class AuthorizationContext:
+    """Memoized roles and admin checks for one user (usually `request.user`)."""
+
+    __slots__ = ("user", "_roles", "_is_platform_admin", "_any_role_cache")
+
+    def __init__(self, user) -> None:
+        self.user = user
+        self._roles = _UNSET
+        self._is_platform_admin = _UNSET
+        self._any_role_cache: dict[frozenset[str], bool] = {}
+
+    @property
+    def is_authenticated(self) -> bool:
+        return bool(self.user and getattr(self.user, "is_authenticated", False))
+
+    @property
+    def roles(self) -> frozenset[str]:
+        if self._roles is _UNSET:
+            self._roles = (
+                frozenset(get_user_roles(self.user))
+                if self.is_authenticated
+                else frozenset()
+            )
+        return self._roles
+
+    @property
+    def is_platform_admin(self) -> bool:
+        if self._is_platform_admin is _UNSET:
+            self._is_platform_admin = is_platform_admin(self.user)
+        return self._is_platform_admin
+
+    @property
+    def is_admin(self) -> bool:
+        """Platform admin (superuser) or member of the Admin role."""
+
+        return self.is_authenticated and (
+            self.is_platform_admin or RoleName.ADMIN.value in self.roles
+        )
+
+    def has_role(self, role) -> bool:
+        return _role_name(role) in self.roles
+
+    def has_any_role(self, allowed_roles: Iterable) -> bool:
+        """Same semantics as `roles.has_any_role`: platform admins always pass."""
+
+        if self.is_platform_admin:
+            return True
+        allowed = frozenset(_role_name(role) for role in allowed_roles)
+        result = self._any_role_cache.get(allowed)
+        if result is None:
+            result = not self.roles.isdisjoint(allowed)
+            self._any_role_cache[allowed] = result
+        return result
+
+
+def get_authorization_context(request) -> AuthorizationContext:
+    """
+    Return `request.authz`, (re)building it if missing or stale.
+
+    Requests authenticated by other classes (session auth, `force_authenticate`
+    in tests) get a context on first use.
+    """
+
+    user = getattr(request, "user", None)
+    context = getattr(request, "authz", None)
+    if context is None or context.user is not user:
+        context = AuthorizationContext(user)
+        request.authz = context
+    return context
@@ -1,16 +1,39 @@
 from __future__ import annotations
 
-from typing import Iterable, Type
+from functools import reduce
+from itertools import islice
+from operator import or_
+from typing import Iterable, Iterator, Type
 
+from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.auth import get_user_model
-from django.db.models import Model, QuerySet
+from django.db import transaction
+from django.db.models import CharField, Exists, Model, OuterRef, Q, QuerySet
+from django.db.models.functions import Cast
+from django.utils import timezone
 
-from apps.auth.services.roles import is_platform_admin
-from apps.auth.models.object_permission_models import UserObjectPermission
+from apps.auth.services.object_permission_snapshots import (
+    get_object_perm_snapshot,
+    invalidate_group_object_perm_snapshots,
+    invalidate_object_perm_snapshots,
+)
+from apps.auth.services.roles import get_user_roles, is_platform_admin
+from apps.auth.models.object_permission_models import (
+    GroupObjectPermission,
+    UserObjectPermission,
+)
 
 User = get_user_model()
 
+OBJECT_PERM_BULK_BATCH_SIZE = 5000
+# Up to this many allowed ids, list filters inline them as `pk IN (...)`
+# literals instead of a subquery against `UserObjectPermission`.
+OBJECT_PERM_LITERAL_IN_MAX = 1000
+
+# `filter_queryset_by_object_perm` strategies (see its docstring).
+OBJECT_PERM_FILTER_STRATEGIES = ("auto", "exists", "subquery", "ids")
+
 
 def _model_perm(app_label: str, codename: str) -> str:
     return f"{app_label}.{codename}"
@@ -41,19 +64,243 @@ def assign_owner_object_perms(*, user: User, obj: Model) -> None:
     - Done on creation (signals) to keep read-path checks efficient.
     """
 
-    ct = ContentType.objects.get_for_model(obj, for_concrete_model=False)
-    perms = default_object_perms_for_model(type(obj))
-    rows = [
-        UserObjectPermission(
-            user=user,
-            content_type=ct,
-            object_id=obj.pk,
-            perm_codename=perm,
+    assign_object_perms_bulk(users=[user], objs=[obj])
+
+
+def _pks(instances: Iterable) -> list[int]:
+    return [getattr(i, "pk", i) for i in instances]
+
+
+def _chunks(iterable: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class _ContentTypeResolver:
+    """Resolve ContentType (and default perms) once per model class."""
+
+    def __init__(self) -> None:
+        self._by_model: dict[type, tuple[ContentType, tuple[str, ...]]] = {}
+
+    def __call__(self, model: Type[Model]) -> tuple[ContentType, tuple[str, ...]]:
+        resolved = self._by_model.get(model)
+        if resolved is None:
+            resolved = (
+                ContentType.objects.get_for_model(model, for_concrete_model=False),
+                default_object_perms_for_model(model),
+            )
+            self._by_model[model] = resolved
+        return resolved
+
+
+def _assign_bulk(
+    model: Type[Model],
+    owner_field: str,
+    owner_ids: list,
+    objs: Iterable[Model],
+    perms: Iterable[str] | None,
+    batch_size: int,
+) -> int:
+    explicit_perms = tuple(perms) if perms is not None else None
+    resolve = _ContentTypeResolver()
+    owner_attname = f"{owner_field}_id"
+
+    def _rows() -> Iterator[Model]:
+        for obj in objs:
+            ct, default_perms = resolve(type(obj))
+            for perm in explicit_perms or default_perms:
+                for owner_id in owner_ids:
+                    yield model(
+                        **{owner_attname: owner_id},
+                        content_type=ct,
+                        object_id=str(obj.pk),
+                        perm_codename=perm,
+                    )
+
+    written = 0
+    for chunk in _chunks(_rows(), batch_size):
+        with transaction.atomic():
+            model.objects.bulk_create(
+                chunk,
+                update_conflicts=True,
+                unique_fields=[
+                    owner_field,
+                    "content_type",
+                    "object_id",
+                    "perm_codename",
+                ],
+                update_fields=["is_active", "is_deleted", "updated_at"],
+            )
+        written += len(chunk)
+    return written
+
+
+def _revoke_bulk(
+    model: Type[Model],
+    owner_field: str,
+    owner_ids: list,
+    objs: Iterable[Model],
+    perms: Iterable[str] | None,
+    batch_size: int,
+) -> int:
+    perms = tuple(perms) if perms is not None else None
+    resolve = _ContentTypeResolver()
+    now = timezone.now()
+
+    revoked = 0
+    for chunk in _chunks(objs, batch_size):
+        ids_by_ct: dict[int, list] = {}
+        for obj in chunk:
+            ct, _ = resolve(type(obj))
+            ids_by_ct.setdefault(ct.pk, []).append(str(obj.pk))
+        for ct_id, object_ids in ids_by_ct.items():
+            qs = model.objects.filter(
+                **{f"{owner_field}_id__in": owner_ids},
+                content_type_id=ct_id,
+                object_id__in=object_ids,
+            )
+            if perms is not None:
+                qs = qs.filter(perm_codename__in=perms)
+            with transaction.atomic():
+                revoked += qs.update(is_active=False, is_deleted=True, updated_at=now)
+    return revoked
+
+
+def assign_object_perms_bulk(
+    *,
+    users: Iterable,
+    objs: Iterable[Model],
+    perms: Iterable[str] | None = None,
+    batch_size: int = OBJECT_PERM_BULK_BATCH_SIZE,
+) -> int:
+    """
+    Grant `perms` on every object in `objs` to every user in `users`.
+
+    - `users`: User instances or ids (materialized once as ids).
+    - `objs`: model instances, possibly of mixed models; streamed, so a
+      `queryset.iterator()` over millions of rows is fine.
+    - `perms`: full permission strings; defaults to the owner perms of each
+      object's model (`default_object_perms_for_model`).
+
+    Performance:
+    - ContentType is resolved once per model, not per object.
+    - Rows are written in `batch_size` INSERT ... ON CONFLICT statements, each
+      in its own transaction, so backfills don't hold one giant transaction.
+    - Existing grants are kept; soft-deleted (revoked) grants are reactivated.
+
+    Returns the number of (user, object, perm) rows written.
+    """
+
+    user_ids = _pks(users)
+    if not user_ids:
+        return 0
+    try:
+        return _assign_bulk(
+            UserObjectPermission, "user", user_ids, objs, perms, batch_size
+        )
+    finally:
+        # `bulk_create` sends no signals; committed batches must still be seen.
+        invalidate_object_perm_snapshots(user_ids)
+
+
+def revoke_object_perms_bulk(
+    *,
+    users: Iterable,
+    objs: Iterable[Model],
+    perms: Iterable[str] | None = None,
+    batch_size: int = OBJECT_PERM_BULK_BATCH_SIZE,
+) -> int:
+    """
+    Revoke `perms` on `objs` from `users` (soft delete, per project convention).
+
+    Objects are grouped per content type and revoked with one
+    `UPDATE ... WHERE user_id IN (..) AND content_type_id = .. AND object_id IN (..)`
+    per `batch_size` object ids. `perms=None` revokes every perm on the objects.
+
+    Returns the number of grants revoked.
+    """
+
+    user_ids = _pks(users)
+    if not user_ids:
+        return 0
+    try:
+        return _revoke_bulk(
+            UserObjectPermission, "user", user_ids, objs, perms, batch_size
         )
-        for perm in perms
+    finally:
+        # `QuerySet.update` sends no signals either.
+        invalidate_object_perm_snapshots(user_ids)
+
+
+def assign_group_object_perms_bulk(
+    *,
+    groups: Iterable,
+    objs: Iterable[Model],
+    perms: Iterable[str] | None = None,
+    batch_size: int = OBJECT_PERM_BULK_BATCH_SIZE,
+) -> int:
+    """
+    Grant `perms` on `objs` to whole roles (`GroupObjectPermission`).
+
+    One row per (role, object, perm) instead of one per member; same batching
+    and upsert semantics as `assign_object_perms_bulk`.
+    """
+
+    group_ids = _pks(groups)
+    if not group_ids:
+        return 0
+    try:
+        return _assign_bulk(
+            GroupObjectPermission, "group", group_ids, objs, perms, batch_size
+        )
+    finally:
+        invalidate_group_object_perm_snapshots()
+
+
+def revoke_group_object_perms_bulk(
+    *,
+    groups: Iterable,
+    objs: Iterable[Model],
+    perms: Iterable[str] | None = None,
+    batch_size: int = OBJECT_PERM_BULK_BATCH_SIZE,
+) -> int:
+    """Revoke role-wide grants (soft delete); see `revoke_object_perms_bulk`."""
+
+    group_ids = _pks(groups)
+    if not group_ids:
+        return 0
+    try:
+        return _revoke_bulk(
+            GroupObjectPermission, "group", group_ids, objs, perms, batch_size
+        )
+    finally:
+        invalidate_group_object_perm_snapshots()
+
+
+def _grant_querysets(user, ct: ContentType, **filters) -> list[QuerySet]:
+    """User grants plus, if the user has roles, the grants of those roles."""
+
+    grant_sets = [
+        UserObjectPermission.objects.filter(user=user, content_type=ct, **filters)
     ]
-    # Ignore duplicates if called twice.
-    UserObjectPermission.objects.bulk_create(rows, ignore_conflicts=True)
+    roles = get_user_roles(user)
+    if roles:
+        grant_sets.append(
+            GroupObjectPermission.objects.filter(
+                group__name__in=roles, content_type=ct, **filters
+            )
+        )
+    return grant_sets
+
+
+def _union_values(grant_sets: list[QuerySet], *fields: str) -> QuerySet:
+    # Single round-trip; `order_by()` drops the model ordering UNION rejects.
+    flat = len(fields) == 1
+    return reduce(
+        QuerySet.union,
+        [g.values_list(*fields, flat=flat).order_by() for g in grant_sets],
+    )
 
 
 def filter_queryset_by_object_perm(
@@ -61,13 +308,25 @@ def filter_queryset_by_object_perm(
     user: User,
     queryset: QuerySet,
     perm: str,
+    strategy: str | None = None,
 ) -> QuerySet:
     """
-    Efficient LIST filtering using guardian.
+    Efficient LIST filtering against `UserObjectPermission` and the role-wide
+    `GroupObjectPermission` grants of the user's (cached) roles.
 
     Critical performance strategy:
     - We **do not** call `has_perm(obj)` per row (would cause N+1 queries).
-    - We use `get_objects_for_user`, which returns a queryset constrained by a JOIN.
+    - Every strategy is a single SQL query on `queryset`'s table:
+      - "exists": correlated `EXISTS` probes (user grants OR role grants);
+        Postgres plans them as semi-joins on the partial
+        (owner, content_type, perm_codename, object_id) indexes, so the
+        permission tables are read index-only.
+      - "subquery": the legacy `pk IN (SELECT object_id ...)`, per table.
+      - "ids": materialize the allowed ids (from the user's snapshot when
+        cached) and inline them as `pk IN (...)` literals.
+      - "auto" (default, `AUTHZ_OBJECT_PERM_FILTER_STRATEGY`): "ids" when the
+        snapshot holds at most `OBJECT_PERM_LITERAL_IN_MAX` ids, else "exists".
+    - Works for integer, UUID and string primary keys (`object_id` is text).
     """
 
     if not getattr(user, "is_authenticated", False):
@@ -75,13 +334,44 @@ def filter_queryset_by_object_perm(
     if is_platform_admin(user):
         return queryset
 
+    strategy = strategy or getattr(
+        settings, "AUTHZ_OBJECT_PERM_FILTER_STRATEGY", "auto"
+    )
+    if strategy not in OBJECT_PERM_FILTER_STRATEGIES:
+        raise ValueError(f"Unknown object permission filter strategy: {strategy!r}")
+
     model = queryset.model
     ct = ContentType.objects.get_for_model(model, for_concrete_model=False)
-    allowed_ids = UserObjectPermission.objects.filter(
-        user=user, content_type=ct, perm_codename=perm
-    ).values_list("object_id", flat=True)
-    # Single SQL query with a subquery; avoids N+1 checks.
-    return queryset.filter(pk__in=allowed_ids)
+
+    if strategy in ("auto", "ids"):
+        snapshot = get_object_perm_snapshot(user, ct.pk)
+        if snapshot is not None:
+            ids = snapshot.object_ids(perm)
+        elif strategy == "ids":
+            ids = list(
+                _union_values(
+                    _grant_querysets(user, ct, perm_codename=perm), "object_id"
+                )
+            )
+        else:
+            ids = None
+        if ids is not None and (
+            strategy == "ids" or len(ids) <= OBJECT_PERM_LITERAL_IN_MAX
+        ):
+            return queryset.filter(pk__in=ids) if ids else queryset.none()
+
+    grant_sets = _grant_querysets(user, ct, perm_codename=perm)
+    if strategy == "subquery":
+        return queryset.alias(_objperm_pk=Cast("pk", output_field=CharField())).filter(
+            reduce(or_, [Q(_objperm_pk__in=g.values("object_id")) for g in grant_sets])
+        )
+
+    # `object_id` is text: cast the outer pk (not the column) so the
+    # (owner, content_type, perm_codename, object_id) indexes stay usable.
+    pk_as_text = Cast(OuterRef("pk"), output_field=CharField())
+    return queryset.filter(
+        reduce(or_, [Exists(g.filter(object_id=pk_as_text)) for g in grant_sets])
+    )
 
 
 def _request_perm_cache(request) -> dict:
@@ -90,7 +380,8 @@ def _request_perm_cache(request) -> dict:
 
     Performance:
     - We cache (content_type_id, object_id) -> set(perms) on the request.
-    - This prevents repeated DB hits in a single request when multiple checks happen.
+    - This prevents repeated cache/DB hits in a single request when multiple
+      checks happen; across requests the user's snapshot serves the lookup.
     """
 
     cache_obj = getattr(request, "_objperm_cache", None)
@@ -102,19 +393,22 @@ def _request_perm_cache(request) -> dict:
 
 def _get_cached_object_perms(*, request, obj: Model) -> set[str]:
     ct = ContentType.objects.get_for_model(obj, for_concrete_model=False)
-    key = (ct.pk, int(obj.pk))
+    key = (ct.pk, str(obj.pk))
     cache_obj = _request_perm_cache(request)
     cached = cache_obj.get(key)
     if cached is not None:
         return cached
 
-    perms = set(
-        UserObjectPermission.objects.filter(
-            user=request.user,
-            content_type=ct,
-            object_id=obj.pk,
-        ).values_list("perm_codename", flat=True)
-    )
+    snapshot = get_object_perm_snapshot(request.user, ct.pk)
+    if snapshot is not None:
+        perms = snapshot.perms_for(obj.pk)
+    else:
+        perms = set(
+            _union_values(
+                _grant_querysets(request.user, ct, object_id=str(obj.pk)),
+                "perm_codename",
+            )
+        )
     cache_obj[key] = perms
     return perms
 
@@ -130,3 +424,49 @@ def user_has_object_perms(
 
     perms = _get_cached_object_perms(request=request, obj=obj)
     return all(perm in perms for perm in required_perms)
+
+
+def prefetch_object_perms(*, request, objs: Iterable[Model]) -> None:
+    """
+    Load the user's perms on every object in `objs` into the request cache.
+
+    Use before rendering a page of objects with per-row permission flags
+    (`ObjectPermissionsField` does this automatically for list serializers).
+
+    Performance:
+    - One snapshot lookup per content type, or on a snapshot miss that cannot
+      be cached, one UNION query per content type — independent of page size.
+    - Later `user_has_object_perms` calls on these objects are dict lookups.
+    """
+
+    user = getattr(request, "user", None)
+    if not getattr(user, "is_authenticated", False) or is_platform_admin(user):
+        return
+
+    cache_obj = _request_perm_cache(request)
+    pending: dict[ContentType, list[str]] = {}
+    for obj in objs:
+        ct = ContentType.objects.get_for_model(obj, for_concrete_model=False)
+        object_id = str(obj.pk)
+        if (ct.pk, object_id) not in cache_obj:
+            pending.setdefault(ct, []).append(object_id)
+
+    for ct, object_ids in pending.items():
+        snapshot = get_object_perm_snapshot(user, ct.pk)
+        if snapshot is not None:
+            for object_id in object_ids:
+                cache_obj[(ct.pk, object_id)] = snapshot.perms_for(object_id)
+            continue
+
+        perms_by_id: dict[str, set[str]] = {
+            object_id: set() for object_id in object_ids
+        }
+        rows = _union_values(
+            _grant_querysets(user, ct, object_id__in=object_ids),
+            "object_id",
+            "perm_codename",
+        )
+        for object_id, perm in rows:
+            perms_by_id[object_id].add(perm)
+        for object_id, perms in perms_by_id.items():
+            cache_obj[(ct.pk, object_id)] = perms
@@ -1,12 +1,31 @@
-"""OTP generation, storage, verification, and email delivery."""
+"""
+OTP generation, storage, verification, and email delivery.
 
+OTP state lives behind an `OTPStore` chosen from the default cache:
+- `RedisOTPStore` (django-redis): every operation is one Lua script call, so
+  issuing (rate limit + set with TTL) and verifying (compare, attempt count,
+  delete, verification id) are atomic across workers and cost one round-trip;
+- `CacheOTPStore` (any other cache, e.g. LocMem in dev/tests): the same rules
+  through the Django cache API, serialized by a process lock. LocMem is
+  process-local, so multiple workers need Redis.
+
+A code allows `OTP_MAX_VERIFY_ATTEMPTS` wrong guesses before it is burned, and
+each email may request `OTP_RATE_LIMIT` codes per `OTP_RATE_WINDOW_SECONDS`.
+"""
+
+import hmac
+import json
 import logging
 import secrets
 import string
+import threading
+import time
+from abc import ABC, abstractmethod
 
 from django.conf import settings
 from django.core.cache import cache
 
+from apps.auth.services.revocation import redis_client
 from apps.notification.services.email_service import EmailService
 
 logger = logging.getLogger(__name__)
@@ -16,8 +35,13 @@ OTP_PURPOSE_REGISTER = "register"
 OTP_LENGTH = 6
 OTP_TTL_SECONDS = 600
 OTP_VERIFICATION_ID_TTL_SECONDS = 300
-OTP_CACHE_KEY_PREFIX = "otp"
-OTP_VERIFICATION_CACHE_KEY_PREFIX = "otp_verification"
+OTP_MAX_VERIFY_ATTEMPTS = 5
+OTP_RATE_LIMIT = 5
+OTP_RATE_WINDOW_SECONDS = 3600
+# v2: code + attempt counter per key (v1 stored the bare code).
+OTP_CACHE_KEY_PREFIX = "otp.v2"
+OTP_VERIFICATION_CACHE_KEY_PREFIX = "otp_verification.v2"
+OTP_RATE_CACHE_KEY_PREFIX = "otp_rate"
 
 
 def _cache_key(email: str, purpose: str) -> str:
@@ -25,70 +49,287 @@ def _cache_key(email: str, purpose: str) -> str:
     return f"{OTP_CACHE_KEY_PREFIX}:{purpose}:{email_clean}"
 
 
+def _rate_key(email: str) -> str:
+    return f"{OTP_RATE_CACHE_KEY_PREFIX}:{email.strip().lower()}"
+
+
+def _verification_key(verification_id: str) -> str:
+    return f"{OTP_VERIFICATION_CACHE_KEY_PREFIX}:{verification_id}"
+
+
+class OTPStore(ABC):
+    """Storage of OTP codes, request counters and verification ids."""
+
+    @abstractmethod
+    def issue(
+        self,
+        key: str,
+        rate_key: str,
+        otp: str,
+        ttl: int,
+        rate_limit: int,
+        rate_window: int,
+    ) -> bool:
+        """
+        Count a request for `rate_key` and, within the limit, replace the code
+        at `key`.
+        """
+
+    @abstractmethod
+    def verify(
+        self,
+        key: str,
+        otp: str,
+        max_attempts: int,
+        verification_key: str | None = None,
+        payload: dict | None = None,
+        verification_ttl: int = 0,
+    ) -> bool:
+        """
+        Consume the code at `key` if it matches `otp` (and store `payload` at
+        `verification_key`); otherwise count a failed attempt, burning the code
+        at `max_attempts`.
+        """
+
+    @abstractmethod
+    def get(self, key: str) -> str | None:
+        """The current code at `key`, if any."""
+
+    @abstractmethod
+    def consume(self, key: str) -> dict | None:
+        """Get and delete a verification payload."""
+
+
+class CacheOTPStore(OTPStore):
+    """Django cache API; atomic within one process only."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    def issue(self, key, rate_key, otp, ttl, rate_limit, rate_window):
+        with self._lock:
+            if cache.add(rate_key, 1, timeout=rate_window):
+                sent = 1
+            else:
+                try:
+                    sent = cache.incr(rate_key)
+                except ValueError:  # expired since `add`
+                    cache.set(rate_key, 1, timeout=rate_window)
+                    sent = 1
+            if sent > rate_limit:
+                return False
+            state = {"code": otp, "attempts": 0, "expires_at": time.time() + ttl}
+            cache.set(key, state, timeout=ttl)
+            return True
+
+    def verify(
+        self,
+        key,
+        otp,
+        max_attempts,
+        verification_key=None,
+        payload=None,
+        verification_ttl=0,
+    ):
+        with self._lock:
+            state = cache.get(key)
+            if state is None:
+                return False
+            if hmac.compare_digest(str(state["code"]).encode(), otp.encode()):
+                cache.delete(key)
+                if verification_key:
+                    cache.set(verification_key, payload, timeout=verification_ttl)
+                return True
+            state["attempts"] += 1
+            remaining = int(state["expires_at"] - time.time())
+            if state["attempts"] >= max_attempts or remaining <= 0:
+                cache.delete(key)
+            else:
+                cache.set(key, state, timeout=remaining)
+            return False
+
+    def get(self, key):
+        state = cache.get(key)
+        return state["code"] if state else None
+
+    def consume(self, key):
+        with self._lock:
+            payload = cache.get(key)
+            if payload is not None:
+                cache.delete(key)
+            return payload
+
+
+# KEYS: code hash, request counter. ARGV: otp, ttl, rate limit, rate window.
+_ISSUE_SCRIPT = """
+local sent = redis.call('INCR', KEYS[2])
+if sent == 1 then redis.call('EXPIRE', KEYS[2], ARGV[4]) end
+if sent > tonumber(ARGV[3]) then return 0 end
+redis.call('DEL', KEYS[1])
+redis.call('HSET', KEYS[1], 'code', ARGV[1], 'attempts', 0)
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+# KEYS: code hash[, verification key]. ARGV: otp, max attempts[, payload, ttl].
+_VERIFY_SCRIPT = """
+local code = redis.call('HGET', KEYS[1], 'code')
+if not code then return 0 end
+if code == ARGV[1] then
+  redis.call('DEL', KEYS[1])
+  if KEYS[2] then redis.call('SET', KEYS[2], ARGV[3], 'EX', ARGV[4]) end
+  return 1
+end
+if redis.call('HINCRBY', KEYS[1], 'attempts', 1) >= tonumber(ARGV[2]) then
+  redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+# GETDEL for servers older than Redis 6.2.
+_CONSUME_SCRIPT = """
+local value = redis.call('GET', KEYS[1])
+if value then redis.call('DEL', KEYS[1]) end
+return value
+"""
+
+
+class RedisOTPStore(OTPStore):
+    """
+    One `EVALSHA` per operation on the Redis client behind the default cache.
+
+    Keys carry the cache `KEY_PREFIX`. Redis errors are logged and read as
+    "not stored" / "not verified", like the cache's `IGNORE_EXCEPTIONS`.
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self._issue = client.register_script(_ISSUE_SCRIPT)
+        self._verify = client.register_script(_VERIFY_SCRIPT)
+        self._consume = client.register_script(_CONSUME_SCRIPT)
+
+    def issue(self, key, rate_key, otp, ttl, rate_limit, rate_window):
+        try:
+            return bool(
+                self._issue(
+                    keys=[cache.make_key(key), cache.make_key(rate_key)],
+                    args=[otp, ttl, rate_limit, rate_window],
+                )
+            )
+        except Exception as exc:  # pragma: no cover - dependent on external service
+            logger.error("Could not store OTP: %s", exc)
+            return False
+
+    def verify(
+        self,
+        key,
+        otp,
+        max_attempts,
+        verification_key=None,
+        payload=None,
+        verification_ttl=0,
+    ):
+        keys, args = [cache.make_key(key)], [otp, max_attempts]
+        if verification_key:
+            keys.append(cache.make_key(verification_key))
+            args += [json.dumps(payload), verification_ttl]
+        try:
+            return bool(self._verify(keys=keys, args=args))
+        except Exception as exc:  # pragma: no cover - dependent on external service
+            logger.error("Could not verify OTP: %s", exc)
+            return False
+
+    def get(self, key):
+        try:
+            code = self.client.hget(cache.make_key(key), "code")
+        except Exception as exc:  # pragma: no cover - dependent on external service
+            logger.error("Could not read OTP: %s", exc)
+            return None
+        return code.decode() if code is not None else None
+
+    def consume(self, key):
+        try:
+            value = self._consume(keys=[cache.make_key(key)])
+        except Exception as exc:  # pragma: no cover - dependent on external service
+            logger.error("Could not consume OTP verification: %s", exc)
+            return None
+        return json.loads(value) if value is not None else None
+
+
+_cache_store = CacheOTPStore()
+_redis_store: RedisOTPStore | None = None
+
+
+def get_otp_store() -> OTPStore:
+    """Redis store when the default cache is django-redis, else the cache store."""
+    global _redis_store
+    client = redis_client()
+    if client is None:
+        return _cache_store
+    if _redis_store is None or _redis_store.client is not client:
+        _redis_store = RedisOTPStore(client)
+    return _redis_store
+
+
 def generate_otp(length: int = OTP_LENGTH) -> str:
     """Generate a numeric OTP."""
     return "".join(secrets.choice(string.digits) for _ in range(length))
 
 
-def store_otp(email: str, otp: str, purpose: str, ttl: int = OTP_TTL_SECONDS) -> None:
-    """Store OTP in cache. Requires a shared cache (e.g. Redis) when using multiple processes."""
-    key = _cache_key(email, purpose)
-    cache.set(key, otp, timeout=ttl)
-    stored = cache.get(key)
-    if stored is None:
-        logger.warning(
-            "OTP cache set did not persist (key=%s). "
-            "Ensure Redis is running and REDIS_URL is set, or use a single process; "
-            "LocMemCache is process-local and will not work with multiple workers.",
-            key,
-        )
+def store_otp(email: str, otp: str, purpose: str, ttl: int = OTP_TTL_SECONDS) -> bool:
+    """Store OTP, replacing any previous one. False when the email is over its request limit."""
+    return get_otp_store().issue(
+        _cache_key(email, purpose),
+        _rate_key(email),
+        str(otp),
+        ttl,
+        getattr(settings, "OTP_RATE_LIMIT", OTP_RATE_LIMIT),
+        getattr(settings, "OTP_RATE_WINDOW_SECONDS", OTP_RATE_WINDOW_SECONDS),
+    )
 
 
 def get_otp(email: str, purpose: str) -> str | None:
     """Retrieve OTP from cache."""
-    key = _cache_key(email, purpose)
-    return cache.get(key)
+    return get_otp_store().get(_cache_key(email, purpose))
+
+
+def _max_attempts() -> int:
+    return getattr(settings, "OTP_MAX_VERIFY_ATTEMPTS", OTP_MAX_VERIFY_ATTEMPTS)
 
 
 def verify_and_consume_otp(email: str, otp: str, purpose: str) -> bool:
-    """Verify OTP and delete it from cache (one-time use)."""
-    key = _cache_key(email, purpose)
-    stored = cache.get(key)
-    if stored is None:
-        return False
-    if str(stored) != str(otp).strip():
-        return False
-    cache.delete(key)
-    return True
+    """Verify OTP and delete it (one-time use); wrong guesses count towards the attempt limit."""
+    return get_otp_store().verify(
+        _cache_key(email, purpose), str(otp).strip(), _max_attempts()
+    )
 
 
 def verify_otp_and_issue_verification_id(
     email: str, otp: str, purpose: str, ttl: int = OTP_VERIFICATION_ID_TTL_SECONDS
 ) -> str | None:
     """Verify OTP, consume it, store a verification id in cache, return the id or None."""
-    if not verify_and_consume_otp(email, otp, purpose):
-        return None
     verification_id = secrets.token_urlsafe(32)
-    key = f"{OTP_VERIFICATION_CACHE_KEY_PREFIX}:{verification_id}"
     payload = {"email": email.strip().lower(), "purpose": purpose}
-    cache.set(key, payload, timeout=ttl)
-    return verification_id
+    verified = get_otp_store().verify(
+        _cache_key(email, purpose),
+        str(otp).strip(),
+        _max_attempts(),
+        verification_key=_verification_key(verification_id),
+        payload=payload,
+        verification_ttl=ttl,
+    )
+    return verification_id if verified else None
 
 
 def consume_verification_id(verification_id: str) -> dict | None:
     """Get and delete verification payload from cache (one-time use). Return None if invalid."""
     if not (verification_id and verification_id.strip()):
         return None
-    key = f"{OTP_VERIFICATION_CACHE_KEY_PREFIX}:{verification_id.strip()}"
-    payload = cache.get(key)
-    if payload is None:
-        return None
-    cache.delete(key)
-    return payload
+    return get_otp_store().consume(_verification_key(verification_id.strip()))
 
 
-def send_otp_email(email: str, otp: str, purpose: str, async_send: bool | None = None) -> bool:
-    """Send OTP via email. Uses EmailService with async delivery by default."""
+def send_otp_email(
+    email: str, otp: str, purpose: str, async_send: bool | None = None
+) -> bool:
+    """Send OTP via email. Uses EmailService with outbox delivery by default."""
     if async_send is None:
         async_send = getattr(settings, "OTP_EMAIL_ASYNC_SEND", True)
     return EmailService.send_otp_email(
@@ -0,0 +1,109 @@
+"""
+Password hashing on a bounded, process-wide worker pool.
+
+Argon2 costs tens of milliseconds of CPU per check by design. Run inline, a
+burst of logins takes every request thread (and under ASGI, one thread per
+request) and starves all other traffic of CPU. Here it runs on
+`AUTH_PASSWORD_WORKERS` threads instead; argon2-cffi releases the GIL while
+hashing, so the threads use separate cores. At most `AUTH_PASSWORD_QUEUE_DEPTH`
+more checks wait for a free worker. Past that a check fails at once with
+`PasswordVerificationBusy` (HTTP 429 on the login API) rather than queueing
+behind work its client will have given up on.
+
+`PooledModelBackend` (apps/auth/backends.py) sends every `authenticate()`
+through here. The async helpers await the same pool without holding a thread,
+and without running the hash on the event loop as Django's `acheck_password`
+does.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth import hashers
+
+PASSWORD_QUEUE_DEPTH = 4
+# `Retry-After` for refused checks: roughly the time to drain a full queue.
+BUSY_RETRY_AFTER_SECONDS = 1
+
+
+class PasswordVerificationBusy(Exception):
+    """Every worker is busy and the queue is full."""
+
+    def __init__(self, retry_after: float = BUSY_RETRY_AFTER_SECONDS):
+        super().__init__("Password verification queue is full")
+        self.retry_after = retry_after
+
+
+class PasswordHashPool:
+    def __init__(self, workers: int, queue_depth: int):
+        self.workers = max(1, workers)
+        self.queue_depth = max(0, queue_depth)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="password-hash"
+        )
+        # One slot per running or queued call.
+        self._slots = threading.BoundedSemaphore(self.workers + self.queue_depth)
+
+    def submit(self, fn, *args) -> Future:
+        if not self._slots.acquire(blocking=False):
+            raise PasswordVerificationBusy()
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def run(self, fn, *args):
+        return self.submit(fn, *args).result()
+
+    async def arun(self, fn, *args):
+        return await asyncio.wrap_future(self.submit(fn, *args))
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+_pool: PasswordHashPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_password_pool() -> PasswordHashPool:
+    """The process-wide pool, sized by `AUTH_PASSWORD_WORKERS`."""
+
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = PasswordHashPool(
+                workers=getattr(settings, "AUTH_PASSWORD_WORKERS", None)
+                or os.cpu_count()
+                or 1,
+                queue_depth=getattr(
+                    settings, "AUTH_PASSWORD_QUEUE_DEPTH", PASSWORD_QUEUE_DEPTH
+                ),
+            )
+        return _pool
+
+
+def verify_password(password: str, encoded: str) -> tuple[bool, bool]:
+    """`(is_correct, must_update)` for `encoded`, computed on the pool."""
+
+    return get_password_pool().run(hashers.verify_password, password, encoded)
+
+
+def make_password(password: str | None) -> str:
+    return get_password_pool().run(hashers.make_password, password)
+
+
+async def averify_password(password: str, encoded: str) -> tuple[bool, bool]:
+    return await get_password_pool().arun(hashers.verify_password, password, encoded)
+
+
+async def amake_password(password: str | None) -> str:
+    return await get_password_pool().arun(hashers.make_password, password)
@@ -0,0 +1,154 @@
+"""
+Deactivation bitmap for claim-built (stateless) JWT users.
+
+When `JWT_TOKEN_USER_ENABLED` is on, `HatchupJWTAuthentication` no longer runs
+`User.objects.get(..., is_active=True)` per request, so deactivated or deleted
+users are tracked here instead and rejected on their next request.
+
+Storage:
+- Redis: a single bitmap keyed by user id (`SETBIT`/`GETBIT`), ~1 bit per user.
+  Bit 0 (no user has id 0) is set by `rebuild_revocations`: a bitmap lost to
+  a flush or eviction, or recreated by a lone `SETBIT`, reads as unknown
+  rather than "nobody is revoked" until `sync_user_revocations` runs again.
+- Any other cache backend (LocMem in dev/tests): one key per user holding its
+  state; a missing (never written or culled) key reads as unknown.
+
+Unknown answers send authentication back to the database, so losing the
+store costs queries, never a deactivated user's access.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Iterable
+
+from django.core.cache import cache
+from django_redis import get_redis_connection
+
+logger = logging.getLogger(__name__)
+
+REVOCATION_BITMAP_KEY = "auth.revoked_users.v1"
+# Redis bit offsets are limited to 2**32 - 1.
+MAX_BITMAP_USER_ID = 2**32 - 1
+# Set once the bitmap holds the full state; user ids start at 1.
+BITMAP_BUILT_OFFSET = 0
+
+
+def redis_client():
+    """Raw Redis client behind the default cache, or None for other backends."""
+    try:
+        return get_redis_connection("default")
+    except NotImplementedError:
+        return None
+
+
+def _user_key(user_id: int) -> str:
+    return f"{REVOCATION_BITMAP_KEY}.user:{user_id}"
+
+
+def _offset(user_id) -> int | None:
+    try:
+        offset = int(user_id)
+    except (TypeError, ValueError):
+        return None
+    if offset <= BITMAP_BUILT_OFFSET or offset > MAX_BITMAP_USER_ID:
+        return None
+    return offset
+
+
+def set_user_revoked(user_id: int, revoked: bool = True) -> None:
+    """
+    Flip the revocation bit for `user_id`.
+
+    Callers run this once the account change has committed (see
+    `apps/auth/signals.py`), so it cannot roll the change back. Instead, a
+    revocation that cannot be recorded drops what the store knows (the built
+    marker on Redis, the user's key elsewhere): lookups then read unknown
+    and go to the database until `sync_user_revocations` runs. A failed
+    un-revoke only logs: the user stays rejected, never let in.
+    """
+
+    offset = _offset(user_id)
+    if offset is None:
+        return
+
+    try:
+        client = redis_client()
+        if client is not None:
+            client.setbit(cache.make_key(REVOCATION_BITMAP_KEY), offset, int(revoked))
+        else:
+            cache.set(_user_key(offset), bool(revoked), timeout=None)
+    except Exception as exc:  # pragma: no cover - dependent on external service
+        logger.error("Could not update revocation bit for user %s: %s", user_id, exc)
+        if revoked:
+            _forget_revocation_state(offset)
+
+
+def _forget_revocation_state(offset: int) -> None:
+    try:
+        client = redis_client()
+        if client is not None:
+            client.setbit(cache.make_key(REVOCATION_BITMAP_KEY), BITMAP_BUILT_OFFSET, 0)
+        else:
+            cache.delete(_user_key(offset))
+    except Exception as exc:  # pragma: no cover - dependent on external service
+        # Lookups against an unreachable store read unknown as well.
+        logger.error("Could not invalidate the revocation state: %s", exc)
+
+
+def is_user_revoked(user_id) -> bool | None:
+    """
+    Return whether `user_id` is revoked.
+
+    Returns None when the answer is unknown (store unreachable or lost, id
+    out of bitmap range) so callers can fall back to the database.
+    """
+
+    offset = _offset(user_id)
+    if offset is None:
+        return None
+
+    try:
+        client = redis_client()
+        if client is None:
+            return cache.get(_user_key(offset))
+        built, revoked = (
+            client.bitfield(cache.make_key(REVOCATION_BITMAP_KEY))
+            .get("u1", BITMAP_BUILT_OFFSET)
+            .get("u1", offset)
+            .execute()
+        )
+        return bool(revoked) if built else None
+    except Exception as exc:  # pragma: no cover - dependent on external service
+        logger.warning("Revocation lookup failed for user %s: %s", user_id, exc)
+        return None
+
+
+def rebuild_revocations(revoked_user_ids: Iterable[int]) -> int:
+    """
+    Replace the revocation state with exactly `revoked_user_ids`.
+
+    On Redis the new bitmap, built marker included, is written to a scratch
+    key and swapped in with RENAME, so readers never observe a half-built
+    bitmap. Other backends cannot enumerate keys, so only the revoked ids are
+    (re)written; other users stay unknown until their next save.
+    Returns the number of revoked users written.
+    """
+
+    offsets = [o for o in (_offset(uid) for uid in revoked_user_ids) if o is not None]
+    client = redis_client()
+    if client is None:
+        for offset in offsets:
+            cache.set(_user_key(offset), True, timeout=None)
+        return len(offsets)
+
+    key = cache.make_key(REVOCATION_BITMAP_KEY)
+    scratch_key = f"{key}:rebuild"
+    pipe = client.pipeline()
+    pipe.delete(scratch_key)
+    pipe.setbit(scratch_key, BITMAP_BUILT_OFFSET, 1)
+    for offset in offsets:
+        pipe.setbit(scratch_key, offset, 1)
+    pipe.rename(scratch_key, key)
+    pipe.execute()
+    return len(offsets)
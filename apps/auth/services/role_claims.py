@@ -0,0 +1,185 @@
+"""
+Trusted `roles` claims in JWTs, with a role-change list for downgrades.
+
+Tokens carry `roles` plus `roles_at` (when those roles were read). With
+`JWT_TRUST_ROLE_CLAIMS` on, `HatchupJWTAuthentication` exposes the claim as
+`user.token_roles` and `get_user_roles` answers from it, so role gates do no
+I/O. A claim is *not* trusted when:
+- the user's roles changed at or after `roles_at` (role-change list below),
+- `roles_at` predates the list's `since` marker, i.e. changes made before the
+  claim was issued may be missing from it, or
+- `roles_at` is older than the refresh token lifetime. Refresh tokens rotate
+  and carry their claims forward, so age is bounded explicitly; the list only
+  needs to remember changes for that long.
+
+Storage of the role-change list (`user_id -> changed_at`, plus `since`):
+- Redis: one hash (`HSET` per change, atomic across writers).
+- Any other cache backend (LocMem in dev/tests): one dict value, updated under
+  a process lock (LocMem is per process, so that makes it atomic).
+`since` is stored inside the list, so a flush or eviction drops both and every
+existing claim is distrusted; the next issued token restarts the list at its
+`roles_at`. Each process mirrors the list in memory and reloads only when the
+role generation (`auth.services.roles`) moves, which every role change bumps.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Dict, Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework_simplejwt.settings import api_settings as jwt_api_settings
+
+from apps.auth.services.revocation import redis_client
+from apps.auth.services.roles import current_role_generation
+
+logger = logging.getLogger(__name__)
+
+ROLE_CHANGES_KEY = "auth.role_changes.v1"
+# Field of the list holding when it started being complete.
+_SINCE_FIELD = "since"
+
+_mirror_lock = threading.Lock()
+_mirror: dict = {"generation": None, "since": None, "changes": {}}
+_changes_lock = threading.Lock()
+
+
+def _max_claim_age() -> float:
+    return jwt_api_settings.REFRESH_TOKEN_LIFETIME.total_seconds()
+
+
+def add_role_claims(token, role_names: Iterable[str], roles_at: float) -> None:
+    """`roles_at` must be taken before `role_names` are read."""
+
+    if getattr(settings, "JWT_TRUST_ROLE_CLAIMS", False):
+        tracked = _role_changes()
+        if tracked is not None and tracked[0] is None:
+            _start_role_changes(roles_at)
+    token["roles"] = list(role_names)
+    token["roles_at"] = roles_at
+
+
+def _start_role_changes(since: float) -> None:
+    """Mark the list complete from `since` on, unless it already is."""
+
+    try:
+        client = redis_client()
+        if client is not None:
+            client.hsetnx(cache.make_key(ROLE_CHANGES_KEY), _SINCE_FIELD, repr(since))
+            return
+        with _changes_lock:
+            stored = cache.get(ROLE_CHANGES_KEY) or {}
+            if _SINCE_FIELD not in stored:
+                stored = {**stored, _SINCE_FIELD: since}
+                cache.set(ROLE_CHANGES_KEY, stored, timeout=None)
+    except Exception as exc:  # pragma: no cover - dependent on external service
+        logger.error("Could not start the role-change list: %s", exc)
+
+
+def _load_role_changes() -> tuple[float | None, Dict[int, float]]:
+    client = redis_client()
+    if client is None:
+        stored = dict(cache.get(ROLE_CHANGES_KEY) or {})
+    else:
+        stored = {
+            field.decode() if isinstance(field, bytes) else field: value
+            for field, value in client.hgetall(cache.make_key(ROLE_CHANGES_KEY)).items()
+        }
+    since = stored.pop(_SINCE_FIELD, None)
+    changes = {int(user_id): float(at) for user_id, at in stored.items()}
+    return (None if since is None else float(since)), changes
+
+
+def record_role_change(user_id: int) -> None:
+    """
+    Distrust `user_id`'s existing role claims, once the transaction commits.
+
+    Recording at commit time (not before) guarantees any token whose roles were
+    read before the change has `roles_at` < `changed_at`.
+    """
+
+    def _record() -> None:
+        now = time.time()
+        cutoff = now - _max_claim_age()
+        try:
+            client = redis_client()
+            if client is None:
+                with _changes_lock:
+                    changes = {
+                        uid: at
+                        for uid, at in (cache.get(ROLE_CHANGES_KEY) or {}).items()
+                        if uid == _SINCE_FIELD or at >= cutoff
+                    }
+                    changes[int(user_id)] = now
+                    cache.set(ROLE_CHANGES_KEY, changes, timeout=None)
+                return
+            key = cache.make_key(ROLE_CHANGES_KEY)
+            client.hset(key, str(user_id), repr(now))
+            stale = [
+                uid
+                for uid, at in client.hgetall(key).items()
+                if uid not in (_SINCE_FIELD, _SINCE_FIELD.encode())
+                and float(at) < cutoff
+            ]
+            if stale:
+                client.hdel(key, *stale)
+        except Exception as exc:  # pragma: no cover - dependent on external service
+            logger.error("Could not record role change for user %s: %s", user_id, exc)
+
+    transaction.on_commit(_record)
+
+
+def _role_changes() -> tuple[float | None, Dict[int, float]] | None:
+    """`(since, changes)`, `since` None when the list was lost; None on errors."""
+
+    generation = current_role_generation()
+    with _mirror_lock:
+        if _mirror["generation"] == generation:
+            return _mirror["since"], _mirror["changes"]
+    try:
+        since, changes = _load_role_changes()
+    except Exception as exc:  # pragma: no cover - dependent on external service
+        logger.warning("Role-change list unavailable: %s", exc)
+        return None
+    if since is not None:
+        # A lost list is re-read until a token restarts it.
+        with _mirror_lock:
+            _mirror.update(generation=generation, since=since, changes=changes)
+    return since, changes
+
+
+def trusted_role_claims(payload: dict) -> frozenset[str] | None:
+    """
+    Return the token's roles if they may be used for authorization, else None
+    (callers then resolve roles from cache/DB as usual).
+    """
+
+    if not getattr(settings, "JWT_TRUST_ROLE_CLAIMS", False):
+        return None
+    roles = payload.get("roles")
+    roles_at = payload.get("roles_at")
+    user_id = payload.get(jwt_api_settings.USER_ID_CLAIM)
+    if roles is None or user_id is None or not isinstance(roles_at, (int, float)):
+        return None
+    if time.time() - roles_at > _max_claim_age():
+        return None
+
+    tracked = _role_changes()
+    if tracked is None:
+        return None
+    since, changes = tracked
+    # Lost (flushed/evicted) or started after this claim: changes made before
+    # it may be missing, so it cannot be vouched for.
+    if since is None or roles_at < since:
+        return None
+    try:
+        changed_at = changes.get(int(user_id))
+    except (TypeError, ValueError):
+        return None
+    if changed_at is not None and changed_at >= roles_at:
+        return None
+    return frozenset(roles)
@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+import threading
+import time
 from dataclasses import dataclass
 from typing import Iterable
 
+from django.conf import settings
 from django.contrib.auth.models import Group, Permission
 from django.core.cache import cache
+from django.db import transaction
 
-ROLE_CACHE_TTL_SECONDS = 60
+from apps.common.utils.common_cache_utils import LocalLRUCache
+
+# Upper bound on how long an entry lives; freshness comes from the generation.
+ROLE_CACHE_TTL_SECONDS = 60 * 60
+ROLE_GENERATION_KEY = "auth.roles.v2.generation"
 
 
 @dataclass(frozen=True)
@@ -49,7 +57,48 @@ def ensure_roles_exist(specs: Iterable[RoleBootstrapSpec]) -> dict[str, Group]:
 
 
 def _role_cache_key(user_id: int) -> str:
-    return f"auth.roles.v1.user:{user_id}"
+    return f"auth.roles.v2.user:{user_id}"
+
+
+class _RoleGeneration:
+    """
+    This process' view of the global role generation counter.
+
+    The shared counter is re-read at most every `AUTH_ROLE_CACHE_CHECK_SECONDS`,
+    so steady-state role lookups cost no network round-trip at all.
+    """
+
+    def __init__(self) -> None:
+        self._value = None
+        self._checked_at = float("-inf")
+        self._lock = threading.Lock()
+
+    def current(self):
+        now = time.monotonic()
+        interval = getattr(settings, "AUTH_ROLE_CACHE_CHECK_SECONDS", 1.0)
+        with self._lock:
+            if self._value is not None and now - self._checked_at < interval:
+                return self._value
+        value = cache.get(ROLE_GENERATION_KEY)
+        if value is None:
+            # Fresh, never-reused seed (see object-permission snapshots).
+            value = time.time_ns()
+            if not cache.add(ROLE_GENERATION_KEY, value, timeout=None):
+                value = cache.get(ROLE_GENERATION_KEY, value)
+        with self._lock:
+            self._value, self._checked_at = value, now
+        return value
+
+    def expire(self) -> None:
+        with self._lock:
+            self._checked_at = float("-inf")
+
+
+_role_generation = _RoleGeneration()
+_local_roles = LocalLRUCache(
+    maxsize=getattr(settings, "AUTH_ROLE_CACHE_LOCAL_MAXSIZE", 4096),
+    ttl=ROLE_CACHE_TTL_SECONDS,
+)
 
 
 def get_user_roles(user) -> set[str]:
@@ -57,26 +106,74 @@ def get_user_roles(user) -> set[str]:
     Return roles as a set[str] of Django Group names.
 
     Performance:
-    - Uses caching because this is frequently called by DRF permission classes.
-    - Cache TTL is short to avoid stale authZ; invalidate by deleting the key when
-      changing user.groups in admin or via service calls.
+    - Called by DRF permission classes on every request, so lookups are served
+      from a per-process map keyed by user id and tagged with the global role
+      generation; the shared cache and then the DB are only hit after a role
+      change (or on a cold process).
+    - Role writes bump the generation on commit (`bump_role_generation`), which
+      every process notices within `AUTH_ROLE_CACHE_CHECK_SECONDS`.
     """
 
     if not getattr(user, "is_authenticated", False):
         return set()
 
+    # Trusted JWT `roles` claim (`auth.services.role_claims`): no I/O at all.
+    token_roles = getattr(user, "token_roles", None)
+    if token_roles is not None:
+        return set(token_roles)
+
+    generation = _role_generation.current()
+    local_entry = _local_roles.get(user.id)
+    if local_entry is not None and local_entry[0] == generation:
+        return set(local_entry[1])
+
     key = _role_cache_key(user.id)
-    cached = cache.get(key)
-    if cached is not None:
-        return set(cached)
+    shared_entry = cache.get(key)
+    if shared_entry is not None and shared_entry[0] == generation:
+        role_names = frozenset(shared_entry[1])
+    else:
+        role_names = frozenset(user.roles.values_list("name", flat=True))
+        cache.set(key, (generation, role_names), timeout=ROLE_CACHE_TTL_SECONDS)
+    _local_roles.set(user.id, (generation, role_names))
+    return set(role_names)
+
+
+def current_role_generation():
+    """This process' (at most `AUTH_ROLE_CACHE_CHECK_SECONDS` old) generation."""
+
+    return _role_generation.current()
+
+
+def bump_role_generation() -> None:
+    """
+    Invalidate every cached role set, in every process, once the current
+    transaction commits (so nobody re-caches rows that may still roll back).
+    """
+
+    def _bump() -> None:
+        try:
+            cache.incr(ROLE_GENERATION_KEY)
+        except ValueError:
+            # Counter evicted: readers re-seed it with a fresh value.
+            pass
+        _role_generation.expire()
+
+    transaction.on_commit(_bump)
+
+
+def reset_role_cache() -> None:
+    """
+    Forget this process' cached role sets and re-read the generation on the
+    next lookup (e.g. after `cache.clear()` in tests).
+    """
 
-    role_names = set(user.groups.values_list("name", flat=True))
-    cache.set(key, list(role_names), timeout=ROLE_CACHE_TTL_SECONDS)
-    return role_names
+    _local_roles.clear()
+    _role_generation.expire()
 
 
 def invalidate_user_roles_cache(user_id: int) -> None:
-    cache.delete(_role_cache_key(user_id))
+    # The generation is global: one bump covers `user_id` in every process.
+    bump_role_generation()
 
 
 def is_platform_admin(user) -> bool:
@@ -0,0 +1,143 @@
+"""
+Two-tier cache for the User objects resolved by `HatchupJWTAuthentication`.
+
+Tier 1 is a per-process LRU (no network hop, bounded, short TTL); tier 2 is the
+shared `default` cache (Redis). Entries are stored as `(version, user)` where
+`version` is the user's `updated_at`, so a request that read the row *before*
+a concurrent save cannot overwrite the newer state.
+
+Invalidation is push-based from signals (`apps/auth/signals.py`) on `User` save/
+delete and on `UserRole` changes (roles are prefetched onto cached users).
+Other processes' tier-1 entries expire after `AUTH_USER_CACHE_LOCAL_TTL_SECONDS`.
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+from typing import Any, Dict
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+
+from apps.common.utils.common_cache_utils import LocalLRUCache
+
+User = get_user_model()
+
+USER_CACHE_KEY_PREFIX = "auth.user.v1"
+
+
+def _setting(name: str, default):
+    return getattr(settings, name, default)
+
+
+_local_cache = LocalLRUCache(
+    maxsize=_setting("AUTH_USER_CACHE_LOCAL_MAXSIZE", 1024),
+    ttl=_setting("AUTH_USER_CACHE_LOCAL_TTL_SECONDS", 5),
+)
+_shared_stats = {"hits": 0, "misses": 0, "stale_writes_skipped": 0}
+_shared_stats_lock = threading.Lock()
+
+
+def _bump(stat: str) -> None:
+    with _shared_stats_lock:
+        _shared_stats[stat] += 1
+
+
+def _user_cache_key(user_id: int) -> str:
+    return f"{USER_CACHE_KEY_PREFIX}:{user_id}"
+
+
+def _version(user) -> float:
+    updated_at = getattr(user, "updated_at", None)
+    return updated_at.timestamp() if updated_at else 0.0
+
+
+def _usable_copy(user) -> Any | None:
+    # Cached instances are shared across requests/threads; hand out copies so
+    # per-request mutations never leak into the cache.
+    if not (user.is_active and not user.is_deleted):
+        return None
+    return copy.copy(user)
+
+
+def get_cached_user(user_id) -> Any | None:
+    """
+    Return the active User for `user_id` (with `roles` prefetched), or None.
+
+    Lookup order: process LRU -> shared cache -> database.
+    """
+
+    try:
+        user_id = User._meta.pk.to_python(user_id)
+    except ValidationError:
+        return None
+    if user_id is None:
+        return None
+
+    if not _setting("AUTH_USER_CACHE_ENABLED", True):
+        return (
+            User.objects.filter(id=user_id, is_active=True)
+            .prefetch_related("roles")
+            .first()
+        )
+
+    local_entry = _local_cache.get(user_id)
+    if local_entry is not None:
+        return _usable_copy(local_entry[1])
+
+    key = _user_cache_key(user_id)
+    shared_entry = cache.get(key)
+    if shared_entry is not None and shared_entry[1] is not None:
+        _bump("hits")
+        _local_cache.set(user_id, shared_entry)
+        return _usable_copy(shared_entry[1])
+    _bump("misses")
+
+    user = User.objects.filter(id=user_id).prefetch_related("roles").first()
+    if user is None:
+        return None
+
+    entry = (_version(user), user)
+    # `shared_entry` may be a version floor left by `invalidate_cached_user`;
+    # never replace it with a row we read before that save committed.
+    if shared_entry is not None and shared_entry[0] > entry[0]:
+        _bump("stale_writes_skipped")
+    else:
+        cache.set(key, entry, timeout=_setting("AUTH_USER_CACHE_TTL_SECONDS", 300))
+        _local_cache.set(user_id, entry)
+
+    return _usable_copy(user)
+
+
+def invalidate_cached_user(user_id: int, *, version_floor: float | None = None) -> None:
+    """
+    Drop `user_id` from both tiers.
+
+    With `version_floor` (the saved row's `updated_at`), a marker is left in the
+    shared cache so in-flight lookups holding an older row do not re-cache it.
+    """
+
+    _local_cache.delete(user_id)
+    key = _user_cache_key(user_id)
+    if version_floor is None:
+        cache.delete(key)
+    else:
+        cache.set(
+            key,
+            (version_floor, None),
+            timeout=_setting("AUTH_USER_CACHE_TTL_SECONDS", 300),
+        )
+
+
+def user_cache_stats() -> Dict[str, Any]:
+    """Hit/miss/eviction counters for this process (both tiers)."""
+
+    with _shared_stats_lock:
+        shared = dict(_shared_stats)
+    return {
+        "local": {**_local_cache.stats.to_dict(), "size": len(_local_cache)},
+        "shared": shared,
+    }
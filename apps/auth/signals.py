@@ -2,14 +2,29 @@ from __future__ import annotations
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db.models.signals import m2m_changed, post_migrate
+from django.contrib.auth.models import Group
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_migrate, post_save
 from django.dispatch import receiver
 
+from apps.auth.models.object_permission_models import (
+    GroupObjectPermission,
+    UserObjectPermission,
+)
+from apps.auth.services.object_permission_snapshots import (
+    invalidate_group_object_perm_snapshots,
+    invalidate_object_perm_snapshots,
+)
+from apps.auth.services.revocation import set_user_revoked
+from apps.auth.services.role_claims import record_role_change
 from apps.auth.services.roles import (
     RoleBootstrapSpec,
+    bump_role_generation,
     ensure_roles_exist,
     invalidate_user_roles_cache,
 )
+from apps.auth.services.user_cache import invalidate_cached_user
+from apps.users.models.users_role_models import UserRole
 
 User = get_user_model()
 
@@ -52,7 +67,82 @@ def bootstrap_roles(sender, **kwargs) -> None:
         ensure_roles_exist(specs=specs)
 
 
-@receiver(m2m_changed, sender=User.groups.through)
-def invalidate_roles_cache_on_group_change(sender, instance: User, **kwargs) -> None:
+def _invalidate_user_role_caches(user_id: int) -> None:
+    # Recorded before the generation bump (both on commit) so processes that
+    # reload on the bump see the change; distrusts older JWT role claims.
+    record_role_change(user_id)
+    invalidate_user_roles_cache(user_id)
+    # Cached users carry prefetched `roles`.
+    invalidate_cached_user(user_id)
+    # Object-permission snapshots include the grants of the user's roles.
+    invalidate_object_perm_snapshots([user_id])
+
+
+@receiver(m2m_changed, sender=User.roles.through)
+def invalidate_roles_cache_on_group_change(
+    sender, instance, action: str, reverse: bool, pk_set, **kwargs
+) -> None:
     # Keep `auth.services.roles.get_user_roles()` cache fresh when roles change.
-    invalidate_user_roles_cache(instance.id)
+    if not reverse:
+        _invalidate_user_role_caches(instance.id)
+        return
+    # Reverse side (`group.user_set.add(...)`): `instance` is the Group.
+    if action == "pre_clear":
+        pk_set = set(instance.user_set.values_list("id", flat=True))
+    for user_id in pk_set or ():
+        _invalidate_user_role_caches(user_id)
+
+
+@receiver(post_save, sender=UserRole)
+@receiver(post_delete, sender=UserRole)
+def invalidate_roles_cache_on_user_role_change(
+    sender, instance: UserRole, **kwargs
+) -> None:
+    # Direct UserRole writes (admin inline, bulk tooling) bypass m2m_changed.
+    _invalidate_user_role_caches(instance.user_id)
+
+
+@receiver(post_save, sender=Group)
+@receiver(post_delete, sender=Group)
+@receiver(m2m_changed, sender=Group.permissions.through)
+def bump_role_generation_on_group_change(sender, **kwargs) -> None:
+    # Renames/deletes change the role names cached per user; permission edits
+    # change what a role grants. Both are rare, admin-driven writes.
+    bump_role_generation()
+
+
+@receiver(post_save, sender=User)
+def sync_revocation_on_user_save(sender, instance: User, **kwargs) -> None:
+    # Claim-built JWT users skip the per-request `is_active` query; mirror the
+    # account state into the revocation bitmap instead, once it has committed
+    # (a rolled-back reactivation must not un-revoke the user).
+    user_id, revoked = instance.id, not instance.is_active or instance.is_deleted
+    transaction.on_commit(lambda: set_user_revoked(user_id, revoked=revoked))
+    updated_at = getattr(instance, "updated_at", None)
+    invalidate_cached_user(
+        instance.id, version_floor=updated_at.timestamp() if updated_at else None
+    )
+
+
+@receiver(post_delete, sender=User)
+def revoke_on_user_delete(sender, instance: User, **kwargs) -> None:
+    user_id = instance.id
+    transaction.on_commit(lambda: set_user_revoked(user_id, revoked=True))
+    invalidate_cached_user(instance.id)
+
+
+@receiver(post_save, sender=UserObjectPermission)
+@receiver(post_delete, sender=UserObjectPermission)
+def invalidate_object_perm_snapshot_on_change(
+    sender, instance: UserObjectPermission, **kwargs
+) -> None:
+    # Bulk grant/revoke services invalidate explicitly (no signals there).
+    invalidate_object_perm_snapshots([instance.user_id])
+
+
+@receiver(post_save, sender=GroupObjectPermission)
+@receiver(post_delete, sender=GroupObjectPermission)
+def invalidate_group_object_perm_snapshots_on_change(
+    sender, instance: GroupObjectPermission, **kwargs
+) -> None:
+    invalidate_group_object_perm_snapshots()
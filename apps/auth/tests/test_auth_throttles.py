@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework.throttling import SimpleRateThrottle
+
+User = get_user_model()
+
+RATES = {
+    "login_ip": "5/m",
+    "login_email": "2/m",
+    "otp_request_ip": "5/m",
+    "otp_request_email": "2/m",
+}
+
+
+class AuthThrottleTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        # Through the full handler: with ATOMIC_REQUESTS each request runs in
+        # its own savepoint, so error responses do not break the test's
+        # transaction.
+        self.client = APIClient()
+        patcher = mock.patch.dict(SimpleRateThrottle.THROTTLE_RATES, RATES)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.user = User(email="throttled@test.com", phone_number="1000002401")
+        self.user.set_password("strongpass123")
+        self.user.save()
+
+    def _post(self, path, data, ip="10.0.0.1"):
+        return self.client.post(path, data, format="json", REMOTE_ADDR=ip)
+
+    def _login(self, email="throttled@test.com", **kwargs):
+        data = {"email": email, "password": "wrong-password"}
+        return self._post("/api/auth/token/", data, **kwargs)
+
+    def test_login_is_limited_per_email_before_any_query(self):
+        # Bad credentials: 403 (the view has no authenticators to challenge with).
+        self.assertEqual(self._login().status_code, 403)
+        self.assertEqual(self._login(ip="10.0.0.2").status_code, 403)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self._login(ip="10.0.0.3")
+        self.assertEqual(response.status_code, 429)
+        # Only the request's savepoint: no user lookup, no password hash.
+        self.assertFalse(
+            [q["sql"] for q in queries if "SAVEPOINT" not in q["sql"].upper()]
+        )
+        self.assertIn("Retry-After", response)
+        # Email matching is case-insensitive; other accounts are unaffected.
+        self.assertEqual(self._login(email="THROTTLED@test.com").status_code, 429)
+        self.assertEqual(self._login(email="other@test.com").status_code, 403)
+
+    def test_login_is_limited_per_ip(self):
+        for i in range(5):
+            self.assertEqual(self._login(email=f"user{i}@test.com").status_code, 403)
+        self.assertEqual(self._login(email="user5@test.com").status_code, 429)
+        self.assertEqual(
+            self._login(email="user5@test.com", ip="10.0.0.9").status_code, 403
+        )
+
+    def test_otp_requests_are_limited_per_email_and_purpose(self):
+        for _ in range(2):
+            response = self._post(
+                "/api/auth/otp/request/",
+                {"email": "nobody@test.com", "purpose": "login"},
+            )
+            self.assertEqual(response.status_code, 200)
+        # Unknown and known emails are throttled alike.
+        response = self._post(
+            "/api/auth/otp/request/", {"email": "nobody@test.com", "purpose": "login"}
+        )
+        self.assertEqual(response.status_code, 429)
+        response = self._post(
+            "/api/auth/otp/request/",
+            {"email": "nobody@test.com", "purpose": "register"},
+        )
+        self.assertEqual(response.status_code, 200)
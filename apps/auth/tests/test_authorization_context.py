@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.test import TestCase
+
+from apps.auth.apis.permissions import DenyIfRoleNotAllowedForEndpoint, IsInvestorRole
+from apps.auth.configs.constants.roles import RoleName
+from apps.auth.services import authorization_context
+from apps.auth.services.authorization_context import get_authorization_context
+from apps.notification.apis.permissions import NotificationEndpointPermission
+
+User = get_user_model()
+
+
+class AuthorizationContextTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create(
+            email="authz@test.com", phone_number="1000000801"
+        )
+        self.user.roles.add(Group.objects.create(name=RoleName.INVESTOR.value))
+
+    def test_roles_resolved_once_across_permission_classes(self):
+        request = SimpleNamespace(user=self.user)
+        view = SimpleNamespace(
+            action="create", allowed_roles=[RoleName.INVESTOR, RoleName.ADMIN]
+        )
+        with mock.patch.object(
+            authorization_context,
+            "get_user_roles",
+            wraps=authorization_context.get_user_roles,
+        ) as get_roles:
+            self.assertTrue(
+                DenyIfRoleNotAllowedForEndpoint().has_permission(request, view)
+            )
+            self.assertTrue(IsInvestorRole().has_permission(request, view))
+            self.assertFalse(
+                NotificationEndpointPermission().has_permission(request, view)
+            )
+        get_roles.assert_called_once()
+
+    def test_context_is_rebuilt_when_user_changes(self):
+        request = SimpleNamespace(user=self.user)
+        self.assertTrue(get_authorization_context(request).has_role("Investor"))
+        request.user = User.objects.create(
+            email="other@test.com", phone_number="1000000802", is_superuser=True
+        )
+        authz = get_authorization_context(request)
+        self.assertFalse(authz.has_role(RoleName.INVESTOR))
+        self.assertTrue(authz.is_admin)
+        self.assertTrue(authz.has_any_role(["Startup"]))
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.test import TestCase
+
+from apps.auth.models.object_permission_models import GroupObjectPermission
+from apps.auth.services.object_permission_snapshots import get_object_perm_snapshot
+from apps.auth.services.object_permissions import (
+    assign_group_object_perms_bulk,
+    filter_queryset_by_object_perm,
+    revoke_group_object_perms_bulk,
+    user_has_object_perms,
+)
+from apps.common.configs.constants.type_enums import TypeScopeChoices
+from apps.common.models.common_type_models import Type
+
+User = get_user_model()
+
+
+class GroupObjectPermissionTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.role = Group.objects.create(name="Investor")
+        self.member = User.objects.create(
+            email="member@test.com", phone_number="1000000601"
+        )
+        self.outsider = User.objects.create(
+            email="outsider@test.com", phone_number="1000000602"
+        )
+        self.member.roles.add(self.role)
+        self.content_type = ContentType.objects.get_for_model(Type)
+        self.objs = [
+            Type.objects.create(title=f"Type {i}", scope=TypeScopeChoices.DOCUMENT)
+            for i in range(3)
+        ]
+        with self.captureOnCommitCallbacks(execute=True):
+            assign_group_object_perms_bulk(
+                groups=[self.role], objs=self.objs[:2], perms=["common.view_type"]
+            )
+
+    def _filtered(self, user, strategy):
+        return set(
+            filter_queryset_by_object_perm(
+                user=user,
+                queryset=Type.objects.all(),
+                perm="common.view_type",
+                strategy=strategy,
+            )
+        )
+
+    def test_role_grant_is_one_row_per_object(self):
+        self.assertEqual(GroupObjectPermission.objects.count(), 2)
+
+    def test_members_inherit_role_grants_in_every_strategy(self):
+        for strategy in ["auto", "exists", "subquery", "ids"]:
+            with self.subTest(strategy=strategy):
+                self.assertEqual(
+                    self._filtered(self.member, strategy), set(self.objs[:2])
+                )
+                self.assertEqual(self._filtered(self.outsider, strategy), set())
+
+        request = SimpleNamespace(user=self.member)
+        self.assertTrue(
+            user_has_object_perms(
+                request=request, obj=self.objs[0], required_perms=["common.view_type"]
+            )
+        )
+
+    def test_membership_and_grant_changes_invalidate_snapshots(self):
+        self.assertEqual(self._filtered(self.outsider, "auto"), set())
+        with self.captureOnCommitCallbacks(execute=True):
+            self.outsider.roles.add(self.role)
+        self.assertEqual(self._filtered(self.outsider, "auto"), set(self.objs[:2]))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            revoke_group_object_perms_bulk(groups=[self.role], objs=self.objs[:1])
+        self.assertEqual(self._filtered(self.member, "auto"), {self.objs[1]})
+
+    def test_snapshot_rebuild_ignores_stale_role_caches(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.member.roles.remove(self.role)
+        # Another process's role map (or an old JWT claim) still lists the role.
+        self.member.token_roles = {"Investor"}
+        snapshot = get_object_perm_snapshot(self.member, self.content_type.id)
+        self.assertEqual(snapshot.object_ids("view_type"), [])
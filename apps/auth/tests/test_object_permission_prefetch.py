@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import serializers
+
+from apps.auth.apis.serializers.auth_object_permission_serializers import (
+    ObjectPermissionsField,
+)
+from apps.auth.services.object_permissions import (
+    assign_object_perms_bulk,
+    prefetch_object_perms,
+    user_has_object_perms,
+)
+from apps.common.configs.constants.type_enums import TypeScopeChoices
+from apps.common.models.common_type_models import Type
+
+User = get_user_model()
+
+
+class _TypeSerializer(serializers.ModelSerializer):
+    permissions = ObjectPermissionsField()
+
+    class Meta:
+        model = Type
+        fields = ("id", "title", "permissions")
+
+
+class ObjectPermissionPrefetchTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(
+            email="prefetch@test.com", phone_number="1000001001"
+        )
+        self.objs = [
+            Type.objects.create(title=f"Type {i}", scope=TypeScopeChoices.DOCUMENT)
+            for i in range(12)
+        ]
+        assign_object_perms_bulk(
+            users=[self.user], objs=self.objs[::2], perms=["common.change_type"]
+        )
+
+    def _render_queries(self, objs) -> tuple[list, int]:
+        cache.clear()
+        request = SimpleNamespace(user=self.user)
+        with CaptureQueriesContext(connection) as ctx:
+            data = _TypeSerializer(objs, many=True, context={"request": request}).data
+        return data, len(ctx.captured_queries)
+
+    def test_list_rendering_queries_do_not_grow_with_page_size(self):
+        self._render_queries(self.objs[:1])  # warm content type + role caches
+        _, small = self._render_queries(self.objs[:3])
+        data, large = self._render_queries(self.objs)
+        self.assertEqual(small, large)
+        self.assertEqual(
+            [row["permissions"]["can_change"] for row in data],
+            [i % 2 == 0 for i in range(12)],
+        )
+        self.assertFalse(any(row["permissions"]["can_delete"] for row in data))
+
+    def test_prefetch_without_snapshot_is_one_query(self):
+        cache.clear()
+        request = SimpleNamespace(user=self.user)
+        with self.settings(
+            CACHES={
+                "default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}
+            }
+        ):
+            with self.assertNumQueries(1):
+                prefetch_object_perms(request=request, objs=self.objs)
+            with self.assertNumQueries(0):
+                self.assertTrue(
+                    user_has_object_perms(
+                        request=request,
+                        obj=self.objs[4],
+                        required_perms=["common.change_type"],
+                    )
+                )
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+
+from apps.auth.models.object_permission_models import UserObjectPermission
+from apps.auth.services.object_permissions import (
+    assign_object_perms_bulk,
+    filter_queryset_by_object_perm,
+    revoke_object_perms_bulk,
+    user_has_object_perms,
+)
+from apps.common.configs.constants.type_enums import TypeScopeChoices
+from apps.common.models.common_type_models import Type
+from apps.document.models.document_document_models import Document
+
+User = get_user_model()
+
+
+class ObjectPermSnapshotTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        ContentType.objects.clear_cache()
+        self.user = User.objects.create(
+            email="snapshot@test.com", phone_number="1000000501"
+        )
+        self.objs = [
+            Type.objects.create(title=f"Type {i}", scope=TypeScopeChoices.DOCUMENT)
+            for i in range(3)
+        ]
+        with self.captureOnCommitCallbacks(execute=True):
+            assign_object_perms_bulk(users=[self.user], objs=self.objs[:2])
+
+    def _request(self):
+        return SimpleNamespace(user=self.user)
+
+    def test_detail_check_is_served_from_snapshot_across_requests(self):
+        self.assertTrue(
+            user_has_object_perms(
+                request=self._request(),
+                obj=self.objs[0],
+                required_perms=["common.view_type"],
+            )
+        )
+        with self.assertNumQueries(0):
+            self.assertTrue(
+                user_has_object_perms(
+                    request=self._request(),
+                    obj=self.objs[1],
+                    required_perms=["common.change_type"],
+                )
+            )
+            self.assertFalse(
+                user_has_object_perms(
+                    request=self._request(),
+                    obj=self.objs[2],
+                    required_perms=["common.view_type"],
+                )
+            )
+
+    def test_list_filter_inlines_small_id_sets(self):
+        qs = filter_queryset_by_object_perm(
+            user=self.user, queryset=Type.objects.all(), perm="common.view_type"
+        )
+        self.assertNotIn("authz_userobjectpermission", str(qs.query))
+        self.assertEqual(set(qs), set(self.objs[:2]))
+
+    def test_writes_invalidate_snapshot_on_commit(self):
+        request = self._request()
+        user_has_object_perms(
+            request=request, obj=self.objs[2], required_perms=["common.view_type"]
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            UserObjectPermission.objects.create(
+                user=self.user,
+                content_type=ContentType.objects.get_for_model(Type),
+                object_id=self.objs[2].pk,
+                perm_codename="common.view_type",
+            )
+        self.assertTrue(
+            user_has_object_perms(
+                request=self._request(),
+                obj=self.objs[2],
+                required_perms=["common.view_type"],
+            )
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            revoke_object_perms_bulk(users=[self.user], objs=self.objs)
+        self.assertFalse(
+            filter_queryset_by_object_perm(
+                user=self.user, queryset=Type.objects.all(), perm="common.view_type"
+            ).exists()
+        )
+
+
+class ObjectPermFilterStrategyTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create(
+            email="strategy@test.com", phone_number="1000000502"
+        )
+        self.types = [
+            Type.objects.create(title=f"Type {i}", scope=TypeScopeChoices.DOCUMENT)
+            for i in range(3)
+        ]
+        self.documents = [
+            Document.objects.create(
+                filename=f"doc{i}.pdf",
+                original_filename=f"doc{i}.pdf",
+                file_type="pdf",
+                file_path=f"documents/doc{i}.pdf",
+                file_size_bytes=1,
+            )
+            for i in range(3)
+        ]
+        assign_object_perms_bulk(
+            users=[self.user], objs=[self.types[0], self.types[2], self.documents[1]]
+        )
+
+    def _strategies(self):
+        strategies = ["auto", "ids"]
+        # The text cast of a UUID pk only matches `str(pk)` on Postgres.
+        if connection.vendor == "postgresql":
+            strategies += ["exists", "subquery"]
+        return strategies
+
+    def test_integer_pk_strategies_agree(self):
+        for strategy in ["auto", "exists", "subquery", "ids"]:
+            with self.subTest(strategy=strategy):
+                qs = filter_queryset_by_object_perm(
+                    user=self.user,
+                    queryset=Type.objects.all(),
+                    perm="common.view_type",
+                    strategy=strategy,
+                )
+                self.assertEqual(set(qs), {self.types[0], self.types[2]})
+
+    def test_uuid_pk_models_are_supported(self):
+        for strategy in self._strategies():
+            with self.subTest(strategy=strategy):
+                qs = filter_queryset_by_object_perm(
+                    user=self.user,
+                    queryset=Document.objects.all(),
+                    perm="document.view_document",
+                    strategy=strategy,
+                )
+                self.assertEqual(list(qs), [self.documents[1]])
+        self.assertTrue(
+            user_has_object_perms(
+                request=SimpleNamespace(user=self.user),
+                obj=self.documents[1],
+                required_perms=["document.change_document"],
+            )
+        )
+
+    def test_unknown_strategy_is_rejected(self):
+        with self.assertRaises(ValueError):
+            filter_queryset_by_object_perm(
+                user=self.user,
+                queryset=Type.objects.all(),
+                perm="common.view_type",
+                strategy="nested_loop",
+            )
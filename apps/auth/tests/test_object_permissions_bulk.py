@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.test import TestCase
+
+from apps.auth.models.object_permission_models import UserObjectPermission
+from apps.auth.services.object_permissions import (
+    assign_object_perms_bulk,
+    revoke_object_perms_bulk,
+)
+from apps.common.configs.constants.type_enums import TypeScopeChoices
+from apps.common.models.common_type_models import Type
+
+User = get_user_model()
+
+
+class BulkObjectPermissionTests(TestCase):
+    def setUp(self):
+        self.users = [
+            User.objects.create(
+                email=f"bulk{i}@test.com", phone_number=f"10000004{i:02d}"
+            )
+            for i in range(3)
+        ]
+        self.objs = [
+            Type.objects.create(title=f"Type {i}", scope=TypeScopeChoices.DOCUMENT)
+            for i in range(4)
+        ]
+
+    def test_grant_writes_cartesian_product_in_batches(self):
+        ContentType.objects.clear_cache()
+        with self.assertNumQueries(
+            # content type lookup + 3 batches (each in a savepoint)
+            1 + 3 * 3,
+        ):
+            written = assign_object_perms_bulk(
+                users=self.users,
+                objs=self.objs,
+                perms=["common.view_type"],
+                batch_size=5,
+            )
+        self.assertEqual(written, 12)
+        self.assertEqual(UserObjectPermission.objects.count(), 12)
+
+    def test_default_perms_are_owner_perms(self):
+        assign_object_perms_bulk(users=self.users[:1], objs=self.objs[:1])
+        self.assertEqual(
+            set(UserObjectPermission.objects.values_list("perm_codename", flat=True)),
+            {"common.view_type", "common.change_type", "common.delete_type"},
+        )
+
+    def test_revoke_then_regrant_reactivates(self):
+        assign_object_perms_bulk(
+            users=self.users, objs=self.objs, perms=["common.view_type"]
+        )
+        revoked = revoke_object_perms_bulk(
+            users=self.users[:1], objs=self.objs, perms=["common.view_type"]
+        )
+        self.assertEqual(revoked, 4)
+        self.assertEqual(UserObjectPermission.objects.count(), 8)
+
+        assign_object_perms_bulk(
+            users=self.users[:1], objs=self.objs, perms=["common.view_type"]
+        )
+        self.assertEqual(UserObjectPermission.objects.count(), 12)
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from unittest import mock, skipUnless
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from apps.auth.services import otp_service
+from apps.auth.services.otp_service import (
+    CacheOTPStore,
+    OTPStore,
+    RedisOTPStore,
+    consume_verification_id,
+    get_otp,
+    store_otp,
+    verify_and_consume_otp,
+    verify_otp_and_issue_verification_id,
+)
+from apps.auth.services.revocation import redis_client
+
+EMAIL = "otp@store.com"
+
+
+class OTPStoreBehaviour:
+    """Rules every `OTPStore` must follow; subclasses pick the store."""
+
+    def make_store(self):
+        raise NotImplementedError
+
+    def setUp(self):
+        cache.clear()
+        patcher = mock.patch.object(
+            otp_service, "get_otp_store", return_value=self.make_store()
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_code_is_single_use_and_issues_a_verification_id(self):
+        self.assertTrue(store_otp(EMAIL, "123456", "login"))
+        self.assertEqual(get_otp(EMAIL, "login"), "123456")
+
+        verification_id = verify_otp_and_issue_verification_id(
+            EMAIL.upper(), " 123456 ", "login"
+        )
+        self.assertIsNotNone(verification_id)
+        self.assertIsNone(
+            verify_otp_and_issue_verification_id(EMAIL, "123456", "login")
+        )
+        self.assertEqual(
+            consume_verification_id(verification_id),
+            {"email": EMAIL, "purpose": "login"},
+        )
+        self.assertIsNone(consume_verification_id(verification_id))
+
+    def test_codes_are_scoped_by_purpose(self):
+        store_otp(EMAIL, "123456", "register")
+        self.assertFalse(verify_and_consume_otp(EMAIL, "123456", "login"))
+        self.assertTrue(verify_and_consume_otp(EMAIL, "123456", "register"))
+
+    def test_wrong_guesses_burn_the_code(self):
+        store_otp(EMAIL, "123456", "login")
+        self.assertFalse(verify_and_consume_otp(EMAIL, "000000", "login"))
+        self.assertFalse(verify_and_consume_otp(EMAIL, "111111", "login"))
+        self.assertEqual(get_otp(EMAIL, "login"), "123456")
+        self.assertFalse(verify_and_consume_otp(EMAIL, "222222", "login"))
+
+        self.assertIsNone(get_otp(EMAIL, "login"))
+        self.assertFalse(verify_and_consume_otp(EMAIL, "123456", "login"))
+
+    def test_new_code_replaces_the_old_one_and_its_attempts(self):
+        store_otp(EMAIL, "123456", "login")
+        verify_and_consume_otp(EMAIL, "000000", "login")
+        verify_and_consume_otp(EMAIL, "000000", "login")
+        store_otp(EMAIL, "654321", "login")
+
+        self.assertFalse(verify_and_consume_otp(EMAIL, "123456", "login"))
+        self.assertTrue(verify_and_consume_otp(EMAIL, "654321", "login"))
+
+    def test_requests_are_rate_limited_per_email(self):
+        self.assertTrue(store_otp(EMAIL, "111111", "login"))
+        self.assertTrue(store_otp(EMAIL, "222222", "register"))
+        self.assertFalse(store_otp(EMAIL, "333333", "login"))
+        # The refused request leaves the current code in place.
+        self.assertEqual(get_otp(EMAIL, "login"), "111111")
+        self.assertTrue(store_otp("other@store.com", "444444", "login"))
+
+
+@override_settings(OTP_MAX_VERIFY_ATTEMPTS=3, OTP_RATE_LIMIT=2)
+class CacheOTPStoreTests(OTPStoreBehaviour, SimpleTestCase):
+    def make_store(self):
+        return CacheOTPStore()
+
+
+@skipUnless(redis_client() is not None, "needs the django-redis default cache")
+@override_settings(OTP_MAX_VERIFY_ATTEMPTS=3, OTP_RATE_LIMIT=2)
+class RedisOTPStoreTests(OTPStoreBehaviour, SimpleTestCase):
+    def make_store(self):
+        return RedisOTPStore(redis_client())
+
+
+class OTPStoreInterfaceTests(SimpleTestCase):
+    def test_incomplete_store_fails_on_creation(self):
+        class IssueOnlyStore(OTPStore):
+            def issue(self, key, rate_key, otp, ttl, rate_limit, rate_window):
+                return True
+
+        with self.assertRaises(TypeError):
+            IssueOnlyStore()
+
+
+class RedisOTPStoreRoundTripTests(SimpleTestCase):
+    def test_each_operation_is_one_script_call(self):
+        client = mock.Mock()
+        client.register_script.side_effect = lambda source: mock.Mock(return_value=1)
+        store = RedisOTPStore(client)
+        client.reset_mock()
+
+        with mock.patch.object(otp_service, "get_otp_store", return_value=store):
+            self.assertTrue(store_otp(EMAIL, "123456", "login"))
+            self.assertIsNotNone(
+                verify_otp_and_issue_verification_id(EMAIL, "123456", "login")
+            )
+
+        self.assertEqual(store._issue.call_count, 1)
+        self.assertEqual(store._verify.call_count, 1)
+        self.assertEqual(len(store._verify.call_args.kwargs["keys"]), 2)
+        self.assertEqual(client.method_calls, [])
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import threading
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth import aauthenticate, authenticate, get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.test import APIRequestFactory
+
+from apps.auth.apis.views.auth_login_views import LoginAPIView
+from apps.auth.services import password_verification
+from apps.auth.services.password_verification import (
+    PasswordHashPool,
+    PasswordVerificationBusy,
+)
+
+User = get_user_model()
+
+
+class PasswordHashPoolTests(SimpleTestCase):
+    def setUp(self):
+        self.pool = PasswordHashPool(workers=1, queue_depth=1)
+        self.release = threading.Event()
+        self.addCleanup(self.pool.shutdown)
+        self.addCleanup(self.release.set)
+
+    def test_refuses_calls_beyond_workers_plus_queue(self):
+        running = self.pool.submit(self.release.wait)
+        queued = self.pool.submit(lambda: "queued")
+        with self.assertRaises(PasswordVerificationBusy):
+            self.pool.submit(lambda: "refused")
+
+        self.release.set()
+        self.assertTrue(running.result(timeout=5))
+        self.assertEqual(queued.result(timeout=5), "queued")
+        # Finished calls give their slots back.
+        self.assertEqual(self.pool.run(lambda: "again"), "again")
+
+    def test_arun_awaits_the_worker(self):
+        async def check():
+            return await self.pool.arun(threading.current_thread)
+
+        worker = async_to_sync(check)()
+        self.assertTrue(worker.name.startswith("password-hash"))
+
+
+class PooledModelBackendTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User(email="pooled@test.com", phone_number="1000002501")
+        self.user.set_password("strongpass123")
+        self.user.save()
+
+    def _login(self, password="strongpass123"):
+        request = APIRequestFactory().post(
+            "/",
+            {"email": "pooled@test.com", "password": password},
+            format="json",
+        )
+        return LoginAPIView.as_view()(request)
+
+    def test_login_verifies_on_the_pool(self):
+        with mock.patch.object(
+            password_verification.hashers,
+            "verify_password",
+            wraps=password_verification.hashers.verify_password,
+        ) as verify:
+            response = self._login()
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("access", response.data["data"])
+        self.assertEqual(verify.call_count, 1)
+        self.assertEqual(self._login(password="wrong").status_code, 403)
+
+    def test_saturated_pool_answers_429(self):
+        pool = mock.Mock()
+        pool.run.side_effect = PasswordVerificationBusy(retry_after=1)
+        with mock.patch.object(
+            password_verification, "get_password_pool", return_value=pool
+        ):
+            response = self._login()
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response["Retry-After"], "1")
+
+    def test_unknown_user_still_pays_for_a_hash(self):
+        with mock.patch.object(
+            password_verification.hashers,
+            "make_password",
+            wraps=password_verification.hashers.make_password,
+        ) as make:
+            self.assertIsNone(authenticate(email="nobody@test.com", password="x"))
+        self.assertEqual(make.call_count, 1)
+
+    @override_settings(
+        PASSWORD_HASHERS=[
+            "django.contrib.auth.hashers.MD5PasswordHasher",
+            "django.contrib.auth.hashers.ScryptPasswordHasher",
+        ]
+    )
+    def test_outdated_hash_is_upgraded_on_login(self):
+        self.user.password = make_password("strongpass123", hasher="scrypt")
+        self.user.save(update_fields=["password"])
+
+        self.assertEqual(
+            authenticate(email="pooled@test.com", password="strongpass123"), self.user
+        )
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith("md5$"))
+
+    async def test_aauthenticate_awaits_the_pool(self):
+        user = await aauthenticate(email="pooled@test.com", password="strongpass123")
+        self.assertEqual(user, self.user)
+        self.assertIsNone(
+            await aauthenticate(email="pooled@test.com", password="wrong")
+        )
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from apps.auth.services import roles as roles_service
+from apps.auth.services.roles import get_user_roles
+
+User = get_user_model()
+
+
+@override_settings(AUTH_ROLE_CACHE_CHECK_SECONDS=60)
+class RoleCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        roles_service.reset_role_cache()
+        self.user = User.objects.create(
+            email="roles@test.com", phone_number="1000000701"
+        )
+        self.role = Group.objects.create(name="Founder")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.roles.add(self.role)
+
+    def test_warm_lookups_skip_db_and_shared_cache(self):
+        self.assertEqual(get_user_roles(self.user), {"Founder"})
+        with (
+            self.assertNumQueries(0),
+            mock.patch.object(
+                roles_service.cache, "get", wraps=roles_service.cache.get
+            ) as cache_get,
+        ):
+            for _ in range(5):
+                self.assertEqual(get_user_roles(self.user), {"Founder"})
+        cache_get.assert_not_called()
+
+    def test_role_change_is_visible_after_commit(self):
+        self.assertEqual(get_user_roles(self.user), {"Founder"})
+        investor = Group.objects.create(name="Investor")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.roles.add(investor)
+        self.assertEqual(get_user_roles(self.user), {"Founder", "Investor"})
+
+    def test_group_rename_bumps_generation(self):
+        self.assertEqual(get_user_roles(self.user), {"Founder"})
+        with self.captureOnCommitCallbacks(execute=True):
+            self.role.name = "Co-Founder"
+            self.role.save()
+        self.assertEqual(get_user_roles(self.user), {"Co-Founder"})
+
+    def test_uncommitted_change_does_not_bump(self):
+        self.assertEqual(get_user_roles(self.user), {"Founder"})
+        with self.captureOnCommitCallbacks(execute=False):
+            self.user.roles.remove(self.role)
+        # Still inside the test transaction: nothing committed, nothing bumped.
+        self.assertEqual(get_user_roles(self.user), {"Founder"})
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import threading
+import time
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.core.cache import cache, caches
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory
+
+from apps.auth.services import role_claims
+from apps.auth.services import roles as roles_service
+from apps.auth.services.auth_token_generator_services import generate_token_for_user
+from apps.auth.services.roles import has_any_role
+from apps.common.configs.classes.common_authentication_classes import (
+    HatchupJWTAuthentication,
+)
+
+User = get_user_model()
+
+
+@override_settings(
+    JWT_TOKEN_USER_ENABLED=True,
+    JWT_TRUST_ROLE_CLAIMS=True,
+    AUTH_ROLE_CACHE_CHECK_SECONDS=0,
+)
+class RoleClaimTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        roles_service.reset_role_cache()
+        self.user = User.objects.create(
+            email="claims@test.com", phone_number="1000000901"
+        )
+        self.investor = Group.objects.create(name="Investor")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.roles.add(self.investor)
+
+    def _authenticate(self, token: str):
+        request = APIRequestFactory().get(
+            "/api/users/me/", HTTP_AUTHORIZATION=f"Bearer {token}"
+        )
+        user, _ = HatchupJWTAuthentication().authenticate(request)
+        return user
+
+    def test_token_generation_reads_roles_once(self):
+        with CaptureQueriesContext(connection) as ctx:
+            generate_token_for_user(self.user)
+        role_queries = [
+            q for q in ctx.captured_queries if "auth_group" in q["sql"].lower()
+        ]
+        self.assertEqual(len(role_queries), 1)
+
+    def test_role_gate_uses_claims_without_queries(self):
+        access = generate_token_for_user(self.user)["access"]
+        user = self._authenticate(access)
+        with self.assertNumQueries(0):
+            self.assertTrue(has_any_role(user, ["Investor"]))
+            self.assertFalse(has_any_role(user, ["Admin"]))
+
+    def test_role_change_distrusts_older_claims(self):
+        access = generate_token_for_user(self.user)["access"]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.roles.remove(self.investor)
+
+        user = self._authenticate(access)
+        self.assertIsNone(user.token_roles)
+        self.assertFalse(has_any_role(user, ["Investor"]))
+
+        fresh = self._authenticate(generate_token_for_user(self.user)["access"])
+        self.assertEqual(fresh.token_roles, frozenset())
+
+    def test_lost_role_change_list_distrusts_existing_claims(self):
+        access = generate_token_for_user(self.user)["access"]
+        # A flush drops the list with any changes recorded in it.
+        cache.clear()
+        roles_service.reset_role_cache()
+
+        self.assertIsNone(self._authenticate(access).token_roles)
+        fresh = self._authenticate(generate_token_for_user(self.user)["access"])
+        self.assertEqual(fresh.token_roles, frozenset({"Investor"}))
+
+    def test_concurrent_role_changes_are_all_recorded(self):
+        user_ids = range(1000, 1032)
+        threads = [
+            threading.Thread(target=role_claims.record_role_change, args=(uid,))
+            for uid in user_ids
+        ]
+        backend = type(caches["default"])
+        get = backend.get
+
+        def slow_get(self, *args, **kwargs):
+            # Widen the read-modify-write window so lost updates would show.
+            value = get(self, *args, **kwargs)
+            time.sleep(0.001)
+            return value
+
+        with mock.patch.object(backend, "get", slow_get):
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        _, changes = role_claims._load_role_changes()
+        self.assertTrue(set(user_ids) <= set(changes))
+
+    @override_settings(JWT_TRUST_ROLE_CLAIMS=False)
+    def test_claims_ignored_when_disabled(self):
+        user = self._authenticate(generate_token_for_user(self.user)["access"])
+        self.assertIsNone(user.token_roles)
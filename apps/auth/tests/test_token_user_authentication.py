@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.auth.services import revocation
+from apps.auth.services.auth_token_generator_services import generate_token_for_user
+from apps.common.configs.classes.common_authentication_classes import (
+    HatchupJWTAuthentication,
+)
+
+User = get_user_model()
+
+
+@override_settings(JWT_TOKEN_USER_ENABLED=True)
+class TokenUserAuthenticationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user = User.objects.create(
+                email="token.user@test.com",
+                phone_number="1000000200",
+                first_name="Token",
+                last_name="User",
+            )
+        self.access = generate_token_for_user(self.user)["access"]
+        self.auth = HatchupJWTAuthentication()
+
+    def _save(self, **fields):
+        for name, value in fields.items():
+            setattr(self.user, name, value)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save()
+
+    def _authenticate(self, token: str):
+        request = APIRequestFactory().get(
+            "/api/users/me/", HTTP_AUTHORIZATION=f"Bearer {token}"
+        )
+        return self.auth.authenticate(request)
+
+    def test_claim_user_is_built_without_queries(self):
+        with CaptureQueriesContext(connection) as ctx:
+            user, _ = self._authenticate(self.access)
+            self.assertEqual(user.pk, self.user.pk)
+            self.assertEqual(user.email, self.user.email)
+            self.assertFalse(user.is_superuser)
+        self.assertEqual(len(ctx.captured_queries), 0)
+
+    def test_non_claim_fields_load_in_one_query(self):
+        user, _ = self._authenticate(self.access)
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(user.first_name, "Token")
+            self.assertEqual(user.last_name, "User")
+            self.assertEqual(user.phone_number, "1000000200")
+        self.assertEqual(len(ctx.captured_queries), 1)
+
+    def test_deactivated_user_is_rejected(self):
+        self._save(is_active=False)
+        self.assertIs(revocation.is_user_revoked(self.user.pk), True)
+        with self.assertRaises(AuthenticationFailed):
+            self._authenticate(self.access)
+
+    def test_reactivated_user_is_accepted(self):
+        self._save(is_active=False)
+        self._save(is_active=True)
+        user, _ = self._authenticate(self.access)
+        self.assertEqual(user.pk, self.user.pk)
+
+    def test_rolled_back_reactivation_keeps_the_user_revoked(self):
+        self._save(is_active=False)
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertRaises(RuntimeError), transaction.atomic():
+                self.user.is_active = True
+                self.user.save()
+                raise RuntimeError
+        self.assertIs(revocation.is_user_revoked(self.user.pk), True)
+
+    def test_token_without_claims_falls_back_to_database(self):
+        token = str(AccessToken.for_user(self.user))
+        user, _ = self._authenticate(token)
+        self.assertEqual(user.pk, self.user.pk)
+        self.assertFalse(user.get_deferred_fields())
+
+    def test_lost_revocation_state_falls_back_to_database(self):
+        self._save(is_active=False)
+        cache.clear()
+        with self.assertRaises(AuthenticationFailed):
+            self._authenticate(self.access)
+
+        self._save(is_active=True)
+        cache.clear()
+        user, _ = self._authenticate(self.access)
+        self.assertFalse(user.get_deferred_fields())
+
+    def test_superuser_claim_is_checked_against_the_database(self):
+        self.user.is_superuser = True
+        self.user.save()
+        access = generate_token_for_user(self.user)["access"]
+        self.user.is_superuser = False
+        self.user.save()
+
+        user, _ = self._authenticate(access)
+        self.assertFalse(user.is_superuser)
+        self.assertFalse(user.get_deferred_fields())
+
+
+class RedisRevocationBitmapTests(SimpleTestCase):
+    def _lookup(self, bits):
+        client = mock.Mock()
+        client.bitfield.return_value.get.return_value.get.return_value.execute.return_value = bits
+        with mock.patch.object(revocation, "redis_client", return_value=client):
+            return revocation.is_user_revoked(7)
+
+    def test_bitmap_without_built_marker_is_unknown(self):
+        # Flushed/evicted, or recreated by a lone SETBIT after a flush.
+        self.assertIsNone(self._lookup([0, 0]))
+        self.assertIsNone(self._lookup([0, 1]))
+
+    def test_built_bitmap_answers(self):
+        self.assertFalse(self._lookup([1, 0]))
+        self.assertTrue(self._lookup([1, 1]))
+
+    def test_rebuild_sets_the_marker_before_swapping_in(self):
+        client = mock.Mock()
+        with mock.patch.object(revocation, "redis_client", return_value=client):
+            self.assertEqual(revocation.rebuild_revocations([3, 0, 5]), 2)
+        pipe = client.pipeline.return_value
+        scratch = pipe.delete.call_args.args[0]
+        self.assertEqual(
+            [c.args for c in pipe.setbit.call_args_list],
+            [(scratch, 0, 1), (scratch, 3, 1), (scratch, 5, 1)],
+        )
+        pipe.rename.assert_called_once()
+
+    def test_failed_revocation_write_drops_the_built_marker(self):
+        client = mock.Mock()
+        client.setbit.side_effect = [ConnectionError("down"), None]
+        with mock.patch.object(revocation, "redis_client", return_value=client):
+            revocation.set_user_revoked(7)
+        self.assertEqual(client.setbit.call_args.args[1:], (0, 0))
+
+    def test_failed_unrevoke_only_logs(self):
+        client = mock.Mock()
+        client.setbit.side_effect = ConnectionError("down")
+        with mock.patch.object(revocation, "redis_client", return_value=client):
+            # The user stays rejected, not let in.
+            revocation.set_user_revoked(7, revoked=False)
+        client.setbit.assert_called_once()
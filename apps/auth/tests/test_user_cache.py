@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+
+from apps.auth.services.user_cache import get_cached_user
+from apps.common.utils.common_cache_utils import LocalLRUCache
+
+User = get_user_model()
+
+
+class LocalLRUCacheTests(SimpleTestCase):
+    def test_evicts_least_recently_used(self):
+        lru = LocalLRUCache(maxsize=2, ttl=60)
+        lru.set("a", 1)
+        lru.set("b", 2)
+        lru.get("a")
+        lru.set("c", 3)
+        self.assertIsNone(lru.get("b"))
+        self.assertEqual(lru.get("a"), 1)
+        self.assertEqual(lru.stats.evictions, 1)
+
+    def test_expired_entries_are_misses(self):
+        lru = LocalLRUCache(maxsize=2, ttl=0)
+        lru.set("a", 1)
+        self.assertIsNone(lru.get("a"))
+        self.assertEqual(lru.stats.expirations, 1)
+        self.assertEqual(lru.stats.misses, 1)
+
+
+class CachedUserLookupTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create(
+            email="cached.user@test.com", phone_number="1000000300"
+        )
+
+    def test_second_lookup_does_not_query(self):
+        self.assertEqual(get_cached_user(self.user.id).pk, self.user.pk)
+        with CaptureQueriesContext(connection) as ctx:
+            user = get_cached_user(self.user.id)
+            self.assertEqual([r.name for r in user.roles.all()], [])
+        self.assertEqual(len(ctx.captured_queries), 0)
+
+    def test_user_save_invalidates(self):
+        get_cached_user(self.user.id)
+        self.user.first_name = "Renamed"
+        self.user.save()
+        self.assertEqual(get_cached_user(self.user.id).first_name, "Renamed")
+
+    def test_deactivated_user_is_not_returned(self):
+        get_cached_user(self.user.id)
+        self.user.is_active = False
+        self.user.save()
+        self.assertIsNone(get_cached_user(self.user.id))
+
+    def test_role_change_invalidates(self):
+        get_cached_user(self.user.id)
+        group = Group.objects.create(name="Investor")
+        self.user.roles.add(group)
+        user = get_cached_user(self.user.id)
+        self.assertEqual([r.name for r in user.roles.all()], ["Investor"])
@@ -1,4 +1,3 @@
-from django.db.models import Q
 from rest_framework.generics import GenericAPIView
 from rest_framework.mixins import (
     CreateModelMixin,
@@ -16,140 +15,105 @@ from apps.common.configs.classes.common_authentication_classes import (
     HatchupJWTAuthentication,
 )
 from apps.common.configs.classes.common_paginators_classes import DefaultPagination
+from apps.common.utils.common_search_utils import get_search_backend
 
 
 class _SearchableQuerysetMixin:
     search_param = "search"
     search_fields = ()
+    # icontains | fulltext | trigram | auto (see common_search_utils).
+    search_backend = "icontains"
+    # `filter_queryset` searches only these viewset actions; `get_object` goes
+    # through it too, and `?search=` must not hide a detail route's object.
+    # Other views call `apply_search_filter` themselves.
+    search_actions = ("list",)
 
     def get_search_fields(self):
         return tuple(getattr(self, "search_fields", ()))
 
-    def apply_search_filter(self, queryset, request):
+    def search_is_ranked(self) -> bool:
+        # A paginator that imposes its own order would discard the rank.
+        return not getattr(self.paginator, "forces_ordering", False)
+
+    def apply_search_filter(self, queryset, request, search_fields=None, ranked=None):
         search_query = request.query_params.get(self.search_param, "").strip()
-        search_fields = self.get_search_fields()
+        search_fields = tuple(search_fields or self.get_search_fields())
 
         if not search_query or not search_fields:
             return queryset
 
-        search_filter = Q()
-        for field in search_fields:
-            search_filter |= Q(**{f"{field}__icontains": search_query})
-
-        return queryset.filter(search_filter)
+        return get_search_backend(self.search_backend).filter(
+            queryset,
+            search_query,
+            search_fields,
+            ranked=self.search_is_ranked() if ranked is None else ranked,
+        )
 
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if getattr(self, "action", None) not in self.search_actions:
+            return queryset
+        return self.apply_search_filter(queryset, self.request)
 
-class HatchupBaseView(_SearchableQuerysetMixin, GenericAPIView):
-    pagination_class = DefaultPagination
-    authentication_classes = [HatchupJWTAuthentication]
-    permission_classes = [IsAuthenticated]
 
+class _EnvelopeResponseMixin:
     def finalize_response(self, request, response, *args, **kwargs):
         """
-        Wrap JSON responses in a success envelope,
-        but leave streaming/binary responses untouched.
+        Wrap JSON responses in a success envelope, in place,
+        but leave streaming/binary, error and paginated responses untouched.
         """
         response = super().finalize_response(request, response, *args, **kwargs)
 
-        if getattr(response, "streaming", False):
+        if not isinstance(response, Response) or getattr(response, "exception", False):
             return response
 
-        if not isinstance(response, Response) or not hasattr(response, "data"):
+        data = response.data
+        if not isinstance(data, dict) or ("pagination" in data and "message" in data):
             return response
 
-        if getattr(response, "exception", False):
-            return response
+        response.data = {
+            "message": "Request was successful",
+            "status": response.status_code,
+            "pagination": None,
+            "data": data,
+        }
+        return response
 
-        if isinstance(response.data, dict):
-            if "pagination" in response.data and "message" in response.data:
-                return response
-
-            if (
-                hasattr(self, "action")
-                and self.action == "list"
-                and self.paginator is not None
-                and isinstance(response.data, list)
-            ):
-                page = self.paginator.paginate_queryset(response.data, request)
-                if page is not None:
-                    return self.paginator.get_paginated_response(page)
-
-            new_response = Response(
-                {
-                    "message": "Request was successful",
-                    "status": response.status_code,
-                    "pagination": None,
-                    "data": response.data,
-                },
-                status=response.status_code,
-            )
-            new_response.accepted_renderer = response.accepted_renderer
-            new_response.accepted_media_type = response.accepted_media_type
-            new_response.renderer_context = response.renderer_context
-            return new_response
 
-        return response
+class HatchupBaseView(_EnvelopeResponseMixin, _SearchableQuerysetMixin, GenericAPIView):
+    pagination_class = DefaultPagination
+    authentication_classes = [HatchupJWTAuthentication]
+    permission_classes = [IsAuthenticated]
 
 
 class HatchupAPIView(HatchupBaseView, APIView):
-    def finalize_response(self, request, response, *args, **kwargs):
-        return super().finalize_response(request, response, *args, **kwargs)
+    pass
 
 
-class HatchupBaseViewset(_SearchableQuerysetMixin, GenericViewSet):
+class HatchupBaseViewset(
+    _EnvelopeResponseMixin, _SearchableQuerysetMixin, GenericViewSet
+):
     pagination_class = DefaultPagination
     authentication_classes = [HatchupJWTAuthentication]
     permission_classes = []
 
-    def finalize_response(self, request, response, *args, **kwargs):
-        """
-        Wrap JSON responses in a success envelope,
-        but leave streaming/binary responses untouched.
-        """
-        response = super().finalize_response(request, response, *args, **kwargs)
-
-        if getattr(response, "streaming", False):
-            return response
-
-        if not isinstance(response, Response) or not hasattr(response, "data"):
-            return response
-
-        if getattr(response, "exception", False):
-            return response
-
-        if isinstance(response.data, dict):
-            if "pagination" in response.data and "message" in response.data:
-                return response
-
-            if (
-                hasattr(self, "action")
-                and self.action == "list"
-                and self.paginator is not None
-                and isinstance(response.data, list)
-            ):
-                page = self.paginator.paginate_queryset(response.data, request)
-                if page is not None:
-                    return self.paginator.get_paginated_response(page)
-
-            new_response = Response(
-                {
-                    "message": "Request was successful",
-                    "status": response.status_code,
-                    "pagination": None,
-                    "data": response.data,
-                },
-                status=response.status_code,
-            )
-            new_response.accepted_renderer = response.accepted_renderer
-            new_response.accepted_media_type = response.accepted_media_type
-            new_response.renderer_context = response.renderer_context
-            return new_response
-
-        return response
-
 
 class HatchupReadViewset(HatchupBaseViewset, ListModelMixin, RetrieveModelMixin):
-    pass
+    # A FastListSerializer renders `list` from `.values()` rows when set.
+    fast_list_serializer_class = None
+
+    def list(self, request, *args, **kwargs):
+        if self.fast_list_serializer_class is None:
+            return super().list(request, *args, **kwargs)
+
+        serializer = self.fast_list_serializer_class(
+            context=self.get_serializer_context()
+        )
+        queryset = serializer.values_queryset(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(serializer.to_representation(page))
+        return Response(serializer.to_representation(queryset))
 
 
 class HatchupUpsertViewset(
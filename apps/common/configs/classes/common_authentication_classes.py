@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from drf_spectacular.extensions import OpenApiAuthenticationExtension
 from drf_spectacular.plumbing import build_bearer_security_scheme_object
@@ -7,8 +8,16 @@ from rest_framework_simplejwt.exceptions import InvalidToken
 from rest_framework_simplejwt.exceptions import TokenError
 from rest_framework_simplejwt.settings import api_settings as jwt_api_settings
 
+from apps.auth.services.authorization_context import AuthorizationContext
+from apps.auth.services.revocation import is_user_revoked
+from apps.auth.services.role_claims import trusted_role_claims
+from apps.auth.services.user_cache import get_cached_user
+
 User = get_user_model()
 
+# Claims written by `generate_token_for_user`, mapped to the User fields they fill.
+TOKEN_USER_CLAIM_FIELDS = {"username": "email", "is_superuser": "is_superuser"}
+
 
 class HatchupJWTAuthentication(JWTAuthentication):
     def authenticate(self, request) -> tuple | None:
@@ -27,7 +36,11 @@ class HatchupJWTAuthentication(JWTAuthentication):
             raw_token = header[1]
             validated_token = self.get_validated_token(raw_token)
             user = self.get_user_object(validated_token)
+            # With JWT_TRUST_ROLE_CLAIMS, role gates read the claim (no I/O).
+            user.token_roles = trusted_role_claims(validated_token.payload)
             request.user = user
+            # Roles/admin checks are memoized here for the rest of the request.
+            request.authz = AuthorizationContext(user)
             return user, validated_token
         except TokenError as err:
             msg = "Invalid token"
@@ -44,11 +57,61 @@ class HatchupJWTAuthentication(JWTAuthentication):
     def get_user_object(self, validated_token):
         decoded_payload = validated_token.payload
 
-        try:
-            user = User.objects.get(id=decoded_payload.get("user_id"), is_active=True)
-        except User.DoesNotExist as err:
-            raise AuthenticationFailed("Invalid token") from err
+        if getattr(settings, "JWT_TOKEN_USER_ENABLED", False):
+            token_user = self.get_token_user(decoded_payload)
+            if token_user is not None:
+                return token_user
+
+        # Process LRU -> shared cache -> DB (see apps/auth/services/user_cache.py).
+        user = get_cached_user(decoded_payload.get("user_id"))
+        if user is None:
+            raise AuthenticationFailed("Invalid token")
+
+        return user
+
+    def get_token_user(self, decoded_payload):
+        """
+        Build the request user from signed claims, without a database query.
+
+        Only `id`, `email` and `is_superuser` are populated; every other field is
+        deferred and loaded in a single query the first time a view reads one.
+        Deactivated/deleted users are rejected via the revocation bitmap.
 
+        Returns None (fall back to the DB lookup) when the token predates the
+        claims we rely on, the revocation store cannot answer, or the token
+        claims superuser rights: a demotion must take effect before the token
+        expires, and superusers are too few for the query to matter.
+        """
+
+        user_id = decoded_payload.get(jwt_api_settings.USER_ID_CLAIM)
+        if user_id is None or any(
+            claim not in decoded_payload for claim in TOKEN_USER_CLAIM_FIELDS
+        ):
+            return None
+        if decoded_payload["is_superuser"]:
+            return None
+
+        revoked = is_user_revoked(user_id)
+        if revoked is None:
+            return None
+        if revoked:
+            raise AuthenticationFailed("Invalid token")
+
+        values = {
+            User._meta.pk.attname: User._meta.pk.to_python(user_id),
+            "is_active": True,
+            "is_deleted": False,
+            "email": decoded_payload["username"],
+            "is_superuser": False,
+        }
+
+        field_names = [
+            f.attname for f in User._meta.concrete_fields if f.attname in values
+        ]
+        user = User.from_db(
+            User.objects.db, field_names, [values[name] for name in field_names]
+        )
+        user._load_deferred_together = True
         return user
 
 
@@ -1,5 +1,21 @@
-from rest_framework.pagination import PageNumberPagination
+import base64
+import hashlib
+import json
+import math
+from datetime import date, datetime, time
+
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet, FieldDoesNotExist, ValidationError
+from django.core.paginator import InvalidPage
+from django.core.paginator import Paginator as DjangoPaginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 
 def _unwrap_enveloped_schema(schema):
@@ -33,57 +49,444 @@ def _unwrap_enveloped_schema(schema):
     return schema
 
 
+def _envelope_response(pagination, data):
+    return Response(
+        {
+            "message": "Request was successful",
+            "status": 200,
+            "pagination": pagination,
+            "data": data,
+        }
+    )
+
+
+def _envelope_schema(schema):
+    data_schema = _unwrap_enveloped_schema(schema)
+
+    return {
+        "type": "object",
+        "properties": {
+            "message": {"type": "string"},
+            "status": {"type": "integer"},
+            "pagination": {
+                "type": "object",
+                "nullable": True,
+                "properties": {
+                    "links": {
+                        "type": "object",
+                        "properties": {
+                            "next": {"type": "string", "nullable": True},
+                            "previous": {"type": "string", "nullable": True},
+                        },
+                    },
+                    "total_pages": {"type": "integer", "nullable": True},
+                    "current_page": {"type": "integer", "nullable": True},
+                    "total_items": {"type": "integer", "nullable": True},
+                },
+            },
+            "data": data_schema,
+        },
+    }
+
+
+COUNT_EXACT = "exact"
+COUNT_ESTIMATE = "estimate"
+COUNT_NONE = "none"
+PAGINATION_COUNT_MODES = (COUNT_EXACT, COUNT_ESTIMATE, COUNT_NONE)
+
+
+def estimate_queryset_count(queryset) -> int | None:
+    """
+    Planner row estimate for `queryset` (PostgreSQL only, else None).
+
+    Unfiltered tables read `pg_class.reltuples`; anything else asks the planner
+    via `EXPLAIN (FORMAT JSON)`. Neither executes the query. Querysets that
+    cannot match (`.none()`, `pk__in=[]`) have no SQL and count 0.
+    """
+
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    query = queryset.query
+    with connection.cursor() as cursor:
+        if not query.where.children and not query.distinct:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+            # -1: never analyzed; fall back to the planner.
+            if row and row[0] >= 0:
+                return int(row[0])
+        try:
+            sql, params = query.sql_with_params()
+        except EmptyResultSet:
+            return 0
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def _filters_on_time(where) -> bool:
+    """Whether any lookup in `where` compares against a date/time value."""
+
+    for child in where.children:
+        if hasattr(child, "children"):
+            if _filters_on_time(child):
+                return True
+        elif isinstance(getattr(child, "rhs", None), (date, time)):
+            return True
+    return False
+
+
+class _CountedPaginator(DjangoPaginator):
+    """Django paginator whose total comes from `count_fn` (e.g. cached)."""
+
+    def __init__(self, object_list, per_page, count_fn):
+        super().__init__(object_list, per_page)
+        self._count_fn = count_fn
+
+    @cached_property
+    def count(self):
+        return self._count_fn(self.object_list)
+
+
+class _WindowPage:
+    """Page read as `page_size + 1` rows: knows `has_next` without a COUNT."""
+
+    def __init__(self, rows, number, page_size):
+        self.number = number
+        self.has_more = len(rows) > page_size
+        self.object_list = rows[:page_size]
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.has_more
+
+    def has_previous(self):
+        return self.number > 1
+
+    def next_page_number(self):
+        return self.number + 1
+
+    def previous_page_number(self):
+        return self.number - 1
+
+
 class DefaultPagination(PageNumberPagination):
+    """
+    Page-number pagination with a selectable total count.
+
+    `?count=` (or the view's `pagination_count_mode`, default "exact"):
+    - exact:    `COUNT(*)`, cached per (query SQL and params, user) for
+                `count_cache_seconds`, so paging through a list counts once.
+                Querysets filtered on a date/time param (e.g. expiry against
+                `timezone.now()`) get a new key per request, so they are
+                counted every time and not cached;
+    - estimate: planner estimate (PostgreSQL), no `COUNT(*)`;
+    - none:     no totals; `next` comes from reading one extra row.
+    """
+
     page_size = 10
     page_size_query_param = "page_size"
     max_page_size = 200
+    count_query_param = "count"
+    count_cache_seconds = 30
+
+    def get_count_mode(self, request, view=None) -> str:
+        mode = request.query_params.get(self.count_query_param)
+        if mode in PAGINATION_COUNT_MODES:
+            return mode
+        return getattr(view, "pagination_count_mode", COUNT_EXACT)
+
+    def _count_cache_key(self, queryset) -> str | None:
+        try:
+            sql, params = queryset.query.sql_with_params()
+        except (AttributeError, EmptyResultSet):
+            # Not a queryset, or one that cannot match (counts 0 without SQL).
+            return None
+        if _filters_on_time(queryset.query.where):
+            # Typically "now": the key would never be read back.
+            return None
+        digest = hashlib.sha1(repr((sql, params)).encode()).hexdigest()
+        user_id = getattr(getattr(self.request, "user", None), "pk", None)
+        return f"pagination.count.v1:{user_id}:{digest}"
+
+    def _exact_count(self, queryset) -> int:
+        key = self._count_cache_key(queryset) if self.count_cache_seconds else None
+        if key is not None:
+            count = cache.get(key)
+            if count is not None:
+                return count
+        count = queryset.count() if hasattr(queryset, "query") else len(queryset)
+        if key is not None:
+            cache.set(key, count, timeout=self.count_cache_seconds)
+        return count
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        self.count_mode = self.get_count_mode(request, view)
+        if self.count_mode == COUNT_EXACT:
+            paginator = _CountedPaginator(queryset, page_size, self._exact_count)
+            page_number = self.get_page_number(request, paginator)
+            try:
+                self.page = paginator.page(page_number)
+            except InvalidPage as exc:
+                raise NotFound(
+                    self.invalid_page_message.format(
+                        page_number=page_number, message=str(exc)
+                    )
+                )
+            if paginator.num_pages > 1 and self.template is not None:
+                # The browsable API should display pagination controls.
+                self.display_page_controls = True
+            self.total_items = paginator.count
+            self.total_pages = paginator.num_pages
+            return list(self.page)
+
+        try:
+            page_number = int(request.query_params.get(self.page_query_param) or 1)
+            if page_number < 1:
+                raise ValueError
+        except ValueError:
+            raise NotFound(
+                self.invalid_page_message.format(
+                    page_number=request.query_params.get(self.page_query_param),
+                    message="That page number is not a positive integer",
+                )
+            )
+        offset = (page_number - 1) * page_size
+        self.page = _WindowPage(
+            list(queryset[offset : offset + page_size + 1]), page_number, page_size
+        )
+        if page_number > 1 and not len(self.page):
+            raise NotFound(
+                self.invalid_page_message.format(
+                    page_number=page_number, message="That page contains no results"
+                )
+            )
+
+        self.total_items = self.total_pages = None
+        if self.count_mode == COUNT_ESTIMATE:
+            seen = offset + len(self.page) + int(self.page.has_more)
+            estimate = (
+                estimate_queryset_count(queryset)
+                if hasattr(queryset, "query")
+                else None
+            )
+            # Never report fewer rows than this request has already seen.
+            self.total_items = max(estimate or 0, seen)
+            self.total_pages = max(math.ceil(self.total_items / page_size), 1)
+        return list(self.page)
 
     def get_paginated_response(self, data):
-        return Response(
+        return _envelope_response(
+            (
+                {
+                    "links": {
+                        "next": self.get_next_link(),
+                        "previous": self.get_previous_link(),
+                    },
+                    "total_pages": self.total_pages,
+                    "current_page": self.page.number,
+                    "total_items": self.total_items,
+                }
+                if self.total_items or len(self.page) or self.page.number > 1
+                else None
+            ),
+            data,
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return _envelope_schema(schema)
+
+    def get_schema_operation_parameters(self, view):
+        return super().get_schema_operation_parameters(view) + [
             {
-                "message": "Request was successful",
-                "status": 200,
-                "pagination": (
-                    {
-                        "links": {
-                            "next": self.get_next_link(),
-                            "previous": self.get_previous_link(),
-                        },
-                        "total_pages": self.page.paginator.num_pages,
-                        "current_page": self.page.number,
-                        "total_items": self.page.paginator.count,
-                    }
-                    if self.page.paginator.count > 0
-                    else None
-                ),
-                "data": data,
+                "name": self.count_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Total count mode: exact (default), estimate or none.",
+                "schema": {"type": "string", "enum": list(PAGINATION_COUNT_MODES)},
             }
+        ]
+
+
+class HatchupCursorPagination(BasePagination):
+    """
+    Keyset pagination over `(timestamp, id)` with opaque cursors.
+
+    Each page is one indexed range scan (`WHERE (created_at, id) < (...)
+    ORDER BY created_at DESC, id DESC LIMIT n+1`): no `COUNT(*)`, no
+    `OFFSET`, so deep pages cost the same as the first. The response keeps the
+    standard envelope; totals and page numbers are null.
+
+    Ordering comes from the view's `cursor_ordering` (or `ordering` here):
+    two fields, the second unique (normally the pk), e.g. ("created_at", "id").
+    """
+
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 200
+    cursor_query_param = "cursor"
+    ordering = ("-created_at", "-id")
+    invalid_cursor_message = "Invalid cursor"
+    # Pages are always in `ordering`; e.g. search ranks would be discarded.
+    forces_ordering = True
+
+    def __init__(self, ordering=None):
+        if ordering is not None:
+            self.ordering = tuple(ordering)
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(size, self.max_page_size) if size > 0 else self.page_size
+
+    def _decode_cursor(self, request, model=None):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            raw = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+            reverse, key, pk = bool(raw["r"]), raw["k"], raw["p"]
+            # Cursors come from the client: only scalars the ordering fields
+            # accept may reach the filter (anything else would be a 500).
+            if isinstance(key, (bool, dict, list)) or key is None:
+                raise TypeError
+            if isinstance(pk, bool) or not isinstance(pk, (int, str)):
+                raise TypeError
+            key = self._field_value(model, self._fields[0], key)
+            pk = self._field_value(model, self._fields[1], pk)
+        except (ValueError, TypeError, KeyError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+        return reverse, key, pk
+
+    @staticmethod
+    def _field_value(model, name, value):
+        try:
+            field = model._meta.get_field(name)
+        except (AttributeError, FieldDoesNotExist):
+            # Not a local field: keep the old best effort for timestamps.
+            return (parse_datetime(value) or value) if isinstance(value, str) else value
+        value = field.to_python(value)
+        if value is None:
+            raise ValueError
+        return value
+
+    def _encode_cursor(self, *, reverse: bool, obj) -> str:
+        # Rows are model instances or `.values()` dicts (fast list serializers).
+        key, pk = (
+            (obj[self._fields[0]], obj[self._fields[1]])
+            if isinstance(obj, dict)
+            else (getattr(obj, self._fields[0]), getattr(obj, self._fields[1]))
+        )
+        if isinstance(key, datetime):
+            key = key.isoformat()
+        raw = {"r": int(reverse), "k": key, "p": pk if isinstance(pk, int) else str(pk)}
+        encoded = base64.urlsafe_b64encode(json.dumps(raw).encode("ascii"))
+        return replace_query_param(
+            self.base_url, self.cursor_query_param, encoded.decode("ascii")
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        ordering = tuple(getattr(view, "cursor_ordering", None) or self.ordering)
+        descending = ordering[0].startswith("-")
+        self._fields = tuple(field.lstrip("-") for field in ordering)
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+        self.request = request
+
+        cursor = self._decode_cursor(request, getattr(queryset, "model", None))
+        reverse = bool(cursor and cursor[0])
+        # Walking backwards flips both the comparison and the scan direction.
+        scan_descending = descending != reverse
+        key_field, pk_field = self._fields
+        if cursor is not None:
+            _, key, pk = cursor
+            op = "lt" if scan_descending else "gt"
+            # The redundant bound on `key_field` lets the planner range-scan the
+            # (key, pk) index instead of evaluating the OR per row.
+            queryset = queryset.filter(
+                Q(**{f"{key_field}__{op}e": key})
+                & (
+                    Q(**{f"{key_field}__{op}": key})
+                    | Q(**{key_field: key, f"{pk_field}__{op}": pk})
+                )
+            )
+        prefix = "-" if scan_descending else ""
+        queryset = queryset.order_by(f"{prefix}{key_field}", f"{prefix}{pk_field}")
+
+        rows = list(queryset[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        if reverse:
+            rows.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, cursor is not None
+        self.page = rows
+        return rows
+
+    def get_next_link(self):
+        if not (self.has_next and self.page):
+            return None
+        return self._encode_cursor(reverse=False, obj=self.page[-1])
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            # Ran off the end: the first page is the only safe way back.
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self._encode_cursor(reverse=True, obj=self.page[0])
+
+    def get_paginated_response(self, data):
+        next_link, previous_link = self.get_next_link(), self.get_previous_link()
+        return _envelope_response(
+            (
+                {
+                    "links": {"next": next_link, "previous": previous_link},
+                    "total_pages": None,
+                    "current_page": None,
+                    "total_items": None,
+                }
+                if data or next_link or previous_link
+                else None
+            ),
+            data,
         )
 
     def get_paginated_response_schema(self, schema):
-        data_schema = _unwrap_enveloped_schema(schema)
-
-        return {
-            "type": "object",
-            "properties": {
-                "message": {"type": "string"},
-                "status": {"type": "integer"},
-                "pagination": {
-                    "type": "object",
-                    "nullable": True,
-                    "properties": {
-                        "links": {
-                            "type": "object",
-                            "properties": {
-                                "next": {"type": "string", "nullable": True},
-                                "previous": {"type": "string", "nullable": True},
-                            },
-                        },
-                        "total_pages": {"type": "integer", "nullable": True},
-                        "current_page": {"type": "integer", "nullable": True},
-                        "total_items": {"type": "integer", "nullable": True},
-                    },
-                },
-                "data": data_schema,
+        return _envelope_schema(schema)
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Opaque cursor from `pagination.links`.",
+                "schema": {"type": "string"},
             },
-        }
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Number of results to return per page.",
+                "schema": {"type": "integer"},
+            },
+        ]
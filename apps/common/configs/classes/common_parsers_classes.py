@@ -0,0 +1,38 @@
+"""
+API parsers.
+
+`HatchupJSONParser` decodes request bodies with `orjson` when it is
+installed, falling back to DRF's stdlib `JSONParser` otherwise, for
+non-UTF-8 bodies and when `STRICT_JSON` is off (orjson rejects NaN and
+Infinity outright).
+"""
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+
+class HatchupJSONParser(JSONParser):
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        if (
+            orjson is None
+            or not self.strict
+            or encoding.lower()
+            not in (
+                "utf-8",
+                "utf8",
+            )
+        ):
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
@@ -0,0 +1,62 @@
+"""
+API renderers.
+
+`HatchupJSONRenderer` only serializes (the success envelope is applied to
+`response.data` by the Hatchup base views). When `orjson` is installed it
+encodes with it instead of the stdlib `json` module. Output is the same either way: types orjson does not handle itself
+(`Decimal`, `Money`, datetimes, lazy strings, ...) go through
+`HatchupJSONEncoder`, DRF's encoder plus `Money`. Pretty-printed (`indent`)
+and non-default `UNICODE_JSON` / `COMPACT_JSON` / `STRICT_JSON` renders
+always use the stdlib path.
+"""
+
+from djmoney.money import Money
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+ORJSON_OPTIONS = (
+    (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME) if orjson else 0
+)
+
+
+class HatchupJSONEncoder(JSONEncoder):
+    """DRF's JSON encoder, plus `Money` as `"<amount> <currency>"`."""
+
+    def default(self, obj):
+        if isinstance(obj, Money):
+            return f"{obj.amount} {obj.currency}"
+        return super().default(obj)
+
+
+class HatchupJSONRenderer(JSONRenderer):
+    """`JSONRenderer` that encodes with orjson when it can."""
+
+    encoder_class = HatchupJSONEncoder
+
+    def use_orjson(self, accepted_media_type, renderer_context) -> bool:
+        return (
+            orjson is not None
+            and not self.ensure_ascii
+            and self.compact
+            and self.strict
+            and self.get_indent(accepted_media_type, renderer_context) is None
+        )
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None or not self.use_orjson(
+            accepted_media_type, renderer_context or {}
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(
+            data, default=self.encoder_class().default, option=ORJSON_OPTIONS
+        )
+        # Same strict-javascript-subset escaping as `JSONRenderer`.
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
@@ -0,0 +1,85 @@
+"""
+API throttles.
+
+`SlidingWindowRateThrottle` is DRF's `SimpleRateThrottle` (rates from
+`DEFAULT_THROTTLE_RATES`, `Retry-After` on 429) backed by the sliding-window
+counters of `common_rate_limit_utils` instead of a timestamp list per key:
+constant memory per key and one atomic cache call per check. Rates accept a
+period multiplier, e.g. "10/15m".
+
+The scoped variants take their scope from the view (`throttle_scope`) plus a
+suffix, so one view can be limited per IP and per account at once:
+
+    throttle_scope = "login"  # rates "login_ip" and "login_email"
+    throttle_classes = [IPRateThrottle, EmailRateThrottle]
+
+Throttles run in `APIView.initial()`, so a rejected request costs one cache
+call and no database or password-hashing work.
+"""
+
+from __future__ import annotations
+
+import re
+
+from rest_framework.throttling import SimpleRateThrottle
+
+from apps.common.utils.common_rate_limit_utils import hit
+
+_RATE_PERIOD = re.compile(r"(\d*)([smhd])[a-z]*")
+_PERIOD_SECONDS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+class SlidingWindowRateThrottle(SimpleRateThrottle):
+    def parse_rate(self, rate):
+        if rate is None:
+            return (None, None)
+        num, period = rate.split("/")
+        match = _RATE_PERIOD.fullmatch(period)
+        if match is None:
+            raise ValueError(f"Invalid throttle rate period: {rate!r}")
+        multiplier, unit = match.groups()
+        return int(num), int(multiplier or 1) * _PERIOD_SECONDS[unit]
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+        self.decision = hit(self.key, self.num_requests, self.duration)
+        return self.decision.allowed
+
+    def wait(self):
+        return self.decision.retry_after
+
+
+class ScopedSlidingWindowThrottle(SlidingWindowRateThrottle):
+    """Rate `<view.throttle_scope>_<scope_suffix>`; no scope, no limit."""
+
+    scope_attr = "throttle_scope"
+    scope_suffix: str
+
+    def __init__(self):
+        # The rate depends on the view, so it is resolved in `allow_request`.
+        pass
+
+    def allow_request(self, request, view):
+        view_scope = getattr(view, self.scope_attr, None)
+        if not view_scope:
+            return True
+        self.scope = f"{view_scope}_{self.scope_suffix}"
+        self.rate = self.get_rate()
+        self.num_requests, self.duration = self.parse_rate(self.rate)
+        return super().allow_request(request, view)
+
+
+class IPRateThrottle(ScopedSlidingWindowThrottle):
+    """Per client IP (`NUM_PROXIES` aware, as DRF's `get_ident`)."""
+
+    scope_suffix = "ip"
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {
+            "scope": self.scope,
+            "ident": self.get_ident(request),
+        }
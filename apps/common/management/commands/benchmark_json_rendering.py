@@ -0,0 +1,131 @@
+"""Compare stdlib and orjson rendering/parsing of large list payloads."""
+
+import io
+import statistics
+import time
+from datetime import timedelta
+from unittest import mock
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework import serializers
+
+from apps.common.configs.classes import (
+    common_parsers_classes,
+    common_renderers_classes,
+)
+from apps.common.configs.classes.common_parsers_classes import HatchupJSONParser
+from apps.common.configs.classes.common_renderers_classes import HatchupJSONRenderer
+from apps.notification.apis.serializers import NotificationSerializer
+from apps.notification.models.notification_models import Notification
+
+
+def _page(items: list) -> dict:
+    return {
+        "message": "Request was successful",
+        "status": 200,
+        "pagination": {"next_cursor": "eyJyIjowfQ", "total_items": None},
+        "data": items,
+    }
+
+
+def _notifications(count: int) -> list:
+    now = timezone.now()
+    return NotificationSerializer(
+        [
+            Notification(
+                id=i,
+                title=f"Scheduled maintenance #{i}",
+                message="The platform will be unavailable for a short while. " * 3,
+                data={"link": f"/status/{i}", "severity": "info"},
+                created_at=now - timedelta(minutes=i),
+                expires_at=now + timedelta(days=7),
+                is_global=True,
+            )
+            for i in range(count)
+        ],
+        many=True,
+    ).data
+
+
+def _messages(count: int) -> list:
+    # Shaped like `MessageSerializer` output; built directly because the
+    # nested sender summary would hit the database.
+    now, as_string = timezone.now(), serializers.DateTimeField().to_representation
+    senders = [
+        {
+            "id": pk,
+            "email": f"user{pk}@example.com",
+            "first_name": "Jane",
+            "last_name": "Doe",
+            "role_names": ["Client"],
+        }
+        for pk in (1, 2)
+    ]
+    return [
+        {
+            "id": i,
+            "conversation": 1,
+            "sender": senders[i % 2],
+            "content": f"Message {i}: sounds good, see you then ✔",
+            "file": None,
+            "created_at": as_string(now - timedelta(seconds=i)),
+        }
+        for i in range(count)
+    ]
+
+
+class Command(BaseCommand):
+    help = (
+        "Time HatchupJSONRenderer/HatchupJSONParser with the stdlib and orjson "
+        "backends on large notification and message list payloads."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--items", type=int, default=1000)
+        parser.add_argument("--repeat", type=int, default=50)
+
+    def _time(self, func, repeat: int) -> float:
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - started)
+        return statistics.median(timings) * 1000
+
+    def handle(self, *args, **options):
+        if common_renderers_classes.orjson is None:
+            raise CommandError("orjson is not installed; nothing to compare.")
+
+        renderer, parser = HatchupJSONRenderer(), HatchupJSONParser()
+        for label, items in (
+            ("notifications", _notifications(options["items"])),
+            ("messages", _messages(options["items"])),
+        ):
+            payload = _page(items)
+            for backend in ("stdlib", "orjson"):
+                with (
+                    mock.patch.object(
+                        common_renderers_classes,
+                        "orjson",
+                        common_renderers_classes.orjson
+                        if backend == "orjson"
+                        else None,
+                    ),
+                    mock.patch.object(
+                        common_parsers_classes,
+                        "orjson",
+                        common_parsers_classes.orjson if backend == "orjson" else None,
+                    ),
+                ):
+                    body = renderer.render(payload)
+                    render_ms = self._time(
+                        lambda: renderer.render(payload), options["repeat"]
+                    )
+                    parse_ms = self._time(
+                        lambda: parser.parse(io.BytesIO(body)), options["repeat"]
+                    )
+                self.stdout.write(
+                    f"{label:<14} {backend:<7} render={render_ms:8.2f}ms "
+                    f"parse={parse_ms:8.2f}ms bytes={len(body)}"
+                )
@@ -0,0 +1,162 @@
+"""Compare model serializers with fast list serializers on full list pages."""
+
+import statistics
+import time
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Prefetch
+from rest_framework.test import APIRequestFactory
+
+from apps.messaging.apis.serializers import (
+    ConversationInboxSerializer,
+    FastConversationListSerializer,
+    FastMessageListSerializer,
+    MessageSerializer,
+)
+from apps.messaging.models.messaging_models import (
+    Conversation,
+    ConversationParticipant,
+    Message,
+)
+from apps.notification.apis.serializers import (
+    FastNotificationListSerializer,
+    NotificationSerializer,
+)
+from apps.notification.models.notification_models import Notification, NotificationUser
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        "Time ModelSerializer vs FastListSerializer rendering of notification, "
+        "conversation and message pages (queries included). Fixture rows are "
+        "created in a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--items", type=int, default=200)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def _time(self, func, repeat: int) -> float:
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - started)
+        return statistics.median(timings) * 1000
+
+    def _fixtures(self, items: int):
+        role = Group.objects.get_or_create(name="Benchmark Role")[0]
+        users = [
+            User.objects.create(
+                email=f"bench{i}@example.com", phone_number=f"99000000{i:02d}"
+            )
+            for i in range(10)
+        ]
+        for user in users:
+            user.roles.add(role)
+        conversations = Conversation.objects.bulk_create(
+            [Conversation(created_by=users[0]) for _ in range(items)]
+        )
+        ConversationParticipant.objects.bulk_create(
+            [
+                ConversationParticipant(conversation=conversation, user=user)
+                for i, conversation in enumerate(conversations)
+                for user in (users[0], users[1 + i % 9])
+            ]
+        )
+        Message.objects.bulk_create(
+            [
+                Message(
+                    conversation=conversations[0],
+                    sender=users[i % 2],
+                    content=f"Message {i}",
+                )
+                for i in range(items)
+            ]
+        )
+        Notification.objects.bulk_create(
+            [
+                Notification(title=f"n{i}", message="m" * 80, is_global=True)
+                for i in range(items)
+            ]
+        )
+        return users[0], conversations[0]
+
+    def handle(self, *args, **options):
+        items, repeat = options["items"], options["repeat"]
+        with transaction.atomic():
+            user, conversation = self._fixtures(items)
+            request = APIRequestFactory().get("/")
+            request.user = user
+            context = {"request": request}
+
+            notifications = Notification.objects.order_by("-created_at", "-id")[:items]
+            inbox = ConversationParticipant.objects.filter(user=user).order_by(
+                "-last_message_at", "-id"
+            )[:items]
+            messages = (
+                conversation.messages.select_related("sender")
+                .prefetch_related("sender__roles")
+                .order_by("created_at")[:items]
+            )
+            cases = (
+                (
+                    "notifications",
+                    lambda: (
+                        NotificationSerializer(
+                            notifications.prefetch_related(
+                                Prefetch(
+                                    "user_states",
+                                    queryset=NotificationUser.objects.filter(user=user),
+                                    to_attr="state_for_user",
+                                )
+                            ),
+                            many=True,
+                            context=context,
+                        ).data
+                    ),
+                    FastNotificationListSerializer,
+                    notifications,
+                ),
+                (
+                    "conversations",
+                    lambda: (
+                        ConversationInboxSerializer(
+                            inbox.prefetch_related("conversation__participants__roles"),
+                            many=True,
+                            context=context,
+                        ).data
+                    ),
+                    FastConversationListSerializer,
+                    inbox,
+                ),
+                (
+                    "messages",
+                    lambda: (
+                        MessageSerializer(messages, many=True, context=context).data
+                    ),
+                    FastMessageListSerializer,
+                    messages,
+                ),
+            )
+            for label, slow, fast_class, queryset in cases:
+
+                def fast():
+                    serializer = fast_class(context=context)
+                    return serializer.to_representation(
+                        serializer.values_queryset(queryset)
+                    )
+
+                slow_ms = self._time(slow, repeat)
+                fast_ms = self._time(fast, repeat)
+                self.stdout.write(
+                    f"{label:<14} model={slow_ms:8.2f}ms fast={fast_ms:8.2f}ms "
+                    f"speedup={slow_ms / fast_ms:5.1f}x "
+                    f"({items / fast_ms * 1000:,.0f} rows/s)"
+                )
+            transaction.set_rollback(True)
@@ -0,0 +1,66 @@
+"""Load-test the sliding-window rate limiter against the configured cache."""
+
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.common.utils.common_rate_limit_utils import hit
+
+
+class Command(BaseCommand):
+    help = (
+        "Hammer common_rate_limit_utils.hit from --threads threads over --keys "
+        "keys and report decisions/s and how many hits each key admitted "
+        "against --limit. Uses the default cache (LocMem stands in for Redis "
+        "locally); keys are unique per run."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--threads", type=int, default=8)
+        parser.add_argument("--keys", type=int, default=100)
+        parser.add_argument("--hits", type=int, default=20000)
+        parser.add_argument("--limit", type=int, default=50)
+        parser.add_argument("--window", type=float, default=60.0)
+
+    def handle(self, *args, **options):
+        run = uuid.uuid4().hex[:8]
+        keys = [f"bench:{run}:{i}" for i in range(options["keys"])]
+        per_thread = options["hits"] // options["threads"]
+        admitted = [0] * len(keys)
+        lock = threading.Lock()
+
+        def worker(offset: int) -> None:
+            local = [0] * len(keys)
+            for i in range(per_thread):
+                index = (offset + i) % len(keys)
+                if hit(keys[index], options["limit"], options["window"]).allowed:
+                    local[index] += 1
+            with lock:
+                for index, count in enumerate(local):
+                    admitted[index] += count
+
+        threads = [
+            threading.Thread(target=worker, args=(offset,))
+            for offset in range(options["threads"])
+        ]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        total = per_thread * options["threads"]
+        self.stdout.write(
+            f"cache={settings.CACHES['default']['BACKEND'].rsplit('.', 1)[-1]} "
+            f"threads={options['threads']} {total:,} decisions in "
+            f"{elapsed * 1000:.0f}ms ({total / elapsed:,.0f}/s, "
+            f"{elapsed / total * 1e6:.1f}us each)"
+        )
+        self.stdout.write(
+            f"admitted per key: min={min(admitted)} max={max(admitted)} "
+            f"limit={options['limit']} (rejected {total - sum(admitted):,})"
+        )
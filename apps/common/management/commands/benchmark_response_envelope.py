@@ -0,0 +1,96 @@
+"""Measure the per-request cost of the success envelope."""
+
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from apps.common.apis.views.common_base_views import HatchupAPIView
+
+
+def _payload(items: int) -> dict:
+    return {
+        "items": [
+            {"id": i, "title": f"Item {i}", "is_read": bool(i % 2)}
+            for i in range(items)
+        ]
+    }
+
+
+class _Plain(APIView):
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    payload: dict = {}
+
+    def get(self, request):
+        return Response(self.payload)
+
+
+class _Legacy(_Plain):
+    """The previous approach: a second `Response` per request."""
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        new_response = Response(
+            {
+                "message": "Request was successful",
+                "status": response.status_code,
+                "pagination": None,
+                "data": response.data,
+            },
+            status=response.status_code,
+        )
+        new_response.accepted_renderer = response.accepted_renderer
+        new_response.accepted_media_type = response.accepted_media_type
+        new_response.renderer_context = response.renderer_context
+        return new_response
+
+
+class _Enveloped(HatchupAPIView):
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    payload: dict = {}
+
+    def get(self, request):
+        return Response(self.payload)
+
+
+class Command(BaseCommand):
+    help = (
+        "Time dispatch + render of the same payload through a plain APIView, the "
+        "legacy copying finalize_response envelope and the in-place envelope of "
+        "the Hatchup base views."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=5000)
+        parser.add_argument("--items", type=int, default=10)
+
+    def handle(self, *args, **options):
+        payload = _payload(options["items"])
+        request = APIRequestFactory().get("/bench/")
+        results = {}
+        for label, view_class in (
+            ("plain", _Plain),
+            ("legacy", _Legacy),
+            ("in_place", _Enveloped),
+        ):
+            view_class.payload = payload
+            view = view_class.as_view()
+            timings = []
+            for _ in range(options["requests"]):
+                started = time.perf_counter()
+                view(request).render()
+                timings.append(time.perf_counter() - started)
+            results[label] = statistics.median(timings) * 1_000_000
+
+        for label, median_us in results.items():
+            overhead = median_us - results["plain"]
+            self.stdout.write(
+                f"{label:<9} median={median_us:8.1f}us/request "
+                f"envelope_overhead={overhead:+7.1f}us"
+            )
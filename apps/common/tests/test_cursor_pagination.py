@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import base64
+import json
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.common.configs.classes.common_paginators_classes import (
+    HatchupCursorPagination,
+)
+from apps.notification.apis.views import NotificationViewSet
+from apps.notification.models.notification_models import Notification
+
+User = get_user_model()
+
+
+class HatchupCursorPaginationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create(
+            email="cursor@test.com", phone_number="1000001301"
+        )
+        self.notifications = [
+            Notification.objects.create(title=f"n{i}", message="m", is_global=True)
+            for i in range(5)
+        ]
+        # Ties on created_at must be broken by id, never skipped or repeated.
+        Notification.objects.filter(
+            pk__in=[n.pk for n in self.notifications[1:4]]
+        ).update(created_at=timezone.now())
+        self.expected = list(
+            Notification.objects.order_by("-created_at", "-id").values_list(
+                "id", flat=True
+            )
+        )
+        self.view = NotificationViewSet.as_view({"get": "list"})
+
+    def _get(self, url):
+        request = APIRequestFactory().get(url)
+        force_authenticate(request, user=self.user)
+        response = self.view(request)
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_walks_forward_and_back_without_counting(self):
+        seen, pages = [], []
+        url = "/api/notifications/?page_size=2"
+        while url:
+            body = self._get(url)
+            self.assertEqual(set(body), {"message", "status", "pagination", "data"})
+            self.assertIsNone(body["pagination"]["total_items"])
+            pages.append(body)
+            seen += [item["id"] for item in body["data"]]
+            url = body["pagination"]["links"]["next"]
+        self.assertEqual(seen, self.expected)
+        self.assertIsNone(pages[0]["pagination"]["links"]["previous"])
+
+        back = self._get(pages[-1]["pagination"]["links"]["previous"])
+        self.assertEqual(back["data"], pages[-2]["data"])
+
+    def test_invalid_cursor_is_404(self):
+        request = APIRequestFactory().get("/api/notifications/?cursor=bogus")
+        force_authenticate(request, user=self.user)
+        self.assertEqual(self.view(request).status_code, 404)
+
+    def test_tampered_cursors_are_404(self):
+        now = timezone.now().isoformat()
+        for raw in (
+            {"r": 0, "k": "garbage", "p": 1},
+            {"r": 0, "k": now, "p": {"x": 1}},
+            {"r": 0, "k": now, "p": "not-an-id"},
+            {"r": 0, "k": [now], "p": 1},
+            {"r": 0, "k": None, "p": 1},
+            ["r", "k", "p"],
+        ):
+            with self.subTest(raw=raw):
+                cursor = base64.urlsafe_b64encode(json.dumps(raw).encode()).decode()
+                request = Request(APIRequestFactory().get("/", {"cursor": cursor}))
+                with self.assertRaises(NotFound):
+                    HatchupCursorPagination().paginate_queryset(
+                        Notification.objects.all(), request
+                    )
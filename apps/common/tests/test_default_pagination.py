@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.common.configs.classes.common_paginators_classes import DefaultPagination
+from apps.common.configs.constants.type_enums import TypeScopeChoices
+from apps.common.models.common_type_models import Type
+
+
+class DefaultPaginationCountModeTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        Type.objects.bulk_create(
+            [Type(title=f"Type {i}", scope=TypeScopeChoices.DOCUMENT) for i in range(5)]
+        )
+        self.queryset = Type.objects.order_by("pk")
+
+    def _page(self, query, queryset=None):
+        paginator = DefaultPagination()
+        request = Request(APIRequestFactory().get(f"/types/?page_size=2&{query}"))
+        rows = paginator.paginate_queryset(
+            self.queryset if queryset is None else queryset, request
+        )
+        return rows, paginator.get_paginated_response([]).data["pagination"]
+
+    def test_exact_count_is_cached_across_pages(self):
+        _, pagination = self._page("page=1")
+        self.assertEqual(pagination["total_items"], 5)
+        self.assertEqual(pagination["total_pages"], 3)
+        with self.assertNumQueries(1):
+            rows, pagination = self._page("page=3")
+        self.assertEqual(len(rows), 1)
+        self.assertIsNone(pagination["links"]["next"])
+
+    def test_none_mode_skips_count(self):
+        with self.assertNumQueries(1):
+            rows, pagination = self._page("page=2&count=none")
+        self.assertEqual(len(rows), 2)
+        self.assertIsNone(pagination["total_items"])
+        self.assertIn("page=3", pagination["links"]["next"])
+        self.assertEqual(pagination["current_page"], 2)
+
+        with self.assertNumQueries(1):
+            _, pagination = self._page("page=3&count=none")
+        self.assertIsNone(pagination["links"]["next"])
+
+    def test_estimate_never_reports_fewer_rows_than_seen(self):
+        _, pagination = self._page("page=2&count=estimate")
+        self.assertGreaterEqual(pagination["total_items"], 5)
+        self.assertGreaterEqual(pagination["total_pages"], 3)
+
+    def test_empty_querysets_give_an_empty_page(self):
+        for queryset in (self.queryset.none(), self.queryset.filter(pk__in=[])):
+            for mode in ("exact", "estimate", "none"):
+                with self.subTest(mode=mode):
+                    rows, pagination = self._page(f"count={mode}", queryset)
+                    self.assertEqual(rows, [])
+                    self.assertIsNone(pagination)
+
+    def test_time_filtered_counts_are_not_cached(self):
+        queryset = self.queryset.filter(created_at__lte=timezone.now())
+        self._page("page=1", queryset)
+        with self.assertNumQueries(2):
+            self._page("page=2", queryset)
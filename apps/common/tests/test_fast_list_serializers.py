@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Prefetch
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.common.configs.classes.common_renderers_classes import HatchupJSONRenderer
+from apps.messaging.apis.serializers import (
+    ConversationInboxSerializer,
+    FastConversationListSerializer,
+    FastMessageListSerializer,
+    MessageSerializer,
+)
+from apps.messaging.apis.views import ConversationViewSet
+from apps.messaging.models.messaging_models import (
+    Conversation,
+    ConversationParticipant,
+    Message,
+)
+from apps.notification.apis.serializers import (
+    FastNotificationListSerializer,
+    NotificationSerializer,
+)
+from apps.notification.apis.views import NotificationViewSet
+from apps.notification.configs.constants.notification_enums import (
+    NotificationCategoryChoices,
+)
+from apps.notification.models.notification_models import Notification, NotificationUser
+
+User = get_user_model()
+
+
+class FastListSerializerSnapshotTests(TestCase):
+    """The fast serializers must render byte-identical JSON to the model ones."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create(
+            email="fast@test.com", phone_number="1000001801", first_name="Fast"
+        )
+        self.other = User.objects.create(
+            email="other@test.com", phone_number="1000001802", last_name="Other"
+        )
+        for name in ("Startup", "Admin"):
+            self.user.roles.add(Group.objects.create(name=name))
+        self.request = APIRequestFactory().get("/")
+        self.request.user = self.user
+        self.context = {"request": self.request}
+
+    def assertSameJSON(self, fast_items, slow_items):
+        renderer = HatchupJSONRenderer()
+        self.assertEqual(fast_items, slow_items)
+        self.assertEqual(renderer.render(fast_items), renderer.render(slow_items))
+
+    def _conversation(self):
+        conversation = Conversation.objects.create(
+            created_by=self.user, last_message_at=timezone.now()
+        )
+        for user in (self.user, self.other):
+            ConversationParticipant.objects.create(conversation=conversation, user=user)
+        return conversation
+
+    def test_notifications(self):
+        now = timezone.now()
+        read = Notification.objects.create(
+            title="Read",
+            message="m",
+            category=NotificationCategoryChoices.choices[-1][0],
+            data={"link": "/x", "n": [1, 2]},
+            expires_at=now + timedelta(days=1),
+            is_global=True,
+        )
+        Notification.objects.create(title="Unread", message="m", is_global=True)
+        NotificationUser.objects.create(notification=read, user=self.user, read_at=now)
+
+        queryset = Notification.objects.order_by("-created_at", "-id")
+        fast = FastNotificationListSerializer(context=self.context)
+        slow = NotificationSerializer(
+            queryset.prefetch_related(
+                Prefetch(
+                    "user_states",
+                    queryset=NotificationUser.objects.filter(user=self.user),
+                    to_attr="state_for_user",
+                )
+            ),
+            many=True,
+            context=self.context,
+        )
+        self.assertSameJSON(
+            fast.to_representation(fast.values_queryset(queryset)), slow.data
+        )
+
+    def test_conversations(self):
+        self._conversation()
+        self._conversation().participant_links.filter(user=self.other).delete()
+
+        queryset = ConversationParticipant.objects.filter(user=self.user).order_by(
+            "-last_message_at", "-id"
+        )
+        fast = FastConversationListSerializer(context=self.context)
+        slow = ConversationInboxSerializer(
+            queryset.prefetch_related("conversation__participants__roles"),
+            many=True,
+            context=self.context,
+        )
+        self.assertSameJSON(
+            fast.to_representation(fast.values_queryset(queryset)), slow.data
+        )
+
+    def test_messages(self):
+        conversation = self._conversation()
+        Message.objects.create(conversation=conversation, sender=self.user, content="a")
+        Message.objects.create(
+            conversation=conversation,
+            sender=self.other,
+            content="",
+            file="messages/1/report.pdf",
+        )
+
+        queryset = conversation.messages.order_by("created_at", "id")
+        fast = FastMessageListSerializer(context=self.context)
+        slow = MessageSerializer(queryset, many=True, context=self.context)
+        self.assertSameJSON(
+            fast.to_representation(fast.values_queryset(queryset)), slow.data
+        )
+
+    def _list_queries(self, viewset, url) -> tuple[int, int]:
+        request = APIRequestFactory().get(url)
+        force_authenticate(request, user=self.user)
+        with CaptureQueriesContext(connection) as queries:
+            response = viewset.as_view({"get": "list"})(request)
+        self.assertEqual(response.status_code, 200)
+        return len(response.data["data"]), len(queries)
+
+    def test_list_actions_use_a_constant_number_of_queries(self):
+        for _ in range(3):
+            self._conversation()
+        Notification.objects.bulk_create(
+            [Notification(title=f"n{i}", message="m", is_global=True) for i in range(5)]
+        )
+        cases = (
+            (ConversationViewSet, "/api/messaging/conversations/", 3),
+            (NotificationViewSet, "/api/notifications/", 5),
+        )
+        for viewset, url, total in cases:
+            with self.subTest(viewset=viewset.__name__):
+                # Warm per-user caches (roles, counts) so only the page varies.
+                self._list_queries(viewset, f"{url}?page_size=1")
+                one = self._list_queries(viewset, f"{url}?page_size=1")
+                every = self._list_queries(viewset, f"{url}?page_size=50")
+                self.assertEqual((one[0], every[0]), (1, total))
+                self.assertEqual(one[1], every[1])
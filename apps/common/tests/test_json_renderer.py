@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import io
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest import mock, skipUnless
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from djmoney.money import Money
+from rest_framework.exceptions import ParseError
+
+from apps.common.configs.classes import (
+    common_parsers_classes,
+    common_renderers_classes,
+)
+from apps.common.configs.classes.common_parsers_classes import HatchupJSONParser
+from apps.common.configs.classes.common_renderers_classes import HatchupJSONRenderer
+
+PAYLOAD = {
+    "id": uuid.UUID("2f1c9a4e-8a8e-4d5b-9d3c-2a6f5f1b7c10"),
+    "price": Money(Decimal("1000.50"), "USD"),
+    "amount": Decimal("12.30"),
+    "created_at": datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc),
+    "label": gettext_lazy("Title"),
+    "text": "line break é",
+    1: None,
+}
+
+
+def _stdlib_render(data, **kwargs):
+    with mock.patch.object(common_renderers_classes, "orjson", None):
+        return HatchupJSONRenderer().render(data, **kwargs)
+
+
+class HatchupJSONRendererTests(SimpleTestCase):
+    def test_stdlib_fallback_encodes_extended_types(self):
+        self.assertEqual(
+            _stdlib_render(PAYLOAD),
+            b'{"id":"2f1c9a4e-8a8e-4d5b-9d3c-2a6f5f1b7c10","price":"1000.50 USD",'
+            b'"amount":12.3,"created_at":"2026-01-02T03:04:05.678901Z",'
+            b'"label":"Title","text":"line\\u2028break \xc3\xa9","1":null}',
+        )
+
+    @skipUnless(common_renderers_classes.orjson, "orjson is not installed")
+    def test_orjson_output_matches_stdlib(self):
+        self.assertEqual(HatchupJSONRenderer().render(PAYLOAD), _stdlib_render(PAYLOAD))
+
+    def test_indented_render_uses_stdlib(self):
+        rendered = HatchupJSONRenderer().render(
+            {"a": 1}, "application/json; indent=2", {}
+        )
+        self.assertEqual(rendered, b'{\n  "a": 1\n}')
+
+
+class HatchupJSONParserTests(SimpleTestCase):
+    def _parse(self, body: bytes):
+        return HatchupJSONParser().parse(io.BytesIO(body), "application/json", {})
+
+    def test_parses_with_and_without_orjson(self):
+        body = '{"title": "café", "ids": [1, 2]}'.encode()
+        expected = {"title": "café", "ids": [1, 2]}
+        self.assertEqual(self._parse(body), expected)
+        with mock.patch.object(common_parsers_classes, "orjson", None):
+            self.assertEqual(self._parse(body), expected)
+
+    def test_invalid_json_is_a_parse_error(self):
+        for body in (b"{", b'{"a": NaN}'):
+            with self.subTest(body=body), self.assertRaises(ParseError):
+                self._parse(body)
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from apps.common.configs.classes.common_throttles_classes import (
+    SlidingWindowRateThrottle,
+)
+from apps.common.utils.common_rate_limit_utils import hit
+
+WINDOW = 60.0
+START = 6000 * WINDOW  # aligned with a window boundary
+
+
+class SlidingWindowRateLimitTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def _admitted(self, key: str, hits: int, now: float) -> int:
+        return sum(hit(key, 10, WINDOW, now=now).allowed for _ in range(hits))
+
+    def test_limit_within_a_window(self):
+        self.assertEqual(self._admitted("a", 15, START + 1), 10)
+
+        decision = hit("a", 10, WINDOW, now=START + 1)
+        self.assertFalse(decision.allowed)
+        # Next window starts in 59s; then the old hits must decay below the limit.
+        self.assertAlmostEqual(decision.retry_after, 59.0)
+        self.assertTrue(hit("b", 10, WINDOW, now=START + 1).allowed)
+
+    def test_previous_window_is_weighted_by_overlap(self):
+        self._admitted("a", 10, START + 59)
+
+        # A quarter into the next window, 3/4 of the previous 10 hits still count.
+        self.assertEqual(self._admitted("a", 10, START + WINDOW + 15), 3)
+        self.assertEqual(self._admitted("a", 10, START + 3 * WINDOW), 10)
+
+    def test_rejected_hits_are_not_counted(self):
+        self._admitted("a", 100, START)
+        self.assertEqual(self._admitted("a", 10, START + WINDOW + 30), 5)
+
+    def test_memory_per_key_is_two_counters(self):
+        self._admitted("a", 100, START + 59)
+        self._admitted("a", 100, START + WINDOW + 1)
+        self.assertEqual(len(cache._cache), 2)
+
+
+class SlidingWindowRateParsingTests(SimpleTestCase):
+    def test_rates_accept_period_multipliers(self):
+        parse = SlidingWindowRateThrottle.parse_rate
+        self.assertEqual(parse(None, "10/15m"), (10, 900))
+        self.assertEqual(parse(None, "60/hour"), (60, 3600))
+        self.assertEqual(parse(None, "5/s"), (5, 1))
+        self.assertEqual(parse(None, None), (None, None))
+        with self.assertRaises(ValueError):
+            parse(None, "5/fortnight")
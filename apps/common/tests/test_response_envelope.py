@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import json
+
+from django.test import SimpleTestCase
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from apps.common.apis.views.common_base_views import HatchupAPIView
+
+
+class _EchoView(HatchupAPIView):
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    payload = {"id": 1}
+
+    def get(self, request):
+        if request.query_params.get("fail"):
+            raise ValidationError({"id": ["bad"]})
+        return Response(self.payload)
+
+
+class _PlainView(APIView):
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        return Response({"id": 1})
+
+
+class ResponseEnvelopeTests(SimpleTestCase):
+    def _render(self, view, url="/"):
+        response = view.as_view()(APIRequestFactory().get(url))
+        response.render()
+        return response, json.loads(response.content)
+
+    def test_dict_payload_is_wrapped_on_response_data(self):
+        response, body = self._render(_EchoView)
+        expected = {
+            "message": "Request was successful",
+            "status": 200,
+            "pagination": None,
+            "data": {"id": 1},
+        }
+        # The renderer only serializes what the view left on `response.data`.
+        self.assertEqual(response.data, expected)
+        self.assertEqual(body, expected)
+
+    def test_errors_and_enveloped_payloads_are_untouched(self):
+        _, body = self._render(_EchoView, "/?fail=1")
+        self.assertEqual(body, {"id": ["bad"]})
+
+        enveloped = {"message": "m", "status": 200, "pagination": {}, "data": []}
+        _EchoView.payload = enveloped
+        try:
+            _, body = self._render(_EchoView)
+        finally:
+            _EchoView.payload = {"id": 1}
+        self.assertEqual(body, enveloped)
+
+    def test_other_views_are_not_wrapped(self):
+        _, body = self._render(_PlainView)
+        self.assertEqual(body, {"id": 1})
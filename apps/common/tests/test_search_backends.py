@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from unittest import mock, skipUnless
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.test import TestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.common.utils.common_search_utils import (
+    AutoSearchBackend,
+    get_search_backend,
+)
+from apps.notification.apis.views import NotificationViewSet
+from apps.notification.models.notification_models import Notification
+
+User = get_user_model()
+
+
+class SearchBackendTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create(
+            email="search@test.com", phone_number="1000001501"
+        )
+        self.announcement = Notification.objects.create(
+            title="Quarterly announcement",
+            message="Investor reporting opens next week",
+            is_global=True,
+        )
+        self.reminder = Notification.objects.create(
+            title="Reminder", message="Upload your pitch deck", is_global=True
+        )
+
+    def _search(self, backend, query, fields=("title", "message")):
+        return list(
+            get_search_backend(backend).filter(
+                Notification.objects.all(), query, fields
+            )
+        )
+
+    def test_list_endpoint_applies_search(self):
+        request = APIRequestFactory().get("/api/notifications/?search=pitch")
+        force_authenticate(request, user=self.user)
+        response = NotificationViewSet.as_view({"get": "list"})(request)
+        self.assertEqual(
+            [item["id"] for item in response.data["data"]], [self.reminder.id]
+        )
+
+    def test_detail_routes_ignore_search(self):
+        request = APIRequestFactory().get(
+            f"/api/notifications/{self.announcement.id}/?search=pitch"
+        )
+        force_authenticate(request, user=self.user)
+        response = NotificationViewSet.as_view({"get": "retrieve"})(
+            request, pk=self.announcement.id
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_icontains_matches_any_field(self):
+        self.assertEqual(self._search("icontains", "INVESTOR"), [self.announcement])
+
+    def test_unknown_backend_is_rejected(self):
+        with self.assertRaises(ImproperlyConfigured):
+            get_search_backend("elastic")
+
+    def test_keyset_paginated_views_search_unranked(self):
+        request = APIRequestFactory().get("/api/notifications/?search=pitch")
+        force_authenticate(request, user=self.user)
+        with mock.patch.object(
+            AutoSearchBackend, "filter", side_effect=lambda qs, *a, **kw: qs
+        ) as search:
+            NotificationViewSet.as_view({"get": "list"})(request)
+        self.assertIs(search.call_args.kwargs["ranked"], False)
+
+    @skipUnless(connection.vendor == "postgresql", "full-text search needs Postgres")
+    def test_unranked_search_only_filters(self):
+        results = get_search_backend("fulltext").filter(
+            Notification.objects.all(), "investors", ("title", "message"), ranked=False
+        )
+        self.assertNotIn("search_rank", results.query.annotations)
+        self.assertEqual(list(results), [self.announcement])
+
+    @skipUnless(connection.vendor == "postgresql", "full-text search needs Postgres")
+    def test_fulltext_stems_and_ranks(self):
+        results = self._search("fulltext", "investors reports")
+        self.assertEqual(results, [self.announcement])
+        self.assertGreater(results[0].search_rank, 0)
+
+    @skipUnless(connection.vendor == "postgresql", "pg_trgm needs Postgres")
+    def test_trigram_matches_partial_words(self):
+        self.assertEqual(self._search("trigram", "announce"), [self.announcement])
@@ -0,0 +1,85 @@
+"""
+Process-local caching helpers used in front of the shared (Redis) cache.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Hashable, Optional
+
+_MISSING = object()
+
+
+@dataclass
+class LocalCacheStats:
+    hits: int = 0
+    misses: int = 0
+    # Entries dropped to respect `maxsize` (LRU order).
+    evictions: int = 0
+    # Entries dropped because their TTL elapsed.
+    expirations: int = 0
+    # Entries dropped explicitly (signals, invalidation hooks).
+    invalidations: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+class LocalLRUCache:
+    """
+    Bounded, TTL'd, thread-safe in-process LRU cache.
+
+    Intended as a tier-1 cache in front of `django.core.cache.cache`: lookups cost
+    no network round-trip, `maxsize` bounds memory per worker and `ttl` bounds
+    how long another process' write can go unnoticed.
+    """
+
+    def __init__(self, *, maxsize: int = 1024, ttl: float = 5.0) -> None:
+        self.maxsize = max(int(maxsize), 0)
+        self.ttl = float(ttl)
+        self.stats = LocalCacheStats()
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                self.stats.misses += 1
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.stats.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        if self.maxsize == 0:
+            return
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.stats.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            if self._data.pop(key, _MISSING) is not _MISSING:
+                self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self.stats.invalidations += len(self._data)
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
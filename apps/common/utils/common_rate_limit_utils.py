@@ -0,0 +1,126 @@
+"""
+Sliding-window rate limiting on the shared cache.
+
+Each limited key costs two integer counters (the current and the previous
+fixed window), so memory per key is constant however much traffic it sees.
+The number of hits in the last `window` seconds is estimated as
+
+    previous * (1 - elapsed / window) + current
+
+(the previous window's hits taken as evenly spread), which removes the double
+burst a plain fixed window allows around its boundary. A hit is admitted while
+the estimate is below `limit`. Rejected hits are not counted, so a client that
+backs off recovers as the window slides.
+
+- Redis (django-redis default cache): one Lua script call per hit, atomic.
+- Any other cache (LocMem in tests and local load tests): `get_many` then
+  `add`/`incr`; concurrent hits on one key may overshoot `limit` by the number
+  of racing requests.
+
+Cache failures admit the request (fail open): throttling must not take the
+authentication endpoints down with the cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import time
+from dataclasses import dataclass
+
+from django.core.cache import cache
+
+from apps.auth.services.revocation import redis_client
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_CACHE_KEY_PREFIX = "ratelimit"
+
+# KEYS: current window, previous window. ARGV: limit, previous weight, ttl.
+_HIT_SCRIPT = """
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+if previous * tonumber(ARGV[2]) + current >= tonumber(ARGV[1]) then
+  return {0, current, previous}
+end
+current = redis.call('INCR', KEYS[1])
+if current == 1 then redis.call('EXPIRE', KEYS[1], ARGV[3]) end
+return {1, current, previous}
+"""
+_hit_script = None
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    allowed: bool
+    # Seconds until a hit would be admitted again (0 when allowed).
+    retry_after: float = 0.0
+
+
+def _window_key(key: str, index: int) -> str:
+    # Hashed: bounded key size, and no emails/IPs in cache key names.
+    digest = hashlib.sha256(key.encode()).hexdigest()[:32]
+    return f"{RATE_LIMIT_CACHE_KEY_PREFIX}:{digest}:{index}"
+
+
+def _retry_after(
+    limit: int, window: float, elapsed: float, current: int, previous: int
+) -> float:
+    if current >= limit:
+        # Wait for the next window, then for these hits' weight to decay.
+        return window - elapsed + window * (1 - limit / current)
+    # previous * (1 - t / window) + current < limit
+    return max(window * (1 - (limit - current) / previous) - elapsed, 0.0)
+
+
+def _redis_hit(client, keys: list[str], limit: int, weight: float, ttl: int):
+    global _hit_script
+    if _hit_script is None or _hit_script.registered_client is not client:
+        _hit_script = client.register_script(_HIT_SCRIPT)
+    allowed, current, previous = _hit_script(
+        keys=[cache.make_key(key) for key in keys], args=[limit, repr(weight), ttl]
+    )
+    return bool(allowed), int(current), int(previous)
+
+
+def _cache_hit(keys: list[str], limit: int, weight: float, ttl: int):
+    counts = cache.get_many(keys)
+    current, previous = counts.get(keys[0], 0), counts.get(keys[1], 0)
+    if previous * weight + current >= limit:
+        return False, current, previous
+    cache.add(keys[0], 0, timeout=ttl)
+    try:
+        current = cache.incr(keys[0])
+    except ValueError:  # expired since `add`
+        cache.set(keys[0], 1, timeout=ttl)
+        current = 1
+    return True, current, previous
+
+
+def hit(
+    key: str, limit: int, window: float, now: float | None = None
+) -> RateLimitDecision:
+    """Record a hit on `key` unless it already made `limit` hits in `window` seconds."""
+
+    now = time.time() if now is None else now
+    index, elapsed = divmod(now, window)
+    index = int(index)
+    weight = 1 - elapsed / window
+    keys = [_window_key(key, index), _window_key(key, index - 1)]
+    # The current window is read as "previous" during the next one.
+    ttl = math.ceil(2 * window)
+    try:
+        client = redis_client()
+        if client is not None:
+            allowed, current, previous = _redis_hit(client, keys, limit, weight, ttl)
+        else:
+            allowed, current, previous = _cache_hit(keys, limit, weight, ttl)
+    except Exception as exc:  # pragma: no cover - dependent on external service
+        logger.warning("Rate limit check failed, admitting request: %s", exc)
+        return RateLimitDecision(True)
+    if allowed:
+        return RateLimitDecision(True)
+    return RateLimitDecision(
+        False, _retry_after(limit, window, elapsed, current, previous)
+    )
@@ -0,0 +1,145 @@
+"""
+Search backends behind `_SearchableQuerysetMixin` (`?search=`).
+
+Views pick one with `search_backend`:
+- "icontains": OR of `field__icontains` (no ranking). Runs everywhere and is
+  the fallback for the others off PostgreSQL.
+- "fulltext":  `websearch_to_tsquery` against the model's stored
+  `search_vector` column (GIN-indexed), or a `SearchVector` over
+  `search_fields` when the model has none. Ranked by `ts_rank`.
+- "trigram":   `pg_trgm` word similarity per field (typos, partial words).
+  Each field should carry a GIN `gin_trgm_ops` index on `UPPER(field)` (see
+  `trigram_index`), which also serves `icontains`. Ranked by similarity.
+- "auto":      trigram for single-word queries, full-text otherwise.
+
+Ranked backends annotate `search_rank` and order by it first, keeping the
+queryset's own ordering as the tie-breaker. With `ranked=False` they only
+filter: views whose paginator imposes its own order (keyset pagination
+re-orders by time) would compute the rank per row and then discard it.
+"""
+
+from __future__ import annotations
+
+from functools import reduce
+from operator import or_
+from typing import Sequence
+
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    TrigramWordSimilarity,
+)
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.db import connections
+from django.db.models import F, Q, QuerySet
+from django.db.models.functions import Greatest, Upper
+
+FULLTEXT_SEARCH_CONFIG = "english"
+SEARCH_VECTOR_FIELD = "search_vector"
+SEARCH_RANK_ANNOTATION = "search_rank"
+
+
+def trigram_index(field: str, name: str) -> GinIndex:
+    """GIN trigram index on `UPPER(field)`: serves trigram and `icontains`."""
+
+    return GinIndex(OpClass(Upper(field), name="gin_trgm_ops"), name=name)
+
+
+def _is_postgres(queryset: QuerySet) -> bool:
+    return connections[queryset.db].vendor == "postgresql"
+
+
+def _ranked(queryset: QuerySet, rank, ranked: bool) -> QuerySet:
+    if not ranked:
+        return queryset
+    ordering = queryset.query.order_by or queryset.model._meta.ordering
+    return queryset.annotate(**{SEARCH_RANK_ANNOTATION: rank}).order_by(
+        f"-{SEARCH_RANK_ANNOTATION}", *ordering
+    )
+
+
+class IContainsSearchBackend:
+    def filter(
+        self, queryset: QuerySet, query: str, fields: Sequence[str], ranked: bool = True
+    ):
+        return queryset.filter(
+            reduce(or_, (Q(**{f"{field}__icontains": query}) for field in fields))
+        )
+
+
+class FullTextSearchBackend:
+    def filter(
+        self, queryset: QuerySet, query: str, fields: Sequence[str], ranked: bool = True
+    ):
+        if not _is_postgres(queryset):
+            return IContainsSearchBackend().filter(queryset, query, fields)
+        search_query = SearchQuery(
+            query, config=FULLTEXT_SEARCH_CONFIG, search_type="websearch"
+        )
+        try:
+            queryset.model._meta.get_field(SEARCH_VECTOR_FIELD)
+        except FieldDoesNotExist:
+            queryset = queryset.alias(
+                **{
+                    SEARCH_VECTOR_FIELD: SearchVector(
+                        *fields, config=FULLTEXT_SEARCH_CONFIG
+                    )
+                }
+            )
+        return _ranked(
+            queryset.filter(**{SEARCH_VECTOR_FIELD: search_query}),
+            SearchRank(F(SEARCH_VECTOR_FIELD), search_query),
+            ranked,
+        )
+
+
+class TrigramSearchBackend:
+    def filter(
+        self, queryset: QuerySet, query: str, fields: Sequence[str], ranked: bool = True
+    ):
+        if not _is_postgres(queryset):
+            return IContainsSearchBackend().filter(queryset, query, fields)
+        # Match on UPPER(field) so the `trigram_index` expression is used.
+        aliases = {f"_trgm_{i}": Upper(field) for i, field in enumerate(fields)}
+        queryset = queryset.alias(**aliases).filter(
+            reduce(
+                or_,
+                (Q(**{f"{alias}__trigram_word_similar": query}) for alias in aliases),
+            )
+        )
+        similarities = [
+            TrigramWordSimilarity(query.upper(), F(alias)) for alias in aliases
+        ]
+        return _ranked(
+            queryset,
+            similarities[0] if len(similarities) == 1 else Greatest(*similarities),
+            ranked,
+        )
+
+
+class AutoSearchBackend:
+    def filter(
+        self, queryset: QuerySet, query: str, fields: Sequence[str], ranked: bool = True
+    ):
+        if len(query.split()) == 1:
+            return TrigramSearchBackend().filter(queryset, query, fields, ranked)
+        return FullTextSearchBackend().filter(queryset, query, fields, ranked)
+
+
+SEARCH_BACKENDS = {
+    "icontains": IContainsSearchBackend,
+    "fulltext": FullTextSearchBackend,
+    "trigram": TrigramSearchBackend,
+    "auto": AutoSearchBackend,
+}
+
+
+def get_search_backend(name: str):
+    try:
+        return SEARCH_BACKENDS[name]()
+    except KeyError:
+        raise ImproperlyConfigured(
+            f"Unknown search backend {name!r}; expected one of {sorted(SEARCH_BACKENDS)}."
+        )
@@ -24,9 +24,23 @@ class ConversationAdmin(_HatchUpBaseAdmin):
 
 @admin.register(ConversationParticipant, site=admin_site)
 class ConversationParticipantAdmin(_HatchUpBaseAdmin):
-    list_display = ("id", "conversation", "user", "created_at", "is_active")
+    list_display = (
+        "id",
+        "conversation",
+        "user",
+        "unread_count",
+        "last_message_at",
+        "created_at",
+        "is_active",
+    )
     list_filter = _HatchUpBaseAdmin.list_filter
     search_fields = ("conversation__id", "user__email")
+    readonly_fields = _HatchUpBaseAdmin.readonly_fields + (
+        "last_read_message",
+        "unread_count",
+        "last_message_at",
+        "last_message_snippet",
+    )
     autocomplete_fields = ("conversation", "user")
     list_select_related = ("conversation", "user")
 
@@ -1,6 +1,11 @@
 from .messaging_serializers import (
     ConversationCreateSerializer,
+    ConversationInboxSerializer,
+    ConversationReadSerializer,
     ConversationSerializer,
+    FastConversationListSerializer,
+    FastMessageListSerializer,
+    FastUserSummarySerializer,
     MessageCreateSerializer,
     MessageSerializer,
     UserSummarySerializer,
@@ -8,7 +13,12 @@ from .messaging_serializers import (
 
 __all__ = [
     "ConversationCreateSerializer",
+    "ConversationInboxSerializer",
+    "ConversationReadSerializer",
     "ConversationSerializer",
+    "FastConversationListSerializer",
+    "FastMessageListSerializer",
+    "FastUserSummarySerializer",
     "MessageCreateSerializer",
     "MessageSerializer",
     "UserSummarySerializer",
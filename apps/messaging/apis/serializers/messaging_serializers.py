@@ -1,31 +1,41 @@
 from __future__ import annotations
 
+from collections import defaultdict
+
 from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
 from django.db.models import Count
 from rest_framework import serializers
 
+from apps.common.apis.serializers.fast import FastListSerializer
 from apps.common.apis.serializers.fields import Base64FileField
-from apps.auth.services.roles import get_user_roles, is_platform_admin
+from apps.auth.configs.constants.roles import RoleName
+from apps.auth.services.authorization_context import (
+    AuthorizationContext,
+    get_authorization_context,
+)
 from apps.messaging.models.messaging_models import (
     Conversation,
     ConversationParticipant,
     Message,
 )
+from apps.messaging.services.inbox_service import record_message
 
 User = get_user_model()
 
 
-def _role_flags(user) -> tuple[bool, bool, bool]:
-    roles = get_user_roles(user)
-    is_admin = bool(is_platform_admin(user) or "Admin" in roles)
-    is_startup = "Startup" in roles
-    is_investor = "Investor" in roles
+def _role_flags(authz: AuthorizationContext) -> tuple[bool, bool, bool]:
+    is_admin = authz.is_admin
+    is_startup = authz.has_role(RoleName.STARTUP)
+    is_investor = authz.has_role(RoleName.INVESTOR)
     return is_admin, is_startup, is_investor
 
 
-def _allowed_conversation(user_a, user_b) -> bool:
-    a_admin, a_startup, a_investor = _role_flags(user_a)
-    b_admin, b_startup, b_investor = _role_flags(user_b)
+def _allowed_conversation(
+    authz_a: AuthorizationContext, authz_b: AuthorizationContext
+) -> bool:
+    a_admin, a_startup, a_investor = _role_flags(authz_a)
+    b_admin, b_startup, b_investor = _role_flags(authz_b)
 
     if a_admin and b_admin:
         return False
@@ -44,7 +54,8 @@ class UserSummarySerializer(serializers.ModelSerializer):
         fields = ("id", "email", "first_name", "last_name", "role_names")
 
     def get_role_names(self, obj) -> list[str]:
-        return list(obj.groups.values_list("name", flat=True))
+        # `.all()` reads `prefetch_related("...__roles")` when the view did it.
+        return sorted(role.name for role in obj.roles.all())
 
 
 class ConversationSerializer(serializers.ModelSerializer):
@@ -55,6 +66,71 @@ class ConversationSerializer(serializers.ModelSerializer):
         fields = ("id", "participants", "last_message_at", "created_at")
 
 
+class FastUserSummarySerializer(FastListSerializer):
+    serializer_class = UserSummarySerializer
+
+    def fill_computed(self, rows, items):
+        role_names = defaultdict(list)
+        for user_id, name in Group.objects.filter(
+            user__in=[row["id"] for row in rows]
+        ).values_list("user", "name"):
+            role_names[user_id].append(name)
+        for item in items:
+            item["role_names"] = sorted(role_names[item["id"]])
+
+    def summaries(self, user_ids) -> dict[int, dict]:
+        rows = self.values_queryset(User.objects.filter(pk__in=set(user_ids)))
+        return {item["id"]: item for item in self.to_representation(rows)}
+
+
+class ConversationInboxSerializer(serializers.ModelSerializer):
+    """A conversation as seen from one participant's inbox row."""
+
+    id = serializers.IntegerField(source="conversation_id", read_only=True)
+    participants = UserSummarySerializer(
+        source="conversation.participants", many=True, read_only=True
+    )
+    created_at = serializers.DateTimeField(
+        source="conversation.created_at", read_only=True
+    )
+    last_read_message_id = serializers.IntegerField(read_only=True, allow_null=True)
+
+    class Meta:
+        model = ConversationParticipant
+        fields = (
+            "id",
+            "participants",
+            "last_message_at",
+            "created_at",
+            "last_message_snippet",
+            "unread_count",
+            "last_read_message_id",
+        )
+        read_only_fields = fields
+
+
+class FastConversationListSerializer(FastListSerializer):
+    """`ConversationInboxSerializer` output from `.values()` rows (list action)."""
+
+    serializer_class = ConversationInboxSerializer
+
+    def fill_computed(self, rows, items):
+        # Same order as the `participants` manager: the user model's ordering.
+        links = list(
+            User.objects.filter(conversations__in=[item["id"] for item in items])
+            .order_by(*User._meta.ordering)
+            .values_list("conversations", "pk")
+        )
+        summaries = FastUserSummarySerializer(context=self.context).summaries(
+            user_id for _, user_id in links
+        )
+        participants = defaultdict(list)
+        for conversation_id, user_id in links:
+            participants[conversation_id].append(summaries[user_id])
+        for item in items:
+            item["participants"] = participants[item["id"]]
+
+
 class ConversationCreateSerializer(serializers.ModelSerializer):
     participant_id = serializers.IntegerField(write_only=True, min_value=1)
     participants = UserSummarySerializer(many=True, read_only=True)
@@ -90,7 +166,9 @@ class ConversationCreateSerializer(serializers.ModelSerializer):
         except User.DoesNotExist:
             raise serializers.ValidationError({"participant_id": "User not found."})
 
-        if not _allowed_conversation(request.user, participant):
+        if not _allowed_conversation(
+            get_authorization_context(request), AuthorizationContext(participant)
+        ):
             raise serializers.ValidationError(
                 "Conversations are only allowed between admin and startup or admin and investor."
             )
@@ -133,6 +211,20 @@ class MessageSerializer(serializers.ModelSerializer):
         read_only_fields = ("id", "created_at", "sender", "conversation")
 
 
+class FastMessageListSerializer(FastListSerializer):
+    """`MessageSerializer` output from `.values()` rows (messages action)."""
+
+    serializer_class = MessageSerializer
+    extra_values = ("sender_id",)
+
+    def fill_computed(self, rows, items):
+        summaries = FastUserSummarySerializer(context=self.context).summaries(
+            row["sender_id"] for row in rows
+        )
+        for row, item in zip(rows, items):
+            item["sender"] = summaries[row["sender_id"]]
+
+
 class MessageCreateSerializer(serializers.ModelSerializer):
     content = serializers.CharField(required=False, allow_blank=True)
     file = Base64FileField(required=False, allow_null=True)
@@ -176,4 +268,15 @@ class MessageCreateSerializer(serializers.ModelSerializer):
         )
         conversation.last_message_at = message.created_at
         conversation.save(update_fields=["last_message_at", "updated_at"])
+        record_message(message)
         return message
+
+
+class ConversationReadSerializer(serializers.Serializer):
+    message_id = serializers.IntegerField(required=False, min_value=1)
+
+    def validate_message_id(self, value: int) -> int:
+        conversation = self.context["conversation"]
+        if not Message.objects.filter(pk=value, conversation=conversation).exists():
+            raise serializers.ValidationError("Message not found in this conversation.")
+        return value
@@ -1,27 +1,42 @@
 from __future__ import annotations
 
+from django.db.models import prefetch_related_objects
 from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
-from drf_spectacular.utils import extend_schema, extend_schema_view
+from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
 
 from apps.common.apis.views.common_base_views import HatchupModelViewset
+from apps.common.configs.classes.common_paginators_classes import (
+    HatchupCursorPagination,
+)
 from apps.messaging.apis.serializers.messaging_serializers import (
     ConversationCreateSerializer,
+    ConversationInboxSerializer,
+    ConversationReadSerializer,
     ConversationSerializer,
+    FastConversationListSerializer,
+    FastMessageListSerializer,
     MessageCreateSerializer,
     MessageSerializer,
 )
-from apps.messaging.models.messaging_models import Conversation
+from apps.messaging.models.messaging_models import (
+    Conversation,
+    ConversationParticipant,
+)
+from apps.messaging.services.inbox_service import mark_conversation_read
 
 
 @extend_schema_view(
     list=extend_schema(
         tags=["Messaging"],
         summary="List conversations",
-        description="List conversations for the authenticated user.",
-        responses={200: ConversationSerializer(many=True)},
+        description=(
+            "List the authenticated user's inbox, most recent activity first, "
+            "with unread counts and a preview of the last message."
+        ),
+        responses={200: ConversationInboxSerializer(many=True)},
     ),
     retrieve=extend_schema(
         tags=["Messaging"],
@@ -44,18 +59,28 @@ class ConversationViewSet(HatchupModelViewset):
     serializer_class = ConversationSerializer
     permission_classes = [IsAuthenticated]
     http_method_names = ["get", "post", "head", "options"]
+    # Used by `?search=` on the messages action.
+    search_backend = "auto"
+    fast_list_serializer_class = FastConversationListSerializer
 
     def get_queryset(self):
         user = self.request.user
+        if self.action == "list":
+            # The inbox: one range scan of the user's participant rows.
+            return ConversationParticipant.objects.filter(
+                user=user, conversation__is_active=True, conversation__is_deleted=False
+            ).order_by("-last_message_at", "-id")
         return (
             Conversation.objects.filter(participants__id=user.id)
-            .prefetch_related("participants__groups")
+            .prefetch_related("participants__roles")
             .distinct()
         )
 
     def get_serializer_class(self):
         if self.action == "create":
             return ConversationCreateSerializer
+        if self.action == "list":
+            return ConversationInboxSerializer
         return ConversationSerializer
 
     def create(self, request, *args, **kwargs):
@@ -67,6 +92,7 @@ class ConversationViewSet(HatchupModelViewset):
             if getattr(serializer, "_existing", False)
             else status.HTTP_201_CREATED
         )
+        prefetch_related_objects([conversation], "participants__roles")
         response_serializer = ConversationSerializer(
             conversation, context=self.get_serializer_context()
         )
@@ -76,6 +102,7 @@ class ConversationViewSet(HatchupModelViewset):
         tags=["Messaging"],
         summary="List conversation messages",
         description="List messages in a conversation for a participant.",
+        parameters=[OpenApiParameter("search", str, description="Search content.")],
         responses={200: MessageSerializer(many=True)},
         methods=["GET"],
     )
@@ -92,20 +119,22 @@ class ConversationViewSet(HatchupModelViewset):
         conversation = self.get_object()
 
         if request.method == "GET":
-            qs = (
-                conversation.messages.select_related("sender")
-                .prefetch_related("sender__groups")
-                .order_by("created_at")
+            serializer = FastMessageListSerializer(
+                context=self.get_serializer_context()
+            )
+            qs = self.apply_search_filter(
+                conversation.messages.order_by("created_at"),
+                request,
+                search_fields=("content",),
+                # Paginated by time below: match only, no rank.
+                ranked=False,
             )
-            page = self.paginate_queryset(qs)
-            serializer = MessageSerializer(
-                page if page is not None else qs,
-                many=True,
-                context=self.get_serializer_context(),
+            # Keyset pages: constant cost however far back the history goes.
+            paginator = HatchupCursorPagination(ordering=("created_at", "id"))
+            page = paginator.paginate_queryset(
+                serializer.values_queryset(qs), request, view=self
             )
-            if page is not None:
-                return self.get_paginated_response(serializer.data)
-            return Response(serializer.data)
+            return paginator.get_paginated_response(serializer.to_representation(page))
 
         context = self.get_serializer_context()
         context["conversation"] = conversation
@@ -116,3 +145,44 @@ class ConversationViewSet(HatchupModelViewset):
             MessageSerializer(message, context=self.get_serializer_context()).data,
             status=status.HTTP_201_CREATED,
         )
+
+    @extend_schema(
+        tags=["Messaging"],
+        summary="Mark conversation as read",
+        description=(
+            "Move the user's read marker to `message_id` (default: the latest "
+            "message). The marker never moves backwards."
+        ),
+        request=ConversationReadSerializer(),
+        responses={
+            200: {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "integer"},
+                    "last_read_message_id": {"type": "integer", "nullable": True},
+                    "unread_count": {"type": "integer"},
+                },
+                "required": ["id", "last_read_message_id", "unread_count"],
+            },
+        },
+    )
+    @action(detail=True, methods=["post"], url_path="read")
+    def mark_read(self, request, pk=None):
+        conversation = self.get_object()
+        serializer = ConversationReadSerializer(
+            data=request.data or {}, context={"conversation": conversation}
+        )
+        serializer.is_valid(raise_exception=True)
+        participant = mark_conversation_read(
+            ConversationParticipant.objects.get(
+                conversation=conversation, user=request.user
+            ),
+            serializer.validated_data.get("message_id"),
+        )
+        return Response(
+            {
+                "id": conversation.id,
+                "last_read_message_id": participant.last_read_message_id,
+                "unread_count": participant.unread_count,
+            }
+        )
@@ -0,0 +1,30 @@
+"""Recompute the denormalized inbox fields of conversation participants."""
+
+from django.core.management.base import BaseCommand
+
+from apps.messaging.services.inbox_service import REBUILD_BATCH_SIZE, rebuild_inbox
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute last_message_at, last_message_snippet and unread_count of "
+        "ConversationParticipant rows from messages. Run once after adding the "
+        "inbox fields, and to repair drift."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--conversation",
+            action="append",
+            type=int,
+            dest="conversation_ids",
+            help="Rebuild only this conversation id (repeatable).",
+        )
+        parser.add_argument("--batch-size", type=int, default=REBUILD_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        updated = rebuild_inbox(
+            conversation_ids=options["conversation_ids"],
+            batch_size=options["batch_size"],
+        )
+        self.stdout.write(f"Participant rows rebuilt: {updated}")
@@ -4,9 +4,12 @@ import os
 import uuid
 
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
 
 from apps.common.models.common_base_models import HatchUpBaseModel
+from apps.common.utils.common_search_utils import FULLTEXT_SEARCH_CONFIG
 
 
 def message_file_upload_to(instance: "Message", filename: str) -> str:
@@ -53,6 +56,17 @@ class ConversationParticipant(HatchUpBaseModel):
         on_delete=models.CASCADE,
         related_name="conversation_links",
     )
+    # Per-user inbox state, maintained by `services.inbox_service`.
+    last_read_message = models.ForeignKey(
+        "messaging.Message",
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="+",
+    )
+    unread_count = models.PositiveIntegerField(default=0)
+    last_message_at = models.DateTimeField(null=True, blank=True)
+    last_message_snippet = models.CharField(max_length=140, blank=True)
 
     class Meta:
         verbose_name = "Conversation Participant"
@@ -62,6 +76,13 @@ class ConversationParticipant(HatchUpBaseModel):
                 fields=("conversation", "user"), name="uniq_conversation_participant"
             )
         ]
+        indexes = [
+            # The inbox: a user's conversations, most recent activity first.
+            models.Index(
+                fields=("user", "-last_message_at", "-id"),
+                name="conv_participant_inbox_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"Conversation {self.conversation_id} -> User {self.user_id}"
@@ -84,11 +105,25 @@ class Message(HatchUpBaseModel):
         null=True,
         blank=True,
     )
+    # Stored tsvector for `?search=` (see common_search_utils).
+    search_vector = models.GeneratedField(
+        expression=SearchVector("content", config=FULLTEXT_SEARCH_CONFIG),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
 
     class Meta:
         verbose_name = "Message"
         verbose_name_plural = "Messages"
         ordering = ["created_at"]
+        indexes = [
+            # Keyset pagination of a conversation's history.
+            models.Index(
+                fields=("conversation", "created_at", "id"),
+                name="message_conv_created_id_idx",
+            ),
+            GinIndex(fields=("search_vector",), name="message_search_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"Message {self.id} in Conversation {self.conversation_id}"
@@ -0,0 +1,155 @@
+"""
+Denormalized conversation inbox state on `ConversationParticipant`.
+
+Each participant row carries the conversation's `last_message_at`, a
+`last_message_snippet` (the first characters of the latest message) and the
+user's `unread_count` / `last_read_message`. The inbox is then a single
+indexed scan of `(user, -last_message_at)`: no DISTINCT join over
+participants and no message fetches for previews or badges.
+
+- `record_message` runs in the sending transaction: one UPDATE of the
+  conversation's participant rows (the sender's count resets to zero).
+- `mark_conversation_read` moves the read marker forward and recounts.
+- `rebuild_inbox` recomputes everything from messages (backfill / repair).
+
+Unread means "sent by someone else, with an id above the read marker".
+"""
+
+from __future__ import annotations
+
+from django.db import transaction
+from django.db.models import (
+    BigIntegerField,
+    Case,
+    Count,
+    F,
+    OuterRef,
+    Q,
+    Subquery,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce, Greatest, Left
+from django.utils import timezone
+
+from apps.messaging.models.messaging_models import ConversationParticipant, Message
+
+MESSAGE_SNIPPET_LENGTH = ConversationParticipant._meta.get_field(
+    "last_message_snippet"
+).max_length
+REBUILD_BATCH_SIZE = 500
+
+
+def message_snippet(content: str) -> str:
+    # Same as `Left(content, n)` in `rebuild_inbox`.
+    return (content or "")[:MESSAGE_SNIPPET_LENGTH]
+
+
+def record_message(message: Message) -> int:
+    """Fold a just-created message into its participants' inbox rows."""
+
+    is_newer = Q(last_message_at__isnull=True) | Q(
+        last_message_at__lte=message.created_at
+    )
+    return ConversationParticipant.objects.filter(
+        conversation_id=message.conversation_id
+    ).update(
+        # Concurrent sends may commit out of order: never move backwards.
+        last_message_at=Case(
+            When(is_newer, then=Value(message.created_at)),
+            default=F("last_message_at"),
+        ),
+        last_message_snippet=Case(
+            When(is_newer, then=Value(message_snippet(message.content))),
+            default=F("last_message_snippet"),
+        ),
+        unread_count=Case(
+            When(user_id=message.sender_id, then=Value(0)),
+            default=F("unread_count") + 1,
+        ),
+        last_read_message_id=Case(
+            When(
+                user_id=message.sender_id,
+                then=Greatest(Coalesce(F("last_read_message_id"), 0), message.pk),
+            ),
+            default=F("last_read_message_id"),
+            output_field=BigIntegerField(),
+        ),
+        updated_at=timezone.now(),
+    )
+
+
+def _unread_messages(participant: ConversationParticipant, after_id: int | None):
+    return Message.objects.filter(
+        conversation_id=participant.conversation_id, id__gt=after_id or 0
+    ).exclude(sender_id=participant.user_id)
+
+
+def mark_conversation_read(
+    participant: ConversationParticipant, message_id: int | None = None
+) -> ConversationParticipant:
+    """
+    Mark the conversation read up to `message_id` (default: the latest
+    message). The marker only moves forward; returns the refreshed row.
+    """
+
+    with transaction.atomic():
+        participant = ConversationParticipant.objects.select_for_update().get(
+            pk=participant.pk
+        )
+        if message_id is None:
+            message_id = (
+                Message.objects.filter(conversation_id=participant.conversation_id)
+                .order_by("-id")
+                .values_list("id", flat=True)
+                .first()
+            )
+        if message_id is not None and message_id > (
+            participant.last_read_message_id or 0
+        ):
+            participant.last_read_message_id = message_id
+        participant.unread_count = _unread_messages(
+            participant, participant.last_read_message_id
+        ).count()
+        participant.save(
+            update_fields=["last_read_message", "unread_count", "updated_at"]
+        )
+    return participant
+
+
+def rebuild_inbox(conversation_ids=None, batch_size: int = REBUILD_BATCH_SIZE) -> int:
+    """Recompute inbox fields from messages; returns the rows updated."""
+
+    latest = Message.objects.filter(
+        conversation_id=OuterRef("conversation_id")
+    ).order_by("-created_at", "-id")
+    unread = (
+        Message.objects.filter(
+            conversation_id=OuterRef("conversation_id"),
+            id__gt=Coalesce(OuterRef("last_read_message_id"), 0),
+        )
+        .exclude(sender_id=OuterRef("user_id"))
+        .order_by()
+        .values("conversation_id")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    participants = ConversationParticipant.objects.all()
+    if conversation_ids is not None:
+        participants = participants.filter(conversation_id__in=conversation_ids)
+
+    ids = list(participants.order_by("pk").values_list("pk", flat=True))
+    updated = 0
+    for start in range(0, len(ids), batch_size):
+        updated += ConversationParticipant.objects.filter(
+            pk__in=ids[start : start + batch_size]
+        ).update(
+            last_message_at=Subquery(latest.values("created_at")[:1]),
+            last_message_snippet=Coalesce(
+                Left(Subquery(latest.values("content")[:1]), MESSAGE_SNIPPET_LENGTH),
+                Value(""),
+            ),
+            unread_count=Coalesce(Subquery(unread), 0),
+            updated_at=timezone.now(),
+        )
+    return updated
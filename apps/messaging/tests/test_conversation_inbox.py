@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.auth.services import roles as roles_service
+from apps.messaging.apis.views import ConversationViewSet
+from apps.messaging.models.messaging_models import (
+    Conversation,
+    ConversationParticipant,
+    Message,
+)
+from apps.messaging.services.inbox_service import (
+    MESSAGE_SNIPPET_LENGTH,
+    rebuild_inbox,
+    record_message,
+)
+
+User = get_user_model()
+
+
+class ConversationInboxTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        roles_service.reset_role_cache()
+        self.alice = User.objects.create(email="alice@inbox.com", phone_number="1")
+        self.bob = User.objects.create(email="bob@inbox.com", phone_number="2")
+        self.older = self._conversation()
+        self.conversation = self._conversation()
+
+    def _conversation(self):
+        conversation = Conversation.objects.create(created_by=self.alice)
+        for user in (self.alice, self.bob):
+            ConversationParticipant.objects.create(conversation=conversation, user=user)
+        return conversation
+
+    def _call(self, actions, user, method="get", data=None, **kwargs):
+        factory = APIRequestFactory()
+        if method == "get":
+            request = factory.get("/", data)
+        else:
+            request = factory.post("/", data or {}, format="json")
+        force_authenticate(request, user=user)
+        return ConversationViewSet.as_view(actions)(request, **kwargs)
+
+    def _send(self, user, content, conversation=None):
+        conversation = conversation or self.conversation
+        response = self._call(
+            {"post": "messages"},
+            user,
+            method="post",
+            data={"content": content},
+            pk=conversation.pk,
+        )
+        self.assertEqual(response.status_code, 201)
+        return response.data["data"]["id"]
+
+    def _state(self, user, conversation=None):
+        return ConversationParticipant.objects.get(
+            conversation=conversation or self.conversation, user=user
+        )
+
+    def test_sending_updates_every_participant_row(self):
+        self._send(self.alice, "hello")
+        last_id = self._send(self.alice, "x" * 500)
+
+        bob, alice = self._state(self.bob), self._state(self.alice)
+        self.assertEqual((bob.unread_count, alice.unread_count), (2, 0))
+        self.assertEqual(alice.last_read_message_id, last_id)
+        self.assertEqual(bob.last_message_snippet, "x" * MESSAGE_SNIPPET_LENGTH)
+        self.assertEqual(bob.last_message_at, alice.last_message_at)
+        self.assertIsNotNone(bob.last_message_at)
+
+    def test_inbox_lists_recent_activity_first_without_distinct(self):
+        self._send(self.alice, "first", conversation=self.older)
+        self._send(self.alice, "latest")
+        self._send(self.bob, "reply", conversation=self.older)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self._call({"get": "list"}, self.bob)
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(any("DISTINCT" in q["sql"] for q in queries.captured_queries))
+
+        rows = response.data["data"]
+        self.assertEqual(
+            [row["id"] for row in rows], [self.older.pk, self.conversation.pk]
+        )
+        self.assertEqual(
+            [(row["last_message_snippet"], row["unread_count"]) for row in rows],
+            [("reply", 0), ("latest", 1)],
+        )
+        self.assertEqual(
+            {p["id"] for p in rows[0]["participants"]}, {self.alice.pk, self.bob.pk}
+        )
+
+    def test_read_marker_moves_forward_only(self):
+        first = self._send(self.alice, "one")
+        self._send(self.alice, "two")
+
+        response = self._call(
+            {"post": "mark_read"}, self.bob, method="post", pk=self.conversation.pk
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["data"]["unread_count"], 0)
+        latest = response.data["data"]["last_read_message_id"]
+
+        response = self._call(
+            {"post": "mark_read"},
+            self.bob,
+            method="post",
+            data={"message_id": first},
+            pk=self.conversation.pk,
+        )
+        self.assertEqual(
+            (
+                response.data["data"]["last_read_message_id"],
+                response.data["data"]["unread_count"],
+            ),
+            (latest, 0),
+        )
+
+    def test_late_commit_does_not_move_the_senders_marker_back(self):
+        first = self._send(self.alice, "one")
+        latest = self._send(self.alice, "two")
+
+        # The first send's inbox update committing after the second's.
+        record_message(Message.objects.get(pk=first))
+        self.assertEqual(self._state(self.alice).last_read_message_id, latest)
+
+    def test_read_marker_rejects_foreign_messages(self):
+        other = self._send(self.alice, "elsewhere", conversation=self.older)
+        response = self._call(
+            {"post": "mark_read"},
+            self.bob,
+            method="post",
+            data={"message_id": other},
+            pk=self.conversation.pk,
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_rebuild_recomputes_from_messages(self):
+        self._send(self.alice, "one")
+        self._send(self.bob, "two")
+        expected = {
+            (row.user_id, row.unread_count, row.last_message_snippet)
+            for row in ConversationParticipant.objects.all()
+        }
+        ConversationParticipant.objects.update(
+            unread_count=99, last_message_snippet="", last_message_at=None
+        )
+
+        self.assertEqual(rebuild_inbox(batch_size=1), 4)
+        self.assertEqual(
+            {
+                (row.user_id, row.unread_count, row.last_message_snippet)
+                for row in ConversationParticipant.objects.all()
+            },
+            expected,
+        )
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
+from django.core.cache import cache
 from django.test import TestCase
 from rest_framework.test import APIClient
 
 from apps.auth.configs.constants.roles import RoleName
+from apps.auth.services import roles as roles_service
 
 User = get_user_model()
 
@@ -36,16 +38,18 @@ class MessagingConversationRuleTests(TestCase):
             Group.objects.get_or_create(name=role.value)
 
     def setUp(self):
+        cache.clear()
+        roles_service.reset_role_cache()
         self.client = APIClient()
 
         self.admin = make_user(email="admin@test.com", phone="1000000100")
-        self.admin.groups.add(Group.objects.get(name=RoleName.ADMIN.value))
+        self.admin.roles.add(Group.objects.get(name=RoleName.ADMIN.value))
 
         self.startup = make_user(email="startup@test.com", phone="1000000101")
-        self.startup.groups.add(Group.objects.get(name=RoleName.STARTUP.value))
+        self.startup.roles.add(Group.objects.get(name=RoleName.STARTUP.value))
 
         self.investor = make_user(email="investor@test.com", phone="1000000102")
-        self.investor.groups.add(Group.objects.get(name=RoleName.INVESTOR.value))
+        self.investor.roles.add(Group.objects.get(name=RoleName.INVESTOR.value))
 
     def _payload_data(self, response):
         body = response.json()
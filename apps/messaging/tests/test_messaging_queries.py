@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.auth.services import roles as roles_service
+from apps.messaging.apis.serializers import ConversationSerializer, MessageSerializer
+from apps.messaging.apis.views import ConversationViewSet
+from apps.messaging.models.messaging_models import (
+    Conversation,
+    ConversationParticipant,
+    Message,
+)
+from apps.users.models.users_role_models import UserRole
+
+User = get_user_model()
+
+PAGE_SIZES = (10, 200)
+
+
+class MessagingQueryCountTests(TestCase):
+    """Role names must come from prefetched data, not one query per user."""
+
+    @classmethod
+    def setUpTestData(cls):
+        roles = [Group.objects.create(name=f"Role {i}") for i in range(3)]
+        cls.user = User.objects.create(email="owner@q.com", phone_number="1000001900")
+        cls.others = User.objects.bulk_create(
+            [
+                User(email=f"peer{i}@q.com", phone_number=f"10000019{i:03d}")
+                for i in range(200)
+            ]
+        )
+        UserRole.objects.bulk_create(
+            [
+                UserRole(user=user, role=role)
+                for i, user in enumerate([cls.user, *cls.others])
+                for role in roles[: 1 + i % 3]
+            ]
+        )
+        conversations = Conversation.objects.bulk_create(
+            [Conversation(created_by=cls.user) for _ in cls.others]
+        )
+        ConversationParticipant.objects.bulk_create(
+            [
+                ConversationParticipant(conversation=conversation, user=user)
+                for conversation, other in zip(conversations, cls.others)
+                for user in (cls.user, other)
+            ]
+        )
+        cls.conversation = conversations[0]
+        # One distinct sender per message: the worst case for per-user lookups.
+        Message.objects.bulk_create(
+            [
+                Message(conversation=cls.conversation, sender=sender, content="hi")
+                for sender in cls.others
+            ]
+        )
+
+    def setUp(self):
+        cache.clear()
+        roles_service.reset_role_cache()
+
+    def _queries(self, url: str, actions: dict, **kwargs) -> list[int]:
+        view = ConversationViewSet.as_view(actions)
+        counts = []
+        for page_size in (PAGE_SIZES[0], *PAGE_SIZES):  # first call warms caches
+            request = APIRequestFactory().get(f"{url}?page_size={page_size}")
+            force_authenticate(request, user=self.user)
+            with CaptureQueriesContext(connection) as queries:
+                response = view(request, **kwargs)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(response.data["data"]), page_size)
+            counts.append(len(queries))
+        return counts[1:]
+
+    def test_conversation_list_queries_are_constant(self):
+        small, large = self._queries("/conversations/", {"get": "list"})
+        self.assertEqual(small, large)
+
+    def test_message_list_queries_are_constant(self):
+        small, large = self._queries(
+            "/messages/", {"get": "messages"}, pk=self.conversation.pk
+        )
+        self.assertEqual(small, large)
+
+    def test_model_serializers_read_prefetched_roles(self):
+        request = APIRequestFactory().get("/")
+        request.user = self.user
+        view = ConversationViewSet(
+            request=request, format_kwarg=None, action="retrieve"
+        )
+        for page_size in PAGE_SIZES:
+            with self.subTest(page_size=page_size):
+                conversations = list(view.get_queryset()[:page_size])
+                with self.assertNumQueries(0):
+                    data = ConversationSerializer(conversations, many=True).data
+                self.assertEqual(len(data), page_size)
+
+                messages = list(
+                    self.conversation.messages.select_related("sender")
+                    .prefetch_related("sender__roles")
+                    .order_by("created_at")[:page_size]
+                )
+                with self.assertNumQueries(0):
+                    data = MessageSerializer(messages, many=True).data
+                self.assertTrue(all(item["sender"]["role_names"] for item in data))
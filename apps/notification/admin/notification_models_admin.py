@@ -1,10 +1,13 @@
 from django.contrib import admin
 
 from apps.common.admins.base import _HatchUpBaseAdmin, admin_site
+from apps.notification.models.notification_email_models import EmailOutbox
 from apps.notification.models.notification_models import (
     Notification,
+    NotificationBroadcastCounter,
     NotificationRoleTarget,
     NotificationUser,
+    NotificationUserCounter,
 )
 
 
@@ -15,11 +18,18 @@ class NotificationAdmin(_HatchUpBaseAdmin):
         "title",
         "category",
         "is_global",
+        "delivery",
+        "email_delivery",
         "expires_at",
         "created_at",
         "is_active",
     )
-    list_filter = _HatchUpBaseAdmin.list_filter + ("category", "is_global")
+    list_filter = _HatchUpBaseAdmin.list_filter + (
+        "category",
+        "is_global",
+        "delivery",
+        "email_delivery",
+    )
     search_fields = ("title", "message", "category")
     date_hierarchy = "created_at"
 
@@ -47,3 +57,57 @@ class NotificationRoleTargetAdmin(_HatchUpBaseAdmin):
     search_fields = ("notification__title", "role__name")
     autocomplete_fields = ("notification", "role")
     list_select_related = ("notification", "role")
+
+
+@admin.register(NotificationUserCounter, site=admin_site)
+class NotificationUserCounterAdmin(_HatchUpBaseAdmin):
+    list_display = (
+        "id",
+        "user",
+        "unread_count",
+        "global_read_count",
+        "stale",
+        "updated_at",
+    )
+    list_filter = _HatchUpBaseAdmin.list_filter + ("stale",)
+    search_fields = ("user__email",)
+    autocomplete_fields = ("user",)
+    list_select_related = ("user",)
+    readonly_fields = _HatchUpBaseAdmin.readonly_fields + (
+        "unread_count",
+        "global_read_count",
+        "stale",
+    )
+
+
+@admin.register(NotificationBroadcastCounter, site=admin_site)
+class NotificationBroadcastCounterAdmin(_HatchUpBaseAdmin):
+    list_display = ("id", "broadcast_count", "updated_at")
+    readonly_fields = _HatchUpBaseAdmin.readonly_fields + ("broadcast_count",)
+
+
+@admin.register(EmailOutbox, site=admin_site)
+class EmailOutboxAdmin(_HatchUpBaseAdmin):
+    list_display = (
+        "id",
+        "subject",
+        "to",
+        "status",
+        "attempts",
+        "next_attempt_at",
+        "sent_at",
+        "created_at",
+    )
+    list_filter = _HatchUpBaseAdmin.list_filter + ("status",)
+    search_fields = ("subject", "to")
+    date_hierarchy = "created_at"
+    # Bodies may carry one-time codes: never shown, and cleared once sent.
+    exclude = ("body",)
+    readonly_fields = _HatchUpBaseAdmin.readonly_fields + (
+        "subject",
+        "from_email",
+        "to",
+        "attempts",
+        "sent_at",
+        "last_error",
+    )
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from rest_framework.permissions import BasePermission
 
-from apps.auth.services.roles import has_any_role, is_platform_admin
+from apps.auth.services.authorization_context import get_authorization_context
 
 
 class NotificationEndpointPermission(BasePermission):
@@ -20,4 +20,4 @@ class NotificationEndpointPermission(BasePermission):
         action = getattr(view, "action", None)
         if action in self.READ_ACTIONS:
             return True
-        return is_platform_admin(request.user) or has_any_role(request.user, ["Admin"])
+        return get_authorization_context(request).is_admin
@@ -1,4 +1,5 @@
 from .notification_serializers import (  # noqa: F401
+    FastNotificationListSerializer,
     MarkAsReadSerializer,
     NotificationAdminCreateSerializer,
     NotificationSerializer,
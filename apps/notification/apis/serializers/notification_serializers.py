@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from django.contrib.auth.models import Group
+from django.db import transaction
 from django.utils import timezone
 from rest_framework import serializers
 
+from apps.common.apis.serializers.fast import FastListSerializer
 from apps.notification.configs.constants.notification_enums import (
     NotificationCategoryChoices,
 )
@@ -12,6 +14,14 @@ from apps.notification.models.notification_models import (
     NotificationRoleTarget,
     NotificationUser,
 )
+from apps.notification.services.email_channel_service import (
+    schedule_notification_emails,
+)
+from apps.notification.services.fanout_service import deliver_notification
+from apps.notification.services.unread_counter_service import (
+    count_read_change,
+    publish_notification,
+)
 from apps.users.models.users_user_models import User
 
 
@@ -50,12 +60,33 @@ class NotificationSerializer(serializers.ModelSerializer):
         return st.read_at if st else None
 
 
+class FastNotificationListSerializer(FastListSerializer):
+    """`NotificationSerializer` output from `.values()` rows (list action)."""
+
+    serializer_class = NotificationSerializer
+
+    def fill_computed(self, rows, items):
+        read_at_by_id = dict(
+            NotificationUser.objects.filter(
+                user=self.context["request"].user,
+                notification_id__in=[row["id"] for row in rows],
+            ).values_list("notification_id", "read_at")
+        )
+        for item in items:
+            read_at = read_at_by_id.get(item["id"])
+            item["is_read"] = bool(read_at)
+            item["read_at"] = read_at
+
+
 class NotificationAdminCreateSerializer(serializers.ModelSerializer):
     """
     Admin payload supports targeting:
     - `is_global=True` -> everyone
     - `target_user_ids=[...]` -> specific users
     - `target_role_names=[...]` -> role-based (Django Group names)
+
+    `send_email=true` (create only) also emails the audience, see
+    `services/email_channel_service.py`.
     """
 
     category = serializers.ChoiceField(
@@ -67,6 +98,9 @@ class NotificationAdminCreateSerializer(serializers.ModelSerializer):
     target_role_names = serializers.ListField(
         child=serializers.CharField(), required=False, allow_empty=True
     )
+    send_email = serializers.BooleanField(
+        required=False, default=False, write_only=True
+    )
 
     class Meta:
         model = Notification
@@ -80,9 +114,11 @@ class NotificationAdminCreateSerializer(serializers.ModelSerializer):
             "expires_at",
             "target_user_ids",
             "target_role_names",
+            "send_email",
+            "email_delivery",
             "created_at",
         )
-        read_only_fields = ("id", "created_at")
+        read_only_fields = ("id", "email_delivery", "created_at")
 
     def validate(self, attrs):
         attrs = super().validate(attrs)
@@ -109,6 +145,7 @@ class NotificationAdminCreateSerializer(serializers.ModelSerializer):
 
         target_user_ids = validated_data.pop("target_user_ids", []) or []
         target_role_names = validated_data.pop("target_role_names", []) or []
+        send_email = validated_data.pop("send_email", False)
 
         notif = Notification.objects.create(created_by=created_by, **validated_data)
 
@@ -127,8 +164,17 @@ class NotificationAdminCreateSerializer(serializers.ModelSerializer):
                 ignore_conflicts=True,
             )
 
+        deliver_notification(notif)
+        publish_notification(notif)
+        if send_email:
+            schedule_notification_emails(notif)
         return notif
 
+    def update(self, instance, validated_data):
+        # Emailing is decided once, at creation.
+        validated_data.pop("send_email", None)
+        return super().update(instance, validated_data)
+
 
 class MarkAsReadSerializer(serializers.Serializer):
     read = serializers.BooleanField(default=True, required=False)
@@ -136,9 +182,15 @@ class MarkAsReadSerializer(serializers.Serializer):
     def save(self, *, user: User, notification: Notification) -> NotificationUser:
         read = bool(self.validated_data.get("read", True))
         now = timezone.now()
-        state, _ = NotificationUser.objects.get_or_create(
-            user=user, notification=notification
-        )
-        state.read_at = now if read else None
-        state.save(update_fields=["read_at", "updated_at"])
+        with transaction.atomic():
+            state, _ = NotificationUser.objects.get_or_create(
+                user=user, notification=notification
+            )
+            # Concurrent marks of the same row must not both see it flip.
+            state = NotificationUser.objects.select_for_update().get(pk=state.pk)
+            was_read = state.read_at is not None
+            state.read_at = now if read else None
+            state.save(update_fields=["read_at", "updated_at"])
+            if notification.counted_in_unread and was_read != read:
+                count_read_change(user.pk, notification, read)
         return state
@@ -3,21 +3,32 @@ from __future__ import annotations
 from django.db import transaction
 from django.db.models import Prefetch
 from django.utils import timezone
-from drf_spectacular.utils import extend_schema, extend_schema_view
+from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from apps.auth.services.roles import has_any_role, is_platform_admin
+from apps.auth.services.authorization_context import get_authorization_context
 from apps.notification.apis.permissions import NotificationEndpointPermission
 from apps.notification.apis.serializers import (
+    FastNotificationListSerializer,
     MarkAsReadSerializer,
     NotificationAdminCreateSerializer,
     NotificationSerializer,
 )
 from apps.notification.models.notification_models import Notification, NotificationUser
+from apps.notification.services.fanout_service import deliver_notification
+from apps.notification.services.unread_counter_service import (
+    get_unread_count,
+    publish_notification,
+    refresh_unread_count,
+    retract_notification,
+)
 
 from apps.common.apis.views.common_base_views import HatchupModelViewset
+from apps.common.configs.classes.common_paginators_classes import (
+    HatchupCursorPagination,
+)
 
 
 def _is_admin_action(view) -> bool:
@@ -25,12 +36,9 @@ def _is_admin_action(view) -> bool:
     return action in {"create", "update", "partial_update", "destroy"}
 
 
-def _is_admin_user(user) -> bool:
-    return bool(
-        user
-        and user.is_authenticated
-        and (is_platform_admin(user) or has_any_role(user, ["Admin"]))
-    )
+def _is_admin_request(request) -> bool:
+    # Memoized on the request; also consulted by NotificationEndpointPermission.
+    return get_authorization_context(request).is_admin
 
 
 @extend_schema_view(
@@ -41,6 +49,9 @@ def _is_admin_user(user) -> bool:
             "List notifications visible to the authenticated user (global, direct targets, "
             "or role-based). Admins see all notifications."
         ),
+        parameters=[
+            OpenApiParameter("search", str, description="Search title and message.")
+        ],
         responses={200: NotificationSerializer(many=True)},
     ),
     retrieve=extend_schema(
@@ -82,10 +93,15 @@ def _is_admin_user(user) -> bool:
 )
 class NotificationViewSet(HatchupModelViewset):
     permission_classes = [IsAuthenticated, NotificationEndpointPermission]
+    pagination_class = HatchupCursorPagination
+    cursor_ordering = ("-created_at", "-id")
+    search_fields = ("title", "message")
+    search_backend = "auto"
+    fast_list_serializer_class = FastNotificationListSerializer
 
     def get_queryset(self):
         user = self.request.user
-        if _is_admin_user(user):
+        if _is_admin_request(self.request):
             qs = Notification.objects.all()
         else:
             qs = Notification.visible_to_user_queryset(user=user)
@@ -104,6 +120,18 @@ class NotificationViewSet(HatchupModelViewset):
             return NotificationAdminCreateSerializer
         return NotificationSerializer
 
+    def perform_update(self, serializer):
+        # Audience or expiry may change: uncount with the old values, recount
+        # with the new ones.
+        retract_notification(serializer.instance)
+        notification = serializer.save()
+        deliver_notification(notification)
+        publish_notification(notification)
+
+    def perform_destroy(self, instance):
+        retract_notification(instance)
+        instance.delete()
+
     @extend_schema(
         tags=["Notifications"],
         summary="Unread count",
@@ -118,14 +146,7 @@ class NotificationViewSet(HatchupModelViewset):
     )
     @action(detail=False, methods=["get"], url_path="unread-count")
     def unread_count(self, request):
-        user = request.user
-        visible = Notification.visible_to_user_queryset(user=user)
-        unread = (
-            visible.exclude(user_states__user=user, user_states__read_at__isnull=False)
-            .distinct()
-            .count()
-        )
-        return Response({"unread_count": unread})
+        return Response({"unread_count": get_unread_count(request.user)})
 
     @extend_schema(
         tags=["Notifications"],
@@ -185,6 +206,7 @@ class NotificationViewSet(HatchupModelViewset):
             )
         )
         if not visible_ids:
+            refresh_unread_count(user.pk)
             return Response({"marked_read": 0})
 
         existing_states = NotificationUser.objects.filter(
@@ -215,5 +237,8 @@ class NotificationViewSet(HatchupModelViewset):
                 NotificationUser.objects.bulk_update(
                     to_update, ["read_at", "updated_at"]
                 )
+            # Expired notifications not yet retracted stay counted; recount
+            # rather than assume zero.
+            refresh_unread_count(user.pk)
 
         return Response({"marked_read": len(to_create) + len(to_update)})
@@ -13,3 +13,33 @@ class NotificationAudienceChoices(models.TextChoices):
     ALL = "all", "All users"
     STARTUP = "startup", "Startup"
     INVESTOR = "investor", "Investor"
+
+
+class NotificationDeliveryChoices(models.TextChoices):
+    # Audience resolved per read (global / role targets joined at query time).
+    READ_TIME = "read_time", "Read time"
+    # Inbox rows are being materialized; still resolved at read time meanwhile.
+    FANOUT_PENDING = "fanout_pending", "Fan-out pending"
+    # Every audience member has a NotificationUser inbox row.
+    FANNED_OUT = "fanned_out", "Fanned out"
+
+
+class NotificationEmailDeliveryChoices(models.TextChoices):
+    # No email channel requested.
+    NONE = "none", "None"
+    # Emails are due (new, or released after a failed run).
+    PENDING = "pending", "Pending"
+    # Claimed by one sender until `email_lease_until`; resumable from
+    # `email_cursor` once the lease expires.
+    SENDING = "sending", "Sending"
+    SENT = "sent", "Sent"
+
+
+class EmailOutboxStatusChoices(models.TextChoices):
+    # Waiting for a worker (first attempt or a scheduled retry).
+    PENDING = "pending", "Pending"
+    # Claimed by a worker until `next_attempt_at` (the lease).
+    SENDING = "sending", "Sending"
+    SENT = "sent", "Sent"
+    # Gave up after `EMAIL_OUTBOX_MAX_ATTEMPTS`.
+    FAILED = "failed", "Failed"
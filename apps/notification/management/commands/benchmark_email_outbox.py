@@ -0,0 +1,138 @@
+"""Compare thread-per-email sending with the email outbox worker pool."""
+
+import threading
+import time
+
+from django.core import mail
+from django.core.mail import get_connection, send_mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.management.base import BaseCommand
+
+from apps.notification.configs.constants.notification_enums import (
+    EmailOutboxStatusChoices,
+)
+from apps.notification.models.notification_email_models import EmailOutbox
+from apps.notification.services.email_outbox_service import EmailWorkerPool
+
+
+class SimulatedSMTPBackend(EmailBackend):
+    """locmem backend with an SMTP-like handshake and per-message latency."""
+
+    connect_seconds = 0.0
+    send_seconds = 0.0
+    connections_opened = 0
+    _counter_lock = threading.Lock()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._is_open = False
+
+    def open(self):
+        if self._is_open:
+            return False
+        time.sleep(self.connect_seconds)
+        with self._counter_lock:
+            SimulatedSMTPBackend.connections_opened += 1
+        self._is_open = True
+        return True
+
+    def close(self):
+        self._is_open = False
+
+    def send_messages(self, messages):
+        new_connection = self.open()
+        try:
+            time.sleep(self.send_seconds * len(messages))
+            return super().send_messages(messages)
+        finally:
+            if new_connection:
+                self.close()
+
+
+BACKEND = f"{__name__}.SimulatedSMTPBackend"
+
+
+class Command(BaseCommand):
+    help = (
+        "Send --emails messages through a locmem backend that simulates SMTP "
+        "handshake/send latency, once with a thread and connection per email "
+        "(the old EmailService behaviour) and once through EmailOutbox rows "
+        "drained by an EmailWorkerPool. Outbox rows are deleted afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--emails", type=int, default=500)
+        parser.add_argument("--workers", type=int, default=4)
+        parser.add_argument("--batch-size", type=int, default=50)
+        parser.add_argument("--connect-ms", type=float, default=20.0)
+        parser.add_argument("--send-ms", type=float, default=1.0)
+
+    def _report(self, label: str, count: int, seconds: float, threads: int) -> None:
+        self.stdout.write(
+            f"{label:<18} {seconds * 1000:9.1f}ms {count / seconds:9,.0f} emails/s "
+            f"threads={threads:<5} "
+            f"connections={SimulatedSMTPBackend.connections_opened}"
+        )
+
+    def _thread_per_email(self, count: int) -> None:
+        SimulatedSMTPBackend.connections_opened = 0
+        started = time.perf_counter()
+        threads = [
+            threading.Thread(
+                target=send_mail,
+                kwargs={
+                    "subject": "Benchmark",
+                    "message": f"Code {i}",
+                    "from_email": "bench@example.com",
+                    "recipient_list": [f"bench{i}@example.com"],
+                    "connection": get_connection(BACKEND),
+                },
+            )
+            for i in range(count)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self._report(
+            "thread-per-email", count, time.perf_counter() - started, len(threads)
+        )
+
+    def _outbox(self, count: int, workers: int, batch_size: int) -> None:
+        emails = EmailOutbox.objects.bulk_create(
+            [
+                EmailOutbox(
+                    subject="Benchmark",
+                    body=f"Code {i}",
+                    from_email="bench@example.com",
+                    to=[f"bench{i}@example.com"],
+                )
+                for i in range(count)
+            ]
+        )
+        ids = [email.pk for email in emails]
+        SimulatedSMTPBackend.connections_opened = 0
+        pool = EmailWorkerPool(
+            workers=workers, batch_size=batch_size, poll_seconds=0.05, backend=BACKEND
+        )
+        try:
+            started = time.perf_counter()
+            pool.wake()
+            pending = EmailOutbox.objects.filter(pk__in=ids).exclude(
+                status=EmailOutboxStatusChoices.SENT
+            )
+            while pending.exists():
+                time.sleep(0.05)
+            elapsed = time.perf_counter() - started
+        finally:
+            pool.stop()
+            EmailOutbox.objects.filter(pk__in=ids).delete()
+        self._report(f"outbox x{workers}", count, elapsed, workers)
+
+    def handle(self, *args, **options):
+        SimulatedSMTPBackend.connect_seconds = options["connect_ms"] / 1000
+        SimulatedSMTPBackend.send_seconds = options["send_ms"] / 1000
+        count = options["emails"]
+        self._thread_per_email(count)
+        self._outbox(count, options["workers"], options["batch_size"])
+        mail.outbox = []
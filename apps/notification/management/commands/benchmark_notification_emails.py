@@ -0,0 +1,91 @@
+"""Compare per-recipient send_mail with the batched notification email channel."""
+
+import time
+
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.mail import get_connection, send_mail
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.notification.configs.constants.notification_enums import (
+    NotificationEmailDeliveryChoices,
+)
+from apps.notification.management.commands.benchmark_email_outbox import (
+    BACKEND,
+    SimulatedSMTPBackend,
+)
+from apps.notification.models.notification_models import Notification
+from apps.notification.services.email_channel_service import (
+    NOTIFICATION_EMAIL_BATCH_SIZE,
+    audience_emails,
+    render_notification_email,
+    send_notification_emails,
+)
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        "Email a global notification to --users fixture users through a locmem "
+        "backend that simulates SMTP latency: once with send_mail per recipient "
+        "(one connection each), once with send_notification_emails (one "
+        "connection, batched send_messages). Fixtures are rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=2000)
+        parser.add_argument(
+            "--batch-size", type=int, default=NOTIFICATION_EMAIL_BATCH_SIZE
+        )
+        parser.add_argument("--connect-ms", type=float, default=20.0)
+        parser.add_argument("--send-ms", type=float, default=0.2)
+
+    def _report(self, label: str, sent: int, seconds: float) -> None:
+        self.stdout.write(
+            f"{label:<22} {sent:>6} emails {seconds * 1000:9.1f}ms "
+            f"{sent / seconds:9,.0f} messages/s "
+            f"connections={SimulatedSMTPBackend.connections_opened}"
+        )
+
+    def handle(self, *args, **options):
+        SimulatedSMTPBackend.connect_seconds = options["connect_ms"] / 1000
+        SimulatedSMTPBackend.send_seconds = options["send_ms"] / 1000
+        with transaction.atomic():
+            User.objects.bulk_create(
+                [
+                    User(email=f"bench{i}@example.com", phone_number=f"97{i:08d}")
+                    for i in range(options["users"])
+                ]
+            )
+            notification = Notification.objects.create(
+                title="Benchmark",
+                message="Scheduled maintenance tonight.",
+                is_global=True,
+                email_delivery=NotificationEmailDeliveryChoices.PENDING,
+            )
+
+            SimulatedSMTPBackend.connections_opened = 0
+            started = time.perf_counter()
+            subject, body = render_notification_email(notification)
+            sent = 0
+            for _, email in audience_emails(notification):
+                sent += send_mail(
+                    subject,
+                    body,
+                    None,
+                    [email],
+                    connection=get_connection(BACKEND),
+                )
+            self._report("send_mail per user", sent, time.perf_counter() - started)
+
+            SimulatedSMTPBackend.connections_opened = 0
+            report = send_notification_emails(
+                notification.pk, batch_size=options["batch_size"], backend=BACKEND
+            )
+            self._report(
+                f"batched x{options['batch_size']}", report.sent, report.seconds
+            )
+            transaction.set_rollback(True)
+        mail.outbox = []
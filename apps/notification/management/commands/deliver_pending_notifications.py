@@ -0,0 +1,22 @@
+"""Finish fan-out of notifications left pending (e.g. by a restarted worker)."""
+
+from django.core.management.base import BaseCommand
+
+from apps.notification.services.fanout_service import (
+    FANOUT_BATCH_SIZE,
+    deliver_notifications,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Materialize NotificationUser inbox rows for every notification still in "
+        "FANOUT_PENDING delivery. Safe to re-run."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=FANOUT_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        finished = deliver_notifications(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Notifications fanned out: {finished}"))
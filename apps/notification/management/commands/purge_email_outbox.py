@@ -0,0 +1,29 @@
+"""Delete finished outbox rows past their retention."""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.notification.services.email_outbox_service import (
+    OUTBOX_RETENTION_DAYS,
+    purge_finished_emails,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete SENT and FAILED EmailOutbox rows last updated more than --days "
+        "days ago (default EMAIL_OUTBOX_RETENTION_DAYS). Run daily from cron."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=getattr(
+                settings, "EMAIL_OUTBOX_RETENTION_DAYS", OUTBOX_RETENTION_DAYS
+            ),
+        )
+
+    def handle(self, *args, **options):
+        deleted = purge_finished_emails(options["days"])
+        self.stdout.write(self.style.SUCCESS(f"Outbox rows deleted: {deleted}"))
@@ -0,0 +1,44 @@
+"""Apply notification expiry to unread counters and recount them from source."""
+
+from django.core.management.base import BaseCommand
+
+from apps.notification.services.unread_counter_service import (
+    RECONCILE_BATCH_SIZE,
+    expire_notifications,
+    reconcile_unread_counts,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Retract expired notifications from unread counters, then recount every "
+        "counter from the notification tables. Schedule frequently with "
+        "--expire-only (expiry latency) and periodically without it (drift)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--expire-only",
+            action="store_true",
+            help="Only retract expired notifications; skip the full recount.",
+        )
+        parser.add_argument(
+            "--user",
+            action="append",
+            type=int,
+            dest="user_ids",
+            help="Recount only this user id (repeatable).",
+        )
+        parser.add_argument("--batch-size", type=int, default=RECONCILE_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        expired = expire_notifications()
+        self.stdout.write(f"Expired notifications retracted: {expired}")
+        if options["expire_only"]:
+            return
+        checked, corrected = reconcile_unread_counts(
+            user_ids=options["user_ids"], batch_size=options["batch_size"]
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"Counters checked: {checked}, corrected: {corrected}")
+        )
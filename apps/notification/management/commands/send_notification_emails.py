@@ -0,0 +1,30 @@
+"""Finish email runs of notifications left pending (e.g. by a restarted worker)."""
+
+from django.core.management.base import BaseCommand
+
+from apps.notification.services.email_channel_service import (
+    NOTIFICATION_EMAIL_BATCH_SIZE,
+    send_pending_notification_emails,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Email the audience of every notification still in PENDING email "
+        "delivery, or whose sender's lease lapsed, resuming after its last "
+        "delivered batch. Runs held by a live sender are skipped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=NOTIFICATION_EMAIL_BATCH_SIZE
+        )
+
+    def handle(self, *args, **options):
+        reports = send_pending_notification_emails(batch_size=options["batch_size"])
+        for report in reports:
+            self.stdout.write(
+                f"Notification {report.notification_id}: {report.sent} emails in "
+                f"{report.seconds:.2f}s ({report.messages_per_second:,.0f} messages/s)"
+            )
+        self.stdout.write(self.style.SUCCESS(f"Notifications emailed: {len(reports)}"))
@@ -0,0 +1,42 @@
+"""Send due emails from the outbox, once or as a long-running worker."""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.notification.services.email_outbox_service import (
+    OUTBOX_BATCH_SIZE,
+    OUTBOX_WORKERS,
+    EmailWorkerPool,
+    drain_outbox,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Send every due EmailOutbox row (new emails, scheduled retries and rows "
+        "whose worker lease expired). With --loop, keep a worker pool running "
+        "until interrupted. Safe to run alongside the in-process pools."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=OUTBOX_BATCH_SIZE)
+        parser.add_argument("--loop", action="store_true")
+        parser.add_argument("--workers", type=int, default=OUTBOX_WORKERS)
+
+    def handle(self, *args, **options):
+        if not options["loop"]:
+            sent = drain_outbox(batch_size=options["batch_size"])
+            self.stdout.write(self.style.SUCCESS(f"Emails sent: {sent}"))
+            return
+
+        pool = EmailWorkerPool(
+            workers=options["workers"], batch_size=options["batch_size"]
+        )
+        pool.start()
+        self.stdout.write(f"Sending queued emails with {options['workers']} workers")
+        try:
+            while True:
+                time.sleep(60)
+        except KeyboardInterrupt:
+            pool.stop()
@@ -1,5 +1,8 @@
+from .notification_email_models import EmailOutbox  # noqa: F401
 from .notification_models import (  # noqa: F401
     Notification,
+    NotificationBroadcastCounter,
     NotificationRoleTarget,
     NotificationUser,
+    NotificationUserCounter,
 )
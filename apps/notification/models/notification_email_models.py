@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from django.db import models
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.common.models.common_base_models import HatchUpBaseModel
+from apps.notification.configs.constants.notification_enums import (
+    EmailOutboxStatusChoices,
+)
+
+
+class EmailOutbox(HatchUpBaseModel):
+    """
+    A transactional email waiting to be delivered (or already delivered).
+
+    Rows are written in the caller's transaction and sent by the worker pool
+    in `services/email_outbox_service.py`, so an email exists exactly when the
+    change that triggered it committed and survives process restarts.
+    """
+
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    from_email = models.CharField(max_length=255)
+    to = models.JSONField(default=list)
+
+    status = models.CharField(
+        max_length=16,
+        choices=EmailOutboxStatusChoices.choices,
+        default=EmailOutboxStatusChoices.PENDING,
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    # Pending: earliest (re)try. Sending: end of the worker's lease.
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+
+    class Meta:
+        verbose_name = "Email Outbox"
+        verbose_name_plural = "Email Outbox"
+        ordering = ["-created_at"]
+        indexes = [
+            # Workers claim due rows oldest first; sent/failed rows stay out.
+            models.Index(
+                fields=("next_attempt_at", "id"),
+                condition=Q(
+                    status__in=(
+                        EmailOutboxStatusChoices.PENDING,
+                        EmailOutboxStatusChoices.SENDING,
+                    )
+                ),
+                name="email_outbox_due_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.subject} -> {', '.join(self.to)} ({self.status})"
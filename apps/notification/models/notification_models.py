@@ -2,14 +2,23 @@ from __future__ import annotations
 
 from django.conf import settings
 from django.contrib.auth.models import Group
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
 from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
 from django.utils import timezone
 
+from apps.auth.services.roles import get_user_roles
 from apps.common.models.common_base_models import HatchUpBaseModel
+from apps.common.utils.common_search_utils import (
+    FULLTEXT_SEARCH_CONFIG,
+    trigram_index,
+)
 from apps.notification.configs.constants.notification_enums import (
     NotificationCategoryChoices,
+    NotificationDeliveryChoices,
+    NotificationEmailDeliveryChoices,
 )
 
 
@@ -25,6 +34,33 @@ class Notification(HatchUpBaseModel):
 
     is_global = models.BooleanField(default=False)
     expires_at = models.DateTimeField(null=True, blank=True)
+    # True while this notification contributes to `NotificationUserCounter`
+    # rows (set on publish, cleared on expiry/retraction).
+    counted_in_unread = models.BooleanField(default=False, editable=False)
+    # Stored tsvector for `?search=` (see common_search_utils).
+    search_vector = models.GeneratedField(
+        expression=SearchVector("title", "message", config=FULLTEXT_SEARCH_CONFIG),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+    # See `services/fanout_service.py`.
+    delivery = models.CharField(
+        max_length=16,
+        choices=NotificationDeliveryChoices.choices,
+        default=NotificationDeliveryChoices.READ_TIME,
+        editable=False,
+    )
+    # See `services/email_channel_service.py`.
+    email_delivery = models.CharField(
+        max_length=16,
+        choices=NotificationEmailDeliveryChoices.choices,
+        default=NotificationEmailDeliveryChoices.NONE,
+        editable=False,
+    )
+    # Highest audience user id already emailed; interrupted runs resume after it.
+    email_cursor = models.BigIntegerField(default=0, editable=False)
+    # End of the current sender's claim on a `SENDING` run.
+    email_lease_until = models.DateTimeField(null=True, blank=True, editable=False)
 
     created_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -38,6 +74,21 @@ class Notification(HatchUpBaseModel):
         verbose_name = "Notification"
         verbose_name_plural = "Notifications"
         ordering = ["-created_at"]
+        indexes = [
+            # Keyset pagination of the feed (`HatchupCursorPagination`).
+            models.Index(
+                fields=("created_at", "id"), name="notification_created_id_idx"
+            ),
+            # Read-time broadcasts are the few rows not fanned out; keep them in
+            # a small partial index instead of scanning every notification.
+            models.Index(
+                fields=("is_global",),
+                condition=~Q(delivery=NotificationDeliveryChoices.FANNED_OUT),
+                name="notification_read_time_idx",
+            ),
+            GinIndex(fields=("search_vector",), name="notification_search_idx"),
+            trigram_index("title", name="notification_title_trgm_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.title}"
@@ -50,18 +101,28 @@ class Notification(HatchUpBaseModel):
     def visible_to_user_queryset(cls, user) -> models.QuerySet["Notification"]:
         """
         Return notifications visible to `user` (by global/user/role targets), excluding expired.
+
+        Two indexed lookups instead of an OR across joins (no DISTINCT):
+        - the user's inbox (`NotificationUser` rows: direct targets and
+          fanned-out broadcasts);
+        - broadcasts still resolved at read time (not fanned out).
         """
 
         if not getattr(user, "is_authenticated", False):
             return cls.objects.none()
 
-        roles = user.groups.all()
-        # Direct user audience is represented by a NotificationUser row for that user.
-        q = Q(is_global=True) | Q(user_states__user=user)
+        inbox = NotificationUser.objects.filter(user=user).values("notification_id")
+        broadcast = Q(is_global=True)
+        roles = get_user_roles(user)
         if roles:
-            q |= Q(role_targets__role__in=roles)
-
-        qs = cls.objects.filter(q).distinct()
+            broadcast |= Q(role_targets__role__name__in=roles)
+        read_time = (
+            cls.objects.filter(broadcast)
+            .exclude(delivery=NotificationDeliveryChoices.FANNED_OUT)
+            .values("pk")
+        )
+
+        qs = cls.objects.filter(Q(pk__in=inbox) | Q(pk__in=read_time))
         # Exclude expired:
         qs = qs.filter(Q(expires_at__isnull=True) | Q(expires_at__gt=timezone.now()))
         return qs
@@ -124,3 +185,50 @@ class NotificationUser(HatchUpBaseModel):
         else:
             user_repr = str(self.user_id)
         return f"state notif:{self.notification_id} user:{user_repr}"
+
+
+class NotificationUserCounter(HatchUpBaseModel):
+    """
+    Maintained unread count per user, so polling `unread-count` is a single
+    primary-key read. Kept up to date by `services/unread_counter_service.py`
+    and periodically reconciled from the source tables.
+
+    Global read-time broadcasts are not in `unread_count`: they are counted
+    once in `NotificationBroadcastCounter` and added at read time, minus
+    `global_read_count`.
+    """
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        verbose_name=_("User"),
+        on_delete=models.CASCADE,
+        related_name="notification_counter",
+    )
+    unread_count = models.PositiveIntegerField(default=0)
+    # Counted global read-time broadcasts this user has read.
+    global_read_count = models.PositiveIntegerField(default=0)
+    # Audience changed (e.g. roles): recount on the next read.
+    stale = models.BooleanField(default=False)
+
+    class Meta:
+        verbose_name = "Notification User Counter"
+        verbose_name_plural = "Notification User Counters"
+
+    def __str__(self) -> str:
+        return f"unread user:{self.user_id} = {self.unread_count}"
+
+
+class NotificationBroadcastCounter(HatchUpBaseModel):
+    """
+    Number of counted global read-time broadcasts, in a single row. Publishing
+    one updates this row instead of every `NotificationUserCounter`.
+    """
+
+    broadcast_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Notification Broadcast Counter"
+        verbose_name_plural = "Notification Broadcast Counters"
+
+    def __str__(self) -> str:
+        return f"global broadcasts = {self.broadcast_count}"
@@ -0,0 +1,250 @@
+"""
+Email channel for published notifications.
+
+Opt-in per notification (`send_email` on `NotificationAdminCreateSerializer`).
+A broadcast can reach every user, so sending never loads the audience into
+memory or opens a connection per recipient:
+- subject and body are rendered once (`notification/email/notification.txt`);
+- recipients stream from the audience query in pk order with
+  `.iterator(chunk_size=NOTIFICATION_EMAIL_BATCH_SIZE)`;
+- each batch is one `send_messages()` call of per-recipient `EmailMessage`s on
+  a single connection held open for the whole run;
+- `email_cursor` is saved after every batch, so a run interrupted by a crash
+  or an SMTP error resumes after it (`send_notification_emails`), re-sending at
+  most one batch.
+
+Only one sender walks the audience at a time: a run is claimed with a
+conditional UPDATE (`PENDING` -> `SENDING` with `email_lease_until`), and the
+lease is renewed with every batch's cursor. The on-commit thread and
+`send_pending_notification_emails` (cron) therefore never email the same
+recipients twice; a sender that died is taken over once its lease lapses.
+
+Sending starts after the creating transaction commits, in a daemon thread
+(`NOTIFICATION_EMAIL_ASYNC`) or inline, like fan-out.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.mail import EmailMessage, get_connection
+from django.db import close_old_connections, transaction
+from django.db.models import Q
+from django.template.loader import render_to_string
+from django.utils import timezone
+
+from apps.notification.configs.constants.notification_enums import (
+    NotificationEmailDeliveryChoices,
+)
+from apps.notification.models.notification_models import Notification, NotificationUser
+from apps.users.models.users_role_models import UserRole
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+NOTIFICATION_EMAIL_BATCH_SIZE = 200
+NOTIFICATION_EMAIL_LEASE_SECONDS = 300
+NOTIFICATION_EMAIL_TEMPLATE = "notification/email/notification.txt"
+
+
+@dataclass(frozen=True)
+class EmailChannelReport:
+    notification_id: int
+    sent: int
+    seconds: float
+
+    @property
+    def messages_per_second(self) -> float:
+        return self.sent / self.seconds if self.seconds else 0.0
+
+
+def render_notification_email(notification: Notification) -> tuple[str, str]:
+    """Subject and body shared by every recipient."""
+
+    body = render_to_string(NOTIFICATION_EMAIL_TEMPLATE, {"notification": notification})
+    return notification.title, body.strip() + "\n"
+
+
+def audience_emails(notification: Notification, after_user_id: int = 0):
+    """`(user id, email)` of active audience members, in user id order."""
+
+    users = User.objects.filter(is_active=True, is_deleted=False, pk__gt=after_user_id)
+    if not notification.is_global:
+        direct = NotificationUser.objects.filter(notification=notification)
+        by_role = UserRole.objects.filter(role__role_targets__notification=notification)
+        users = users.filter(
+            Q(pk__in=direct.values("user_id")) | Q(pk__in=by_role.values("user_id"))
+        )
+    return users.exclude(email="").order_by("pk").values_list("pk", "email")
+
+
+def schedule_notification_emails(notification: Notification) -> None:
+    """Mark a just-saved notification for email and send it on commit."""
+
+    Notification.objects.filter(pk=notification.pk).update(
+        email_delivery=NotificationEmailDeliveryChoices.PENDING
+    )
+    notification.email_delivery = NotificationEmailDeliveryChoices.PENDING
+    notification_id = notification.pk
+    transaction.on_commit(lambda: _enqueue_emails(notification_id))
+
+
+def _enqueue_emails(notification_id: int) -> None:
+    if getattr(settings, "NOTIFICATION_EMAIL_ASYNC", False):
+        threading.Thread(
+            target=_send_in_thread, args=(notification_id,), daemon=True
+        ).start()
+    else:
+        send_notification_emails(notification_id)
+
+
+def _send_in_thread(notification_id: int) -> None:
+    try:
+        send_notification_emails(notification_id)
+    except Exception as exc:  # pragma: no cover - resumed by the management command
+        logger.error("Emailing notification %s failed: %s", notification_id, exc)
+    finally:
+        close_old_connections()
+
+
+def _claimable(now) -> Q:
+    return Q(email_delivery=NotificationEmailDeliveryChoices.PENDING) | Q(
+        email_delivery=NotificationEmailDeliveryChoices.SENDING,
+        email_lease_until__lt=now,
+    )
+
+
+def _lease_seconds() -> int:
+    return getattr(
+        settings, "NOTIFICATION_EMAIL_LEASE_SECONDS", NOTIFICATION_EMAIL_LEASE_SECONDS
+    )
+
+
+def _claim_run(notification_id: int):
+    """Take the run of `notification_id`; returns the lease end, or None."""
+
+    now = timezone.now()
+    lease_until = now + timedelta(seconds=_lease_seconds())
+    claimed = (
+        Notification.objects.filter(pk=notification_id)
+        .filter(_claimable(now))
+        .update(
+            email_delivery=NotificationEmailDeliveryChoices.SENDING,
+            email_lease_until=lease_until,
+        )
+    )
+    return lease_until if claimed else None
+
+
+def _held_run(notification_id: int, lease_until):
+    # Matches only while our lease is the current one (not taken over).
+    return Notification.objects.filter(
+        pk=notification_id,
+        email_delivery=NotificationEmailDeliveryChoices.SENDING,
+        email_lease_until=lease_until,
+    )
+
+
+class _LeaseLost(Exception):
+    pass
+
+
+def send_notification_emails(
+    notification_id: int,
+    batch_size: int | None = None,
+    backend: str | None = None,
+) -> EmailChannelReport:
+    """
+    Claim the email run of a `PENDING` notification (or one whose sender's
+    lease lapsed), email its audience after `email_cursor`, and mark it
+    `SENT`. Returns an empty report when another sender holds the run. SMTP
+    errors release the run back to `PENDING` and propagate once the cursor of
+    the last delivered batch is saved.
+    """
+
+    batch_size = batch_size or getattr(
+        settings, "NOTIFICATION_EMAIL_BATCH_SIZE", NOTIFICATION_EMAIL_BATCH_SIZE
+    )
+    lease_until = _claim_run(notification_id)
+    if lease_until is None:
+        return EmailChannelReport(notification_id, 0, 0.0)
+    notification = Notification.objects.get(pk=notification_id)
+
+    subject, body = render_notification_email(notification)
+    from_email = getattr(settings, "DEFAULT_FROM_EMAIL", "noreply@example.com")
+    started = time.perf_counter()
+    sent = 0
+    batch: list[tuple[int, str]] = []
+
+    def _flush() -> None:
+        nonlocal lease_until, sent
+        messages = [
+            EmailMessage(subject, body, from_email, [email], connection=connection)
+            for _, email in batch
+        ]
+        sent += connection.send_messages(messages) or 0
+        renewed = timezone.now() + timedelta(seconds=_lease_seconds())
+        if not _held_run(notification_id, lease_until).update(
+            email_cursor=batch[-1][0], email_lease_until=renewed
+        ):
+            raise _LeaseLost
+        lease_until = renewed
+
+    try:
+        with get_connection(backend) as connection:
+            recipients = audience_emails(notification, notification.email_cursor)
+            for recipient in recipients.iterator(chunk_size=batch_size):
+                batch.append(recipient)
+                if len(batch) >= batch_size:
+                    _flush()
+                    batch = []
+            if batch:
+                _flush()
+    except _LeaseLost:
+        # Stalled past the lease; the sender that took over resumes from our
+        # last saved cursor (re-sending at most the batch just sent).
+        logger.warning(
+            "Notification %s email run was taken over by another sender",
+            notification_id,
+        )
+        return EmailChannelReport(notification_id, sent, time.perf_counter() - started)
+    except Exception:
+        _held_run(notification_id, lease_until).update(
+            email_delivery=NotificationEmailDeliveryChoices.PENDING,
+            email_lease_until=None,
+        )
+        raise
+
+    _held_run(notification_id, lease_until).update(
+        email_delivery=NotificationEmailDeliveryChoices.SENT, email_lease_until=None
+    )
+    report = EmailChannelReport(notification_id, sent, time.perf_counter() - started)
+    logger.info(
+        "Notification %s emailed to %s recipients in %.2fs (%.0f messages/s)",
+        notification_id,
+        report.sent,
+        report.seconds,
+        report.messages_per_second,
+    )
+    return report
+
+
+def send_pending_notification_emails(
+    batch_size: int | None = None,
+) -> list[EmailChannelReport]:
+    """Finish every pending or abandoned email run (e.g. after a restart)."""
+
+    pending = Notification.objects.filter(_claimable(timezone.now())).values_list(
+        "pk", flat=True
+    )
+    return [
+        send_notification_emails(notification_id, batch_size=batch_size)
+        for notification_id in list(pending)
+    ]
@@ -0,0 +1,351 @@
+"""
+Transactional email outbox (`EmailOutbox`) and the worker pool that drains it.
+
+`enqueue_email` writes an outbox row in the caller's transaction (requests
+are atomic), so an email is queued exactly when the change that triggered it
+commits, and a crash before delivery no longer loses it. On commit the
+in-process `EmailWorkerPool` is woken (`EMAIL_OUTBOX_ASYNC`), or the outbox is
+drained inline.
+
+The pool is a fixed set of `EMAIL_OUTBOX_WORKERS` daemon threads, however many
+emails arrive. Each worker:
+- claims up to `EMAIL_OUTBOX_BATCH_SIZE` due rows (`SKIP LOCKED`, so workers
+  and processes never share a row) and leases them for `OUTBOX_LEASE_SECONDS`;
+  every claim counts as an attempt, so rows of a worker that keeps crashing
+  or hanging still end up `FAILED`;
+- sends them over its own connection from `get_connection()`, opened once and
+  kept while there is work (one SMTP handshake per busy period, not per email);
+- stops before its lease runs out (leaving room for one message at
+  `EMAIL_TIMEOUT`) and hands the unsent rest back, so a batch on a slow SMTP
+  server is never claimed and sent a second time by another worker;
+- records the outcome in two updates: sent rows, and failed rows retried
+  with exponential backoff and jitter until `EMAIL_OUTBOX_MAX_ATTEMPTS`.
+
+Bodies may carry one-time codes: they are cleared once a row is sent or
+failed, and `purge_email_outbox` deletes finished rows after
+`EMAIL_OUTBOX_RETENTION_DAYS`.
+
+Delivery is at-least-once: rows of a worker that died mid-batch become due
+again when their lease ends. `send_queued_emails` drains the outbox from a
+separate process (cron, or `--loop` as a dedicated worker).
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+from datetime import timedelta
+from typing import Iterable
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import close_old_connections, transaction
+from django.db import connection as db_connection
+from django.db.models import F
+from django.utils import timezone
+
+from apps.notification.configs.constants.notification_enums import (
+    EmailOutboxStatusChoices,
+)
+from apps.notification.models.notification_email_models import EmailOutbox
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_BATCH_SIZE = 50
+OUTBOX_WORKERS = 2
+OUTBOX_MAX_ATTEMPTS = 5
+OUTBOX_RETRY_BASE_SECONDS = 30
+OUTBOX_RETRY_MAX_SECONDS = 3600
+# A claimed row is retried by another worker once its lease ends.
+OUTBOX_LEASE_SECONDS = 300
+# Worst case for one SMTP call when `EMAIL_TIMEOUT` is unset.
+OUTBOX_SEND_TIMEOUT_SECONDS = 30
+OUTBOX_RETENTION_DAYS = 7
+# Idle workers look for retries that became due this often.
+OUTBOX_POLL_SECONDS = 5.0
+
+_DUE_STATUSES = (EmailOutboxStatusChoices.PENDING, EmailOutboxStatusChoices.SENDING)
+_FINISHED_STATUSES = (EmailOutboxStatusChoices.SENT, EmailOutboxStatusChoices.FAILED)
+
+
+def enqueue_email(
+    subject: str, body: str, to: Iterable[str], from_email: str | None = None
+) -> EmailOutbox:
+    """Queue an email in the current transaction; it is sent after commit."""
+
+    email = EmailOutbox.objects.create(
+        subject=subject,
+        body=body,
+        from_email=from_email
+        or getattr(settings, "DEFAULT_FROM_EMAIL", "noreply@example.com"),
+        to=list(to),
+    )
+    transaction.on_commit(_dispatch)
+    return email
+
+
+def _dispatch() -> None:
+    if getattr(settings, "EMAIL_OUTBOX_ASYNC", False):
+        get_worker_pool().wake()
+    else:
+        drain_outbox()
+
+
+def retry_delay(attempts: int) -> float:
+    """Seconds before retry number `attempts`: doubling, capped, jittered."""
+
+    delay = min(
+        OUTBOX_RETRY_MAX_SECONDS,
+        getattr(settings, "EMAIL_OUTBOX_RETRY_BASE_SECONDS", OUTBOX_RETRY_BASE_SECONDS)
+        * 2 ** (attempts - 1),
+    )
+    # Jitter spreads the retries of a burst that failed together.
+    return delay * random.uniform(0.5, 1.0)
+
+
+def _max_attempts() -> int:
+    return getattr(settings, "EMAIL_OUTBOX_MAX_ATTEMPTS", OUTBOX_MAX_ATTEMPTS)
+
+
+def claim_emails(limit: int = OUTBOX_BATCH_SIZE) -> list[EmailOutbox]:
+    """
+    Lease up to `limit` due rows to the calling worker, counting an attempt
+    for each. Rows whose last allowed attempt lost its lease (the worker died
+    or hung) are marked `FAILED` instead of being claimed again.
+    """
+
+    now = timezone.now()
+    lease_until = now + timedelta(seconds=OUTBOX_LEASE_SECONDS)
+    max_attempts = _max_attempts()
+    with transaction.atomic():
+        due = list(
+            EmailOutbox.objects.select_for_update(skip_locked=True)
+            .filter(status__in=_DUE_STATUSES, next_attempt_at__lte=now)
+            .order_by("next_attempt_at", "id")[:limit]
+        )
+        emails = [email for email in due if email.attempts < max_attempts]
+        exhausted = [email.pk for email in due if email.attempts >= max_attempts]
+        if exhausted:
+            EmailOutbox.objects.filter(pk__in=exhausted).update(
+                status=EmailOutboxStatusChoices.FAILED,
+                body="",
+                last_error="Lease expired on the last attempt",
+                updated_at=now,
+            )
+        if emails:
+            EmailOutbox.objects.filter(pk__in=[email.pk for email in emails]).update(
+                status=EmailOutboxStatusChoices.SENDING,
+                attempts=F("attempts") + 1,
+                next_attempt_at=lease_until,
+                updated_at=now,
+            )
+    for email in emails:
+        email.status = EmailOutboxStatusChoices.SENDING
+        email.attempts += 1
+        email.next_attempt_at = lease_until
+    return emails
+
+
+def _close_quietly(connection) -> None:
+    try:
+        connection.close()
+    except Exception:  # pragma: no cover - the next open() starts over
+        pass
+
+
+def send_emails(emails: list[EmailOutbox], connection) -> int:
+    """
+    Send claimed rows over `connection` and record the outcomes.
+
+    The connection stays open for the caller's next batch. Messages go out one
+    at a time so a rejected recipient only fails its own row; a dropped
+    connection is reopened for the next message. Rows not started before the
+    lease margin are released unsent, with their attempt refunded. Returns the
+    number sent.
+    """
+
+    max_attempts = _max_attempts()
+    # Opening the connection and sending may each take up to EMAIL_TIMEOUT.
+    margin = 2 * (
+        getattr(settings, "EMAIL_TIMEOUT", None) or OUTBOX_SEND_TIMEOUT_SECONDS
+    )
+    deadline = min(email.next_attempt_at for email in emails) - timedelta(
+        seconds=margin
+    )
+    sent, failed, unsent = [], [], []
+    for index, email in enumerate(emails):
+        # The first row always goes, so every claim makes progress.
+        if index and timezone.now() >= deadline:
+            unsent = emails[index:]
+            break
+        message = EmailMessage(
+            subject=email.subject,
+            body=email.body,
+            from_email=email.from_email,
+            to=email.to,
+            connection=connection,
+        )
+        try:
+            # Already open: `send_messages` then leaves the connection open.
+            connection.open()
+            connection.send_messages([message])
+        except Exception as exc:
+            logger.warning("Sending outbox email %s failed: %s", email.pk, exc)
+            _close_quietly(connection)
+            email.last_error = f"{type(exc).__name__}: {exc}"[:1000]
+            failed.append(email)
+        else:
+            sent.append(email)
+
+    now = timezone.now()
+    if sent:
+        # Same values for every sent row: one plain UPDATE, no CASE per row.
+        EmailOutbox.objects.filter(pk__in=[email.pk for email in sent]).update(
+            status=EmailOutboxStatusChoices.SENT,
+            body="",
+            sent_at=now,
+            last_error="",
+            updated_at=now,
+        )
+    for email in failed:
+        if email.attempts >= max_attempts:
+            email.status = EmailOutboxStatusChoices.FAILED
+            email.body = ""
+        else:
+            email.status = EmailOutboxStatusChoices.PENDING
+            email.next_attempt_at = now + timedelta(seconds=retry_delay(email.attempts))
+        email.updated_at = now
+    if failed:
+        EmailOutbox.objects.bulk_update(
+            failed,
+            ["status", "body", "next_attempt_at", "last_error", "updated_at"],
+        )
+    if unsent:
+        logger.warning(
+            "Outbox lease running out; releasing %s unsent emails", len(unsent)
+        )
+        EmailOutbox.objects.filter(pk__in=[email.pk for email in unsent]).update(
+            status=EmailOutboxStatusChoices.PENDING,
+            attempts=F("attempts") - 1,
+            next_attempt_at=now,
+            updated_at=now,
+        )
+    return len(sent)
+
+
+def purge_finished_emails(retention_days: int | None = None) -> int:
+    """Delete sent and failed rows older than the retention; returns the count."""
+
+    if retention_days is None:
+        retention_days = getattr(
+            settings, "EMAIL_OUTBOX_RETENTION_DAYS", OUTBOX_RETENTION_DAYS
+        )
+    cutoff = timezone.now() - timedelta(days=retention_days)
+    deleted, _ = EmailOutbox.objects.filter(
+        status__in=_FINISHED_STATUSES, updated_at__lt=cutoff
+    ).delete()
+    return deleted
+
+
+def drain_outbox(
+    batch_size: int = OUTBOX_BATCH_SIZE, backend: str | None = None
+) -> int:
+    """Send every due email over one connection; returns the number sent."""
+
+    connection = get_connection(backend)
+    sent = 0
+    try:
+        while emails := claim_emails(batch_size):
+            sent += send_emails(emails, connection)
+    finally:
+        _close_quietly(connection)
+    return sent
+
+
+class EmailWorkerPool:
+    """A fixed number of threads draining the outbox, each on its own connection."""
+
+    def __init__(
+        self,
+        workers: int = OUTBOX_WORKERS,
+        batch_size: int = OUTBOX_BATCH_SIZE,
+        poll_seconds: float = OUTBOX_POLL_SECONDS,
+        backend: str | None = None,
+    ):
+        self.workers = workers
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self.backend = backend
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._threads:
+                return
+            self._stopping.clear()
+            self._threads = [
+                threading.Thread(
+                    target=self._run, name=f"email-outbox-{i}", daemon=True
+                )
+                for i in range(self.workers)
+            ]
+            for thread in self._threads:
+                thread.start()
+
+    def wake(self) -> None:
+        """Signal new work; starts the threads on first use."""
+
+        self.start()
+        self._wake.set()
+
+    def stop(self, timeout: float | None = None) -> None:
+        with self._lock:
+            threads, self._threads = self._threads, []
+        self._stopping.set()
+        self._wake.set()
+        for thread in threads:
+            thread.join(timeout)
+
+    def _run(self) -> None:
+        connection = get_connection(self.backend)
+        try:
+            while not self._stopping.is_set():
+                # Cleared before claiming: a wake-up during the claim is kept.
+                self._wake.clear()
+                close_old_connections()
+                try:
+                    emails = claim_emails(self.batch_size)
+                    if emails:
+                        send_emails(emails, connection)
+                        continue
+                except Exception as exc:  # pragma: no cover - retried after the lease
+                    logger.error("Email outbox worker failed: %s", exc)
+                # Idle: don't hold an SMTP session open past the server's timeout.
+                _close_quietly(connection)
+                self._wake.wait(self.poll_seconds)
+        finally:
+            _close_quietly(connection)
+            db_connection.close()
+
+
+_pool: EmailWorkerPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_worker_pool() -> EmailWorkerPool:
+    """The process-wide pool, sized by `EMAIL_OUTBOX_WORKERS`."""
+
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = EmailWorkerPool(
+                workers=getattr(settings, "EMAIL_OUTBOX_WORKERS", OUTBOX_WORKERS),
+                batch_size=getattr(
+                    settings, "EMAIL_OUTBOX_BATCH_SIZE", OUTBOX_BATCH_SIZE
+                ),
+            )
+        return _pool
@@ -1,10 +1,10 @@
 """Email delivery service for OTP and other transactional emails."""
 
-import threading
-
 from django.conf import settings
 from django.core.mail import send_mail
 
+from apps.notification.services.email_outbox_service import enqueue_email
+
 
 class EmailService:
     """Service for sending transactional emails."""
@@ -12,8 +12,7 @@ class EmailService:
     OTP_EXPIRY_MINUTES = 10
 
     @staticmethod
-    def _send_otp_email_sync(email: str, otp_code: str, purpose: str, user_type: str) -> bool:
-        """Send OTP email synchronously (called from thread or directly)."""
+    def _otp_email_content(otp_code: str, purpose: str) -> tuple[str, str]:
         subject = "Your verification code"
         if purpose == "login":
             subject = "Your login verification code"
@@ -23,6 +22,12 @@ class EmailService:
             f"Your verification code is: {otp_code}\n\n"
             f"This code expires in {EmailService.OTP_EXPIRY_MINUTES} minutes."
         )
+        return subject, message
+
+    @staticmethod
+    def _send_otp_email_sync(email: str, otp_code: str, purpose: str, user_type: str) -> bool:
+        """Send OTP email synchronously, on a connection of its own."""
+        subject, message = EmailService._otp_email_content(otp_code, purpose)
         from_email = getattr(settings, "DEFAULT_FROM_EMAIL", "noreply@example.com")
         send_mail(
             subject=subject,
@@ -41,13 +46,9 @@ class EmailService:
         user_type: str = "client",
         async_send: bool = True,
     ) -> bool:
-        """Send OTP via email, optionally in a background thread."""
+        """Send OTP via email, optionally queued in the email outbox."""
         if async_send:
-            thread = threading.Thread(
-                target=EmailService._send_otp_email_sync,
-                args=(email, otp_code, purpose, user_type),
-                daemon=True,
-            )
-            thread.start()
+            subject, message = EmailService._otp_email_content(otp_code, purpose)
+            enqueue_email(subject, message, [email])
             return True
         return EmailService._send_otp_email_sync(email, otp_code, purpose, user_type)
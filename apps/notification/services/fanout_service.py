@@ -0,0 +1,163 @@
+"""
+Fan-out-on-write delivery for global and role-targeted notifications.
+
+By default a broadcast is resolved at read time: `visible_to_user_queryset`
+matches it through `is_global` / role targets for every reader. With
+`NOTIFICATION_FANOUT_ENABLED`, publishing a broadcast whose audience is at most
+`NOTIFICATION_FANOUT_MAX_AUDIENCE` users instead materializes one
+`NotificationUser` inbox row per audience member, in chunked `bulk_create`s,
+after the creating transaction commits. Once done the notification is
+`FANNED_OUT` and reads only touch the user's inbox. Larger broadcasts (e.g.
+a global announcement to every user) stay read-time: one row, no write storm.
+
+Semantics: a fanned-out notification reaches its audience *as of delivery*;
+users who join a role (or sign up) later do not receive it, as with any inbox.
+
+Materialization runs in a daemon thread (`NOTIFICATION_FANOUT_ASYNC`) or
+inline. It is idempotent (`ignore_conflicts`), and notifications left
+`FANOUT_PENDING` by a crashed worker are picked up by `deliver_notifications`.
+Pending notifications remain visible at read time meanwhile.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import close_old_connections, transaction
+
+from apps.notification.configs.constants.notification_enums import (
+    NotificationDeliveryChoices,
+)
+from apps.notification.models.notification_models import Notification, NotificationUser
+from apps.users.models.users_role_models import UserRole
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+FANOUT_BATCH_SIZE = 2000
+
+
+def _audience_user_ids(notification: Notification):
+    if notification.is_global:
+        users = User.objects.filter(is_active=True, is_deleted=False)
+        return users.order_by("pk").values_list("pk", flat=True)
+    return (
+        UserRole.objects.filter(role__role_targets__notification=notification)
+        .order_by("user_id")
+        .values_list("user_id", flat=True)
+        .distinct()
+    )
+
+
+def _is_broadcast(notification: Notification) -> bool:
+    return notification.is_global or notification.role_targets.exists()
+
+
+def _set_delivery(notification: Notification, delivery: str) -> None:
+    Notification.objects.filter(pk=notification.pk).update(delivery=delivery)
+    notification.delivery = delivery
+
+
+def deliver_notification(notification: Notification) -> str:
+    """
+    Choose read-time or fan-out delivery for a just-saved notification and,
+    for fan-out, schedule materialization on commit. Returns the delivery.
+    """
+
+    if not _is_broadcast(notification):
+        # Direct targets only: every recipient already has an inbox row.
+        delivery = NotificationDeliveryChoices.FANNED_OUT
+    elif getattr(settings, "NOTIFICATION_FANOUT_ENABLED", False) and (
+        _audience_user_ids(notification).count()
+        <= getattr(settings, "NOTIFICATION_FANOUT_MAX_AUDIENCE", 0)
+    ):
+        delivery = NotificationDeliveryChoices.FANOUT_PENDING
+    else:
+        delivery = NotificationDeliveryChoices.READ_TIME
+    _set_delivery(notification, delivery)
+
+    if delivery == NotificationDeliveryChoices.FANOUT_PENDING:
+        notification_id = notification.pk
+        transaction.on_commit(lambda: _enqueue_fanout(notification_id))
+    return delivery
+
+
+def _enqueue_fanout(notification_id: int) -> None:
+    if getattr(settings, "NOTIFICATION_FANOUT_ASYNC", False):
+        threading.Thread(
+            target=_fanout_in_thread, args=(notification_id,), daemon=True
+        ).start()
+    else:
+        fanout_notification(notification_id)
+
+
+def _fanout_in_thread(notification_id: int) -> None:
+    try:
+        fanout_notification(notification_id)
+    except Exception as exc:  # pragma: no cover - retried by deliver_notifications
+        logger.error("Fan-out of notification %s failed: %s", notification_id, exc)
+    finally:
+        close_old_connections()
+
+
+def fanout_notification(
+    notification_id: int, batch_size: int = FANOUT_BATCH_SIZE
+) -> int:
+    """
+    Materialize inbox rows for a `FANOUT_PENDING` notification.
+
+    Each chunk commits on its own so a large audience never holds one long
+    transaction; the notification flips to `FANNED_OUT` after the last one.
+    Returns the number of audience members processed.
+    """
+
+    notification = Notification.objects.filter(
+        pk=notification_id, delivery=NotificationDeliveryChoices.FANOUT_PENDING
+    ).first()
+    if notification is None:
+        return 0
+
+    delivered = 0
+    batch: list[int] = []
+
+    def _flush() -> None:
+        with transaction.atomic():
+            NotificationUser.objects.bulk_create(
+                [
+                    NotificationUser(notification_id=notification_id, user_id=user_id)
+                    for user_id in batch
+                ],
+                ignore_conflicts=True,
+            )
+
+    for user_id in _audience_user_ids(notification).iterator(chunk_size=batch_size):
+        batch.append(user_id)
+        if len(batch) >= batch_size:
+            _flush()
+            delivered += len(batch)
+            batch = []
+    if batch:
+        _flush()
+        delivered += len(batch)
+
+    Notification.objects.filter(
+        pk=notification_id, delivery=NotificationDeliveryChoices.FANOUT_PENDING
+    ).update(delivery=NotificationDeliveryChoices.FANNED_OUT)
+    return delivered
+
+
+def deliver_notifications(batch_size: int = FANOUT_BATCH_SIZE) -> int:
+    """Finish every pending fan-out (e.g. after a worker restart)."""
+
+    pending = Notification.objects.filter(
+        delivery=NotificationDeliveryChoices.FANOUT_PENDING
+    ).values_list("pk", flat=True)
+    finished = 0
+    for notification_id in list(pending):
+        fanout_notification(notification_id, batch_size=batch_size)
+        finished += 1
+    return finished
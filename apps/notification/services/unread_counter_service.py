@@ -0,0 +1,342 @@
+"""
+Maintained per-user unread notification counters (`NotificationUserCounter`).
+
+`unread-count` used to evaluate the visibility query (global OR direct OR
+role target, `DISTINCT`) on every poll. It now reads one counter row, kept
+current by the write paths:
+- publish (create):    +1 for the audience, one `UPDATE ... WHERE user_id IN`;
+- mark read / unread:  -1 / +1 for the reader, only when the state flips;
+- mark all read:       exact recount for the reader (rare, user-driven);
+- expiry / retraction: -1 for the audience members who had not read it;
+- role changes:        the user's row is marked `stale` and rebuilt on next
+                       read (by one reader; others wait on its row lock).
+
+Global read-time broadcasts reach every user, so they are never written into
+per-user rows. Publishing or retracting one updates the single
+`NotificationBroadcastCounter` row; reading or un-reading one moves the
+reader's `global_read_count`; retraction also lowers that for its readers
+only. A user's unread count is
+`unread_count + max(broadcast_count - global_read_count, 0)`, added up in the
+same query that reads the row.
+
+A notification contributes to counters while `counted_in_unread` is set, so
+expiry is applied exactly once (`expire_notifications`, run periodically by
+`reconcile_notification_unread_counts`). Rows are created lazily on first
+read; writes that bypass these services (admin site, shell) are corrected by
+the reconciliation job, which recounts from the source tables.
+
+All updates run in the caller's transaction, so counters commit (or roll
+back) together with the rows they describe.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+from django.db import transaction
+from django.db.models import F, Q, Subquery
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+
+from apps.notification.configs.constants.notification_enums import (
+    NotificationDeliveryChoices,
+)
+from apps.notification.models.notification_models import (
+    Notification,
+    NotificationBroadcastCounter,
+    NotificationUser,
+    NotificationUserCounter,
+)
+from apps.users.models.users_role_models import UserRole
+
+RECONCILE_BATCH_SIZE = 500
+# Primary key of the single `NotificationBroadcastCounter` row.
+BROADCAST_COUNTER_ID = 1
+# Counted through `NotificationBroadcastCounter`, not per-user rows. Fan-out
+# never applies to READ_TIME notifications, so this stays true from publish to
+# retraction.
+GLOBAL_BROADCAST = Q(is_global=True, delivery=NotificationDeliveryChoices.READ_TIME)
+
+
+def _is_global_broadcast(notification: Notification) -> bool:
+    return (
+        notification.is_global
+        and notification.delivery == NotificationDeliveryChoices.READ_TIME
+    )
+
+
+def _broadcast_counter():
+    NotificationBroadcastCounter.objects.bulk_create(
+        [NotificationBroadcastCounter(pk=BROADCAST_COUNTER_ID)], ignore_conflicts=True
+    )
+    return NotificationBroadcastCounter.objects.filter(pk=BROADCAST_COUNTER_ID)
+
+
+def _broadcast_count():
+    return Coalesce(
+        Subquery(
+            NotificationBroadcastCounter.objects.filter(pk=BROADCAST_COUNTER_ID).values(
+                "broadcast_count"
+            )[:1]
+        ),
+        0,
+    )
+
+
+def _total(unread: int, global_read: int, broadcasts: int) -> int:
+    return unread + max(broadcasts - global_read, 0)
+
+
+def _unread_audience_counters(notification: Notification):
+    """Counter rows of audience members who have not read `notification`."""
+
+    counters = NotificationUserCounter.objects.exclude(
+        user_id__in=NotificationUser.objects.filter(
+            notification=notification, read_at__isnull=False
+        ).values("user_id")
+    )
+    inbox = Q(
+        user_id__in=NotificationUser.objects.filter(notification=notification).values(
+            "user_id"
+        )
+    )
+    if notification.delivery == NotificationDeliveryChoices.FANNED_OUT:
+        # Audience is exactly the materialized inbox rows.
+        return counters.filter(inbox)
+    if notification.is_global:
+        # Only while fan-out is pending; read-time global broadcasts use
+        # `NotificationBroadcastCounter`.
+        return counters
+    return counters.filter(
+        inbox
+        | Q(
+            user_id__in=UserRole.objects.filter(
+                role__role_targets__notification=notification
+            ).values("user_id")
+        )
+    )
+
+
+def _count_unread(user_id: int) -> tuple[int, int]:
+    """
+    `(unread_count, global_read_count)` recounted from the source tables, in
+    SQL only (no role cache).
+    """
+
+    # Mirrors `Notification.visible_to_user_queryset`: inbox rows, plus
+    # broadcasts that are not fanned out.
+    broadcast = Q(is_global=True) | Q(
+        role_targets__role_id__in=UserRole.objects.filter(user_id=user_id).values(
+            "role_id"
+        )
+    )
+    audience = Q(user_states__user_id=user_id) | (
+        broadcast & ~Q(delivery=NotificationDeliveryChoices.FANNED_OUT)
+    )
+    read = NotificationUser.objects.filter(user_id=user_id, read_at__isnull=False)
+    counted = Notification.objects.filter(counted_in_unread=True)
+    unread = (
+        counted.filter(audience)
+        .exclude(GLOBAL_BROADCAST)
+        .exclude(pk__in=read.values("notification_id"))
+        .values("pk")
+        .distinct()
+        .count()
+    )
+    global_read = (
+        counted.filter(GLOBAL_BROADCAST)
+        .filter(pk__in=read.values("notification_id"))
+        .count()
+    )
+    return unread, global_read
+
+
+def _refresh_counter(
+    user_id: int, *, only_stale: bool = False
+) -> tuple[NotificationUserCounter, bool]:
+    """
+    Recount `user_id`'s row; returns it and whether it had drifted (a stale
+    row is expected to differ and does not count as drift). With
+    `only_stale`, a row someone else rebuilt while we waited for its lock is
+    returned as is.
+    """
+
+    with transaction.atomic():
+        NotificationUserCounter.objects.bulk_create(
+            [NotificationUserCounter(user_id=user_id, stale=True)],
+            ignore_conflicts=True,
+        )
+        counter = NotificationUserCounter.objects.select_for_update().get(
+            user_id=user_id
+        )
+        if only_stale and not counter.stale:
+            return counter, False
+        counts = _count_unread(user_id)
+        changed = (counter.unread_count, counter.global_read_count) != counts
+        drifted = changed and not counter.stale
+        if changed or counter.stale:
+            counter.unread_count, counter.global_read_count = counts
+            counter.stale = False
+            counter.save(
+                update_fields=[
+                    "unread_count",
+                    "global_read_count",
+                    "stale",
+                    "updated_at",
+                ]
+            )
+    return counter, drifted
+
+
+def refresh_unread_count(user_id: int) -> int:
+    """
+    Recount `user_id`'s unread notifications, store them and return the total.
+
+    The counter row is locked before counting. If the row already existed, a
+    concurrent publish either committed first (and is counted) or waits on
+    the lock and increments after. A row created here is not visible to a
+    publish running concurrently (its `UPDATE` skips it), so such a publish
+    can be missed until the next reconciliation. Global broadcasts are not
+    affected: they are added at read time.
+    """
+
+    return _counter_total(_refresh_counter(user_id)[0])
+
+
+def _counter_total(counter: NotificationUserCounter) -> int:
+    broadcasts = (
+        NotificationBroadcastCounter.objects.filter(pk=BROADCAST_COUNTER_ID)
+        .values_list("broadcast_count", flat=True)
+        .first()
+    )
+    return _total(counter.unread_count, counter.global_read_count, broadcasts or 0)
+
+
+def get_unread_count(user) -> int:
+    """
+    O(1) unread count for `user`; builds the counter row on first use and
+    rebuilds it once after it was marked stale.
+    """
+
+    row = (
+        NotificationUserCounter.objects.filter(user_id=user.pk)
+        .values_list("unread_count", "global_read_count", _broadcast_count(), "stale")
+        .first()
+    )
+    if row is None or row[3]:
+        return _counter_total(_refresh_counter(user.pk, only_stale=True)[0])
+    return _total(*row[:3])
+
+
+def count_read_change(user_id: int, notification: Notification, read: bool) -> None:
+    """`user_id` flipped the read state of counted `notification` to `read`."""
+
+    counters = NotificationUserCounter.objects.filter(user_id=user_id)
+    if _is_global_broadcast(notification):
+        counters.update(
+            global_read_count=Greatest(F("global_read_count") + (1 if read else -1), 0)
+        )
+    else:
+        counters.update(
+            unread_count=Greatest(F("unread_count") + (-1 if read else 1), 0)
+        )
+
+
+def invalidate_unread_counts(user_ids: Iterable[int]) -> None:
+    """Mark counters whose audience changed (e.g. roles) stale."""
+
+    user_ids = set(user_ids)
+    if user_ids:
+        NotificationUserCounter.objects.filter(user_id__in=user_ids).update(stale=True)
+
+
+def publish_notification(notification: Notification) -> None:
+    """Count a new notification (and its targets) as unread for its audience."""
+
+    if notification.counted_in_unread or notification.is_expired:
+        return
+    Notification.objects.filter(pk=notification.pk).update(counted_in_unread=True)
+    notification.counted_in_unread = True
+    if _is_global_broadcast(notification):
+        _broadcast_counter().update(broadcast_count=F("broadcast_count") + 1)
+        return
+    _unread_audience_counters(notification).update(unread_count=F("unread_count") + 1)
+
+
+def retract_notification(notification: Notification) -> None:
+    """Stop counting `notification` (expired, edited or about to be deleted)."""
+
+    if not notification.counted_in_unread:
+        return
+    Notification.objects.filter(pk=notification.pk).update(counted_in_unread=False)
+    notification.counted_in_unread = False
+    if _is_global_broadcast(notification):
+        _broadcast_counter().update(
+            broadcast_count=Greatest(F("broadcast_count") - 1, 0)
+        )
+        # Its readers no longer have it to subtract.
+        NotificationUserCounter.objects.filter(
+            user_id__in=NotificationUser.objects.filter(
+                notification=notification, read_at__isnull=False
+            ).values("user_id")
+        ).update(global_read_count=Greatest(F("global_read_count") - 1, 0))
+        return
+    _unread_audience_counters(notification).update(
+        unread_count=Greatest(F("unread_count") - 1, 0)
+    )
+
+
+def expire_notifications(now=None) -> int:
+    """Retract every counted notification whose `expires_at` has passed."""
+
+    expired = Notification.objects.filter(
+        counted_in_unread=True, expires_at__lte=now or timezone.now()
+    )
+    retracted = 0
+    for notification in expired.iterator():
+        with transaction.atomic():
+            retract_notification(notification)
+        retracted += 1
+    return retracted
+
+
+def refresh_broadcast_count() -> bool:
+    """Recount the global broadcast row; True when it had drifted."""
+
+    with transaction.atomic():
+        counter = _broadcast_counter().select_for_update().get()
+        broadcasts = Notification.objects.filter(
+            GLOBAL_BROADCAST, counted_in_unread=True
+        ).count()
+        if counter.broadcast_count == broadcasts:
+            return False
+        counter.broadcast_count = broadcasts
+        counter.save(update_fields=["broadcast_count", "updated_at"])
+    return True
+
+
+def reconcile_unread_counts(
+    user_ids: Iterable[int] | None = None,
+    batch_size: int = RECONCILE_BATCH_SIZE,
+) -> tuple[int, int]:
+    """
+    Recount existing counter rows (and the global broadcast row, on a full
+    run) from the source tables.
+
+    Returns `(checked, corrected)` for the user rows; a non-zero `corrected`
+    means some write bypassed the counter services.
+    """
+
+    counters = NotificationUserCounter.objects.order_by("user_id")
+    if user_ids is not None:
+        counters = counters.filter(user_id__in=list(user_ids))
+    else:
+        refresh_broadcast_count()
+    checked = corrected = 0
+    for user_id in counters.values_list("user_id", flat=True).iterator(
+        chunk_size=batch_size
+    ):
+        checked += 1
+        if _refresh_counter(user_id)[1]:
+            corrected += 1
+    return checked, corrected
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from apps.notification.services.unread_counter_service import (
+    invalidate_unread_counts,
+)
+from apps.users.models.users_role_models import UserRole
+
+User = get_user_model()
+
+
+@receiver(m2m_changed, sender=User.roles.through)
+def invalidate_unread_counts_on_role_change(
+    sender, instance, action: str, reverse: bool, pk_set, **kwargs
+) -> None:
+    # Role-targeted notifications enter/leave the user's audience.
+    if not action.startswith("post_") and action != "pre_clear":
+        return
+    if not reverse:
+        invalidate_unread_counts([instance.id])
+        return
+    if action == "pre_clear":
+        pk_set = set(instance.user_set.values_list("id", flat=True))
+    invalidate_unread_counts(pk_set or ())
+
+
+@receiver(post_save, sender=UserRole)
+@receiver(post_delete, sender=UserRole)
+def invalidate_unread_counts_on_user_role_change(
+    sender, instance: UserRole, **kwargs
+) -> None:
+    invalidate_unread_counts([instance.user_id])
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import time
+from datetime import timedelta
+
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from apps.notification.configs.constants.notification_enums import (
+    EmailOutboxStatusChoices,
+)
+from apps.notification.models.notification_email_models import EmailOutbox
+from apps.notification.services.email_outbox_service import (
+    EmailWorkerPool,
+    claim_emails,
+    drain_outbox,
+    enqueue_email,
+    purge_finished_emails,
+    send_emails,
+)
+from apps.notification.services.email_service import EmailService
+
+BACKEND = f"{__name__}.FlakyBackend"
+
+
+class FlakyBackend(EmailBackend):
+    """locmem backend that counts opened connections and rejects "bounce@"."""
+
+    opened = 0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.is_open = False
+
+    def open(self):
+        if self.is_open:
+            return False
+        FlakyBackend.opened += 1
+        self.is_open = True
+        return True
+
+    def close(self):
+        self.is_open = False
+
+    def send_messages(self, messages):
+        if any("bounce@example.com" in message.to for message in messages):
+            raise ConnectionError("recipient rejected")
+        return super().send_messages(messages)
+
+
+@override_settings(
+    EMAIL_OUTBOX_ASYNC=False,
+    EMAIL_OUTBOX_MAX_ATTEMPTS=2,
+    EMAIL_OUTBOX_RETRY_BASE_SECONDS=60,
+)
+class EmailOutboxTests(TestCase):
+    def setUp(self):
+        mail.outbox = []
+        FlakyBackend.opened = 0
+
+    def test_emails_are_sent_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            email = enqueue_email("Hello", "Body", ["a@example.com"])
+        self.assertEqual(mail.outbox, [])
+        self.assertEqual(email.status, EmailOutboxStatusChoices.PENDING)
+
+        for callback in callbacks:
+            callback()
+        email.refresh_from_db()
+        self.assertEqual(
+            (email.status, email.attempts), (EmailOutboxStatusChoices.SENT, 1)
+        )
+        self.assertIsNotNone(email.sent_at)
+        self.assertEqual([m.to for m in mail.outbox], [["a@example.com"]])
+
+    def test_async_otp_email_goes_through_the_outbox(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            EmailService.send_otp_email("otp@example.com", "123456", async_send=True)
+        email = EmailOutbox.objects.get()
+        self.assertEqual(email.to, ["otp@example.com"])
+        self.assertEqual(email.status, EmailOutboxStatusChoices.SENT)
+        self.assertIn("123456", mail.outbox[0].body)
+
+    def test_batch_reuses_one_connection_and_retries_failures(self):
+        for address in ("a@example.com", "bounce@example.com", "b@example.com"):
+            EmailOutbox.objects.create(
+                subject="s", body="b", from_email="f@example.com", to=[address]
+            )
+
+        self.assertEqual(drain_outbox(backend=BACKEND), 2)
+        # One connection, reopened once after the rejected recipient dropped it.
+        self.assertEqual(FlakyBackend.opened, 2)
+        bounced = EmailOutbox.objects.get(to=["bounce@example.com"])
+        self.assertEqual(
+            (bounced.status, bounced.attempts), (EmailOutboxStatusChoices.PENDING, 1)
+        )
+        self.assertIn("recipient rejected", bounced.last_error)
+        self.assertGreater(
+            bounced.next_attempt_at, timezone.now() + timedelta(seconds=29)
+        )
+
+        # Not due yet; once due, the last allowed attempt marks it failed.
+        self.assertEqual(claim_emails(), [])
+        EmailOutbox.objects.filter(pk=bounced.pk).update(next_attempt_at=timezone.now())
+        drain_outbox(backend=BACKEND)
+        bounced.refresh_from_db()
+        self.assertEqual(
+            (bounced.status, bounced.attempts), (EmailOutboxStatusChoices.FAILED, 2)
+        )
+        # Finished rows keep no body (it may hold a one-time code).
+        self.assertEqual(set(EmailOutbox.objects.values_list("body", flat=True)), {""})
+
+    def test_expired_lease_is_claimed_again(self):
+        email = EmailOutbox.objects.create(
+            subject="s", body="b", from_email="f@example.com", to=["a@example.com"]
+        )
+        self.assertEqual(claim_emails(), [email])
+        self.assertEqual(claim_emails(), [])
+
+        EmailOutbox.objects.filter(pk=email.pk).update(
+            next_attempt_at=timezone.now() - timedelta(seconds=1)
+        )
+        self.assertEqual(claim_emails(), [email])
+
+    def test_worker_that_never_reports_back_still_fails_the_row(self):
+        email = EmailOutbox.objects.create(
+            subject="s", body="b", from_email="f@example.com", to=["a@example.com"]
+        )
+        for attempts in (1, 2):
+            self.assertEqual(claim_emails(), [email])
+            email.refresh_from_db()
+            self.assertEqual(email.attempts, attempts)
+            # The worker hangs: its lease lapses without an outcome.
+            EmailOutbox.objects.filter(pk=email.pk).update(
+                next_attempt_at=timezone.now() - timedelta(seconds=1)
+            )
+
+        self.assertEqual(claim_emails(), [])
+        email.refresh_from_db()
+        self.assertEqual(
+            (email.status, email.body), (EmailOutboxStatusChoices.FAILED, "")
+        )
+
+    @override_settings(EMAIL_TIMEOUT=200)
+    def test_batch_stops_before_its_lease_runs_out(self):
+        for address in ("a@example.com", "b@example.com", "c@example.com"):
+            EmailOutbox.objects.create(
+                subject="s", body="b", from_email="f@example.com", to=[address]
+            )
+        # 2 x EMAIL_TIMEOUT exceeds the lease: only the first row may go.
+        self.assertEqual(send_emails(claim_emails(), mail.get_connection()), 1)
+
+        released = EmailOutbox.objects.filter(status=EmailOutboxStatusChoices.PENDING)
+        self.assertEqual(released.count(), 2)
+        self.assertEqual(set(released.values_list("attempts", flat=True)), {0})
+        self.assertEqual(len(claim_emails()), 2)
+
+    def test_finished_rows_are_purged_after_retention(self):
+        old = timezone.now() - timedelta(days=8)
+        for status in EmailOutboxStatusChoices.values:
+            EmailOutbox.objects.create(
+                subject="s", from_email="f@example.com", to=[], status=status
+            )
+        EmailOutbox.objects.update(updated_at=old)
+        EmailOutbox.objects.create(
+            subject="s",
+            from_email="f@example.com",
+            to=[],
+            status=EmailOutboxStatusChoices.SENT,
+        )
+
+        self.assertEqual(purge_finished_emails(7), 2)
+        self.assertEqual(
+            sorted(EmailOutbox.objects.values_list("status", flat=True)),
+            sorted(
+                [
+                    EmailOutboxStatusChoices.PENDING,
+                    EmailOutboxStatusChoices.SENDING,
+                    EmailOutboxStatusChoices.SENT,
+                ]
+            ),
+        )
+
+
+class EmailWorkerPoolTests(TransactionTestCase):
+    def test_pool_drains_the_outbox_with_bounded_connections(self):
+        mail.outbox = []
+        FlakyBackend.opened = 0
+        EmailOutbox.objects.bulk_create(
+            [
+                EmailOutbox(
+                    subject="s", body="b", from_email="f@example.com", to=[f"{i}@x.com"]
+                )
+                for i in range(30)
+            ]
+        )
+        # One worker: the sqlite test database does not take concurrent writers.
+        pool = EmailWorkerPool(
+            workers=1, batch_size=5, poll_seconds=0.05, backend=BACKEND
+        )
+        pool.wake()
+        try:
+            deadline = time.monotonic() + 10
+            while len(mail.outbox) < 30 and time.monotonic() < deadline:
+                time.sleep(0.02)
+        finally:
+            pool.stop(timeout=5)
+
+        self.assertEqual(len(mail.outbox), 30)
+        self.assertFalse(
+            EmailOutbox.objects.exclude(status=EmailOutboxStatusChoices.SENT).exists()
+        )
+        self.assertEqual(FlakyBackend.opened, 1)
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from types import SimpleNamespace
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.core import mail
+from django.core.cache import cache
+from django.core.mail.backends.locmem import EmailBackend
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.auth.services import roles as roles_service
+from apps.notification.apis.serializers import NotificationAdminCreateSerializer
+from apps.notification.configs.constants.notification_enums import (
+    NotificationEmailDeliveryChoices,
+)
+from apps.notification.models.notification_models import Notification
+from apps.notification.services.email_channel_service import (
+    send_notification_emails,
+    send_pending_notification_emails,
+)
+
+User = get_user_model()
+
+BACKEND = f"{__name__}.RecordingBackend"
+
+
+class RecordingBackend(EmailBackend):
+    """locmem backend recording opens and batch sizes; can fail a batch."""
+
+    opened = 0
+    batches: list[int] = []
+    fail_on_batch: int | None = None
+    after_batch = None
+
+    def open(self):
+        RecordingBackend.opened += 1
+        return True
+
+    def send_messages(self, messages):
+        RecordingBackend.batches.append(len(messages))
+        if len(RecordingBackend.batches) == RecordingBackend.fail_on_batch:
+            raise ConnectionError("connection dropped")
+        sent = super().send_messages(messages)
+        if RecordingBackend.after_batch is not None:
+            RecordingBackend.after_batch()
+        return sent
+
+
+@override_settings(
+    NOTIFICATION_FANOUT_ENABLED=False,
+    NOTIFICATION_EMAIL_ASYNC=False,
+    NOTIFICATION_EMAIL_BATCH_SIZE=2,
+)
+class NotificationEmailChannelTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        roles_service.reset_role_cache()
+        mail.outbox = []
+        RecordingBackend.opened = 0
+        RecordingBackend.batches = []
+        RecordingBackend.fail_on_batch = None
+        RecordingBackend.after_batch = None
+        self.role = Group.objects.create(name="Email Role")
+        self.admin = User.objects.create(
+            email="admin@mailing.com", phone_number="1000002201"
+        )
+        self.members = [
+            User.objects.create(
+                email=f"member{i}@mailing.com", phone_number=f"100000221{i}"
+            )
+            for i in range(5)
+        ]
+        for member in self.members:
+            member.roles.add(self.role)
+
+    def _publish(self, **data):
+        serializer = NotificationAdminCreateSerializer(
+            data={"title": "Maintenance", "message": "Down at 2am.", **data},
+            context={"request": SimpleNamespace(user=self.admin)},
+        )
+        serializer.is_valid(raise_exception=True)
+        with self.captureOnCommitCallbacks(execute=True):
+            notification = serializer.save()
+        notification.refresh_from_db()
+        return notification
+
+    def test_role_audience_is_emailed_once_per_member(self):
+        self.members[0].is_active = False
+        self.members[0].save(update_fields=["is_active"])
+        notification = self._publish(
+            target_role_names=[self.role.name],
+            target_user_ids=[self.admin.pk, self.members[1].pk],
+            send_email=True,
+        )
+
+        self.assertEqual(
+            notification.email_delivery, NotificationEmailDeliveryChoices.SENT
+        )
+        self.assertEqual(
+            sorted(message.to[0] for message in mail.outbox),
+            sorted(user.email for user in [self.admin, *self.members[1:]]),
+        )
+        self.assertTrue(all(len(message.to) == 1 for message in mail.outbox))
+        self.assertEqual(mail.outbox[0].subject, "Maintenance")
+        self.assertIn("Down at 2am.", mail.outbox[0].body)
+
+    def test_email_is_opt_in(self):
+        notification = self._publish(is_global=True)
+
+        self.assertEqual(
+            notification.email_delivery, NotificationEmailDeliveryChoices.NONE
+        )
+        self.assertEqual(mail.outbox, [])
+
+    def _pending_global(self):
+        return Notification.objects.create(
+            title="t",
+            message="m",
+            is_global=True,
+            email_delivery=NotificationEmailDeliveryChoices.PENDING,
+        )
+
+    def test_batches_share_one_connection(self):
+        notification = self._pending_global()
+
+        report = send_notification_emails(notification.pk, backend=BACKEND)
+
+        self.assertEqual(report.sent, 6)
+        self.assertEqual(RecordingBackend.opened, 1)
+        self.assertEqual(RecordingBackend.batches, [2, 2, 2])
+
+    def test_interrupted_run_resumes_after_last_batch(self):
+        notification = self._pending_global()
+        RecordingBackend.fail_on_batch = 2
+
+        with self.assertRaises(ConnectionError):
+            send_notification_emails(notification.pk, backend=BACKEND)
+        notification.refresh_from_db()
+        self.assertEqual(
+            notification.email_delivery, NotificationEmailDeliveryChoices.PENDING
+        )
+        self.assertEqual(len(mail.outbox), 2)
+
+        reports = send_pending_notification_emails()
+        self.assertEqual([report.sent for report in reports], [4])
+        self.assertEqual(
+            len({message.to[0] for message in mail.outbox}), len(mail.outbox)
+        )
+        notification.refresh_from_db()
+        self.assertEqual(
+            notification.email_delivery, NotificationEmailDeliveryChoices.SENT
+        )
+
+    def _sending_global(self, lease_until, cursor=0):
+        return Notification.objects.create(
+            title="t",
+            message="m",
+            is_global=True,
+            email_delivery=NotificationEmailDeliveryChoices.SENDING,
+            email_lease_until=lease_until,
+            email_cursor=cursor,
+        )
+
+    def test_claimed_run_is_not_sent_twice(self):
+        notification = self._sending_global(timezone.now() + timedelta(minutes=5))
+
+        self.assertEqual(send_notification_emails(notification.pk).sent, 0)
+        self.assertEqual(send_pending_notification_emails(), [])
+        self.assertEqual(mail.outbox, [])
+
+    def test_lapsed_lease_is_taken_over_from_the_cursor(self):
+        notification = self._sending_global(
+            timezone.now() - timedelta(seconds=1), cursor=self.members[1].pk
+        )
+
+        reports = send_pending_notification_emails()
+
+        self.assertEqual([report.sent for report in reports], [3])
+        notification.refresh_from_db()
+        self.assertEqual(
+            notification.email_delivery, NotificationEmailDeliveryChoices.SENT
+        )
+        self.assertIsNone(notification.email_lease_until)
+
+    def test_sender_stops_when_its_lease_is_taken_over(self):
+        notification = self._pending_global()
+
+        def take_over():
+            Notification.objects.filter(pk=notification.pk).update(
+                email_lease_until=timezone.now() + timedelta(hours=1)
+            )
+
+        RecordingBackend.after_batch = take_over
+        report = send_notification_emails(notification.pk, backend=BACKEND)
+
+        self.assertEqual(report.sent, 2)
+        self.assertEqual(RecordingBackend.batches, [2])
+        notification.refresh_from_db()
+        self.assertEqual(
+            notification.email_delivery, NotificationEmailDeliveryChoices.SENDING
+        )
+        self.assertEqual(notification.email_cursor, 0)
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from apps.auth.services import roles as roles_service
+from apps.notification.apis.serializers import NotificationAdminCreateSerializer
+from apps.notification.configs.constants.notification_enums import (
+    NotificationDeliveryChoices,
+)
+from apps.notification.models.notification_models import (
+    Notification,
+    NotificationUser,
+)
+from apps.notification.services.fanout_service import (
+    deliver_notifications,
+    fanout_notification,
+)
+from apps.notification.services.unread_counter_service import get_unread_count
+
+User = get_user_model()
+
+
+@override_settings(
+    NOTIFICATION_FANOUT_ENABLED=True,
+    NOTIFICATION_FANOUT_MAX_AUDIENCE=3,
+    NOTIFICATION_FANOUT_ASYNC=False,
+)
+class NotificationFanoutTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        roles_service.reset_role_cache()
+        self.role = Group.objects.create(name="Fanout Role")
+        self.admin = User.objects.create(
+            email="admin@fanout.com", phone_number="1000001201"
+        )
+        self.members = [
+            User.objects.create(
+                email=f"member{i}@fanout.com", phone_number=f"100000121{i}"
+            )
+            for i in range(2)
+        ]
+        for member in self.members:
+            member.roles.add(self.role)
+
+    def _publish(self, **data):
+        serializer = NotificationAdminCreateSerializer(
+            data={"title": "t", "message": "m", **data},
+            context={"request": SimpleNamespace(user=self.admin)},
+        )
+        serializer.is_valid(raise_exception=True)
+        with self.captureOnCommitCallbacks(execute=True):
+            notification = serializer.save()
+        notification.refresh_from_db()
+        return notification
+
+    def test_small_role_audience_is_materialized(self):
+        notification = self._publish(target_role_names=[self.role.name])
+
+        self.assertEqual(notification.delivery, NotificationDeliveryChoices.FANNED_OUT)
+        self.assertEqual(
+            set(
+                NotificationUser.objects.filter(notification=notification).values_list(
+                    "user_id", flat=True
+                )
+            ),
+            {member.pk for member in self.members},
+        )
+        for member in self.members:
+            self.assertEqual(
+                list(Notification.visible_to_user_queryset(member)), [notification]
+            )
+        self.assertFalse(Notification.visible_to_user_queryset(self.admin).exists())
+
+    def test_large_global_audience_stays_read_time(self):
+        User.objects.create(email="extra@fanout.com", phone_number="1000001299")
+        notification = self._publish(is_global=True)
+
+        self.assertEqual(notification.delivery, NotificationDeliveryChoices.READ_TIME)
+        self.assertFalse(
+            NotificationUser.objects.filter(notification=notification).exists()
+        )
+        self.assertTrue(Notification.visible_to_user_queryset(self.admin).exists())
+
+    def test_direct_targets_need_no_fanout(self):
+        notification = self._publish(target_user_ids=[self.members[0].pk])
+
+        self.assertEqual(notification.delivery, NotificationDeliveryChoices.FANNED_OUT)
+        self.assertFalse(
+            Notification.visible_to_user_queryset(self.members[1]).exists()
+        )
+
+    def test_pending_fanout_is_visible_and_resumable(self):
+        for member in self.members:
+            self.assertEqual(get_unread_count(member), 0)
+        notification = self._publish(target_role_names=[self.role.name])
+        NotificationUser.objects.filter(notification=notification).delete()
+        Notification.objects.filter(pk=notification.pk).update(
+            delivery=NotificationDeliveryChoices.FANOUT_PENDING
+        )
+
+        self.assertTrue(Notification.visible_to_user_queryset(self.members[0]).exists())
+        self.assertEqual(deliver_notifications(batch_size=1), 1)
+        self.assertEqual(fanout_notification(notification.pk), 0)
+        self.assertEqual(
+            NotificationUser.objects.filter(notification=notification).count(), 2
+        )
+        self.assertEqual(get_unread_count(self.members[0]), 1)
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.notification.apis.serializers import (
+    MarkAsReadSerializer,
+    NotificationAdminCreateSerializer,
+)
+from apps.notification.models.notification_models import (
+    Notification,
+    NotificationUser,
+    NotificationUserCounter,
+)
+from apps.notification.services import unread_counter_service
+from apps.notification.services.unread_counter_service import (
+    expire_notifications,
+    get_unread_count,
+    reconcile_unread_counts,
+)
+
+User = get_user_model()
+
+
+class UnreadCounterTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.role = Group.objects.create(name="Counter Role")
+        self.admin = User.objects.create(
+            email="admin@counter.com", phone_number="1000001101"
+        )
+        self.member = User.objects.create(
+            email="member@counter.com", phone_number="1000001102"
+        )
+        self.other = User.objects.create(
+            email="other@counter.com", phone_number="1000001103"
+        )
+        self.member.roles.add(self.role)
+        # Counter rows exist once a user has polled.
+        for user in (self.member, self.other):
+            self.assertEqual(get_unread_count(user), 0)
+
+    def _publish(self, **data):
+        serializer = NotificationAdminCreateSerializer(
+            data={"title": "t", "message": "m", **data},
+            context={"request": SimpleNamespace(user=self.admin)},
+        )
+        serializer.is_valid(raise_exception=True)
+        return serializer.save()
+
+    def _mark(self, user, notification, read=True):
+        serializer = MarkAsReadSerializer(data={"read": read})
+        serializer.is_valid(raise_exception=True)
+        serializer.save(user=user, notification=notification)
+
+    def test_publish_counts_each_audience_once(self):
+        self._publish(is_global=True)
+        self._publish(target_role_names=[self.role.name])
+        self._publish(
+            target_user_ids=[self.member.pk], target_role_names=[self.role.name]
+        )
+
+        with self.assertNumQueries(1):
+            self.assertEqual(get_unread_count(self.member), 3)
+        self.assertEqual(get_unread_count(self.other), 1)
+
+    def test_mark_read_only_adjusts_on_state_change(self):
+        notification = self._publish(is_global=True)
+
+        self._mark(self.member, notification)
+        self._mark(self.member, notification)
+        self.assertEqual(get_unread_count(self.member), 0)
+
+        self._mark(self.member, notification, read=False)
+        self.assertEqual(get_unread_count(self.member), 1)
+        self.assertEqual(get_unread_count(self.other), 1)
+
+    def test_concurrent_mark_read_counts_once(self):
+        notification = self._publish(target_user_ids=[self.member.pk])
+        self._publish(target_user_ids=[self.member.pk])
+        self._mark(self.member, notification)
+
+        # A second request that fetched the row before the first one wrote it.
+        stale = NotificationUser.objects.get(
+            user=self.member, notification=notification
+        )
+        stale.read_at = None
+        with mock.patch.object(
+            NotificationUser.objects, "get_or_create", return_value=(stale, False)
+        ):
+            self._mark(self.member, notification)
+        self.assertEqual(get_unread_count(self.member), 1)
+
+    def test_expiry_is_applied_once(self):
+        notification = self._publish(
+            is_global=True, expires_at=timezone.now() + timedelta(hours=1)
+        )
+        self._mark(self.other, notification)
+        Notification.objects.filter(pk=notification.pk).update(
+            expires_at=timezone.now() - timedelta(seconds=1)
+        )
+
+        self.assertEqual(expire_notifications(), 1)
+        self.assertEqual(expire_notifications(), 0)
+        self.assertEqual(get_unread_count(self.member), 0)
+        self.assertEqual(get_unread_count(self.other), 0)
+
+    def test_global_broadcast_never_writes_user_counters(self):
+        counters = NotificationUserCounter._meta.db_table
+        with CaptureQueriesContext(connection) as ctx:
+            notification = self._publish(is_global=True)
+        self.assertFalse([q for q in ctx.captured_queries if counters in q["sql"]])
+
+        self._mark(self.member, notification)
+        newcomer = User.objects.create(
+            email="new@counter.com", phone_number="1000001104"
+        )
+        self.assertEqual(get_unread_count(newcomer), 1)
+        self.assertEqual(get_unread_count(self.member), 0)
+
+        # Retraction releases the readers' share too; a later broadcast counts.
+        expire = timezone.now() - timedelta(seconds=1)
+        Notification.objects.filter(pk=notification.pk).update(expires_at=expire)
+        self.assertEqual(expire_notifications(), 1)
+        self._publish(is_global=True)
+        self.assertEqual(get_unread_count(self.member), 1)
+        self.assertEqual(get_unread_count(newcomer), 1)
+        self.assertEqual(reconcile_unread_counts(), (3, 0))
+
+    def test_role_change_rebuilds_counter(self):
+        self._publish(target_role_names=[self.role.name])
+        self.assertEqual(get_unread_count(self.other), 0)
+
+        self.other.roles.add(self.role)
+        counter = NotificationUserCounter.objects.get(user=self.other)
+        self.assertTrue(counter.stale)
+        self.assertEqual(get_unread_count(self.other), 1)
+        with self.assertNumQueries(1):
+            self.assertEqual(get_unread_count(self.other), 1)
+
+    def test_stale_counter_is_rebuilt_once(self):
+        NotificationUserCounter.objects.filter(user=self.member).update(stale=True)
+        # Readers that saw the stale row queue on its lock; the first rebuilds.
+        with mock.patch.object(
+            unread_counter_service,
+            "_count_unread",
+            wraps=unread_counter_service._count_unread,
+        ) as recount:
+            for _ in range(2):
+                unread_counter_service._refresh_counter(self.member.pk, only_stale=True)
+        self.assertEqual(recount.call_count, 1)
+
+    def test_reconcile_corrects_writes_that_bypass_services(self):
+        notification = self._publish(is_global=True)
+        NotificationUser.objects.create(
+            notification=notification, user=self.member, read_at=timezone.now()
+        )
+
+        self.assertEqual(reconcile_unread_counts(), (2, 1))
+        self.assertEqual(get_unread_count(self.member), 0)
+        self.assertEqual(get_unread_count(self.other), 1)
@@ -2,6 +2,7 @@ from django.contrib.auth.models import AbstractBaseUser
 from django.db import models
 
 from apps.common.models.common_base_models import HatchUpBaseModel
+from apps.common.utils.common_search_utils import trigram_index
 from apps.users.managers.users_base_managers import UserManager
 from apps.users.models.users_permission_models import PermissionsMixin
 
@@ -21,6 +22,12 @@ class User(AbstractBaseUser, PermissionsMixin, HatchUpBaseModel):
         verbose_name = "User"
         verbose_name_plural = "Users"
         ordering = ["-created_at"]
+        indexes = [
+            # `?search=` / admin search by email or name (trigram or icontains).
+            trigram_index("email", name="user_email_trgm_idx"),
+            trigram_index("first_name", name="user_first_name_trgm_idx"),
+            trigram_index("last_name", name="user_last_name_trgm_idx"),
+        ]
 
     def __str__(self):
         return self.email
@@ -28,3 +35,12 @@ class User(AbstractBaseUser, PermissionsMixin, HatchUpBaseModel):
     @property
     def full_name(self):
         return f"{self.first_name} {self.last_name}".strip()
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        # Users built from JWT claims (see HatchupJWTAuthentication.get_token_user)
+        # load every deferred field on first access instead of one query per field.
+        if fields is not None and self.__dict__.pop("_load_deferred_together", False):
+            fields = list(set(fields) | self.get_deferred_fields())
+        return super().refresh_from_db(
+            using=using, fields=fields, from_queryset=from_queryset
+        )
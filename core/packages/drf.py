@@ -3,11 +3,30 @@ REST_FRAMEWORK = {
         "apps.common.configs.classes.common_authentication_classes.HatchupJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.AllowAny",),
+    "DEFAULT_RENDERER_CLASSES": (
+        "apps.common.configs.classes.common_renderers_classes.HatchupJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "apps.common.configs.classes.common_parsers_classes.HatchupJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_PAGINATION_CLASS": "apps.common.configs.classes.common_paginators_classes.DefaultPagination",
     "DEFAULT_FILTER_BACKENDS": [
         "django_filters.rest_framework.DjangoFilterBackend",
     ],
+    # Sliding-window limits of the authentication endpoints, by
+    # `<throttle_scope>_<ip|email>` (see common_throttles_classes).
+    "DEFAULT_THROTTLE_RATES": {
+        "login_ip": "60/h",
+        "login_email": "10/15m",
+        "otp_request_ip": "30/h",
+        "otp_request_email": "5/15m",
+        "otp_verify_ip": "60/h",
+        "otp_verify_email": "10/15m",
+    },
     "EXCEPTION_HANDLER": "apps.common.utils.common_exception_handler.hatchup_exception_handler",
     "PAGE_SIZE": 10,
 }
@@ -35,6 +35,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "corsheaders",
     "storages",
     "django_jsonform",
@@ -46,6 +47,7 @@ INSTALLED_APPS = [
     "apps.users.apps.UsersConfig",
     "apps.auth.apps.AuthConfig",
     "apps.notification.apps.NotificationConfig",
+    "apps.messaging.apps.MessagingConfig",
     "apps.document.apps.DocumentConfig",
 ]
 
@@ -53,7 +55,7 @@ INSTALLED_APPS = [
 AUTH_USER_MODEL = "users.User"
 
 # Auth backends
-AUTHENTICATION_BACKENDS = ("django.contrib.auth.backends.ModelBackend",)
+AUTHENTICATION_BACKENDS = ("apps.auth.backends.PooledModelBackend",)
 
 # Cache is used by role checks (short TTL) and request-scoped permission checks.
 # Prefer Redis when available; fall back to local memory for dev environments.
@@ -79,6 +81,41 @@ else:
         }
     }
 
+# Stateless JWT users: build `request.user` from signed token claims instead of
+# fetching the User row per request. Deactivated users are still rejected via
+# the revocation bitmap in the default cache (see apps/auth/services/revocation.py).
+JWT_TOKEN_USER_ENABLED = os.getenv("JWT_TOKEN_USER_ENABLED", "false").lower() in (
+    "true",
+    "1",
+    "yes",
+)
+# Trust JWT `roles` claims for role gates (role changes still distrust them).
+JWT_TRUST_ROLE_CLAIMS = os.getenv("JWT_TRUST_ROLE_CLAIMS", "false").lower() in (
+    "true",
+    "1",
+    "yes",
+)
+
+# Full User objects (when token-user mode is off) are resolved through a
+# per-process LRU in front of the default cache; see apps/auth/services/user_cache.py.
+AUTH_USER_CACHE_ENABLED = os.getenv("AUTH_USER_CACHE_ENABLED", "true").lower() in (
+    "true",
+    "1",
+    "yes",
+)
+AUTH_USER_CACHE_TTL_SECONDS = int(os.getenv("AUTH_USER_CACHE_TTL_SECONDS", "300"))
+AUTH_USER_CACHE_LOCAL_TTL_SECONDS = int(
+    os.getenv("AUTH_USER_CACHE_LOCAL_TTL_SECONDS", "5")
+)
+AUTH_USER_CACHE_LOCAL_MAXSIZE = int(os.getenv("AUTH_USER_CACHE_LOCAL_MAXSIZE", "1024"))
+# Per-process role map; the shared role generation is re-read at most this often.
+AUTH_ROLE_CACHE_CHECK_SECONDS = float(os.getenv("AUTH_ROLE_CACHE_CHECK_SECONDS", "1"))
+AUTH_ROLE_CACHE_LOCAL_MAXSIZE = int(os.getenv("AUTH_ROLE_CACHE_LOCAL_MAXSIZE", "4096"))
+# auto | exists | subquery | ids (see filter_queryset_by_object_perm).
+AUTHZ_OBJECT_PERM_FILTER_STRATEGY = os.getenv(
+    "AUTHZ_OBJECT_PERM_FILTER_STRATEGY", "auto"
+).lower()
+
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "corsheaders.middleware.CorsMiddleware",
@@ -202,6 +239,60 @@ else:
         "yes",
     )
 DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL", "noreply@example.com")
+# SMTP socket timeout; also bounds how long an outbox batch may run on a lease.
+EMAIL_TIMEOUT = int(os.getenv("EMAIL_TIMEOUT", "30"))
+
+# OTP limits (see apps/auth/services/otp_service.py): wrong guesses before a
+# code is burned, and codes an email may request per window.
+OTP_MAX_VERIFY_ATTEMPTS = int(os.getenv("OTP_MAX_VERIFY_ATTEMPTS", "5"))
+OTP_RATE_LIMIT = int(os.getenv("OTP_RATE_LIMIT", "5"))
+OTP_RATE_WINDOW_SECONDS = int(os.getenv("OTP_RATE_WINDOW_SECONDS", "3600"))
+
+# Password hashing pool (see apps/auth/services/password_verification.py):
+# worker threads per process (default: one per CPU), and checks that may wait
+# for one before logins are refused with 429.
+AUTH_PASSWORD_WORKERS = int(os.getenv("AUTH_PASSWORD_WORKERS", "0")) or None
+AUTH_PASSWORD_QUEUE_DEPTH = int(os.getenv("AUTH_PASSWORD_QUEUE_DEPTH", "4"))
+
+# Email outbox: queued emails are sent after commit by EMAIL_OUTBOX_WORKERS
+# threads per process, or inline when EMAIL_OUTBOX_ASYNC is off (see
+# apps/notification/services/email_outbox_service.py).
+EMAIL_OUTBOX_ASYNC = not _IS_TEST_RUN and os.getenv(
+    "EMAIL_OUTBOX_ASYNC", "true"
+).lower() in ("true", "1", "yes")
+EMAIL_OUTBOX_WORKERS = int(os.getenv("EMAIL_OUTBOX_WORKERS", "2"))
+EMAIL_OUTBOX_BATCH_SIZE = int(os.getenv("EMAIL_OUTBOX_BATCH_SIZE", "50"))
+EMAIL_OUTBOX_MAX_ATTEMPTS = int(os.getenv("EMAIL_OUTBOX_MAX_ATTEMPTS", "5"))
+EMAIL_OUTBOX_RETRY_BASE_SECONDS = int(
+    os.getenv("EMAIL_OUTBOX_RETRY_BASE_SECONDS", "30")
+)
+# Sent/failed rows are deleted by `purge_email_outbox` after this many days.
+EMAIL_OUTBOX_RETENTION_DAYS = int(os.getenv("EMAIL_OUTBOX_RETENTION_DAYS", "7"))
+
+# Notifications: fan out global/role broadcasts into per-user inbox rows when
+# the audience is at most NOTIFICATION_FANOUT_MAX_AUDIENCE users; larger ones
+# are resolved at read time (see apps/notification/services/fanout_service.py).
+NOTIFICATION_FANOUT_ENABLED = os.getenv(
+    "NOTIFICATION_FANOUT_ENABLED", "false"
+).lower() in ("true", "1", "yes")
+NOTIFICATION_FANOUT_MAX_AUDIENCE = int(
+    os.getenv("NOTIFICATION_FANOUT_MAX_AUDIENCE", "50000")
+)
+NOTIFICATION_FANOUT_ASYNC = not _IS_TEST_RUN and os.getenv(
+    "NOTIFICATION_FANOUT_ASYNC", "true"
+).lower() in ("true", "1", "yes")
+# Notification emails (`send_email`): recipients are streamed and sent in
+# batches of NOTIFICATION_EMAIL_BATCH_SIZE over one connection, after commit
+# (see apps/notification/services/email_channel_service.py).
+NOTIFICATION_EMAIL_ASYNC = not _IS_TEST_RUN and os.getenv(
+    "NOTIFICATION_EMAIL_ASYNC", "true"
+).lower() in ("true", "1", "yes")
+NOTIFICATION_EMAIL_BATCH_SIZE = int(os.getenv("NOTIFICATION_EMAIL_BATCH_SIZE", "200"))
+# A run is claimed by one sender at a time; the claim is renewed after every
+# batch and taken over by another sender only once it has lapsed this long.
+NOTIFICATION_EMAIL_LEASE_SECONDS = int(
+    os.getenv("NOTIFICATION_EMAIL_LEASE_SECONDS", "300")
+)
 
 # Static files (CSS, JavaScript, Images)
 # https://docs.djangoproject.com/en/5.2/howto/static-files/
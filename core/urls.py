@@ -23,6 +23,7 @@ APP_URLS = [
     path("auth/", include("apps.auth.apis.urls")),
     path("users/", include("apps.users.apis.urls")),
     path("document/", include("apps.document.apis.urls")),
+    path("messaging/", include("apps.messaging.apis.urls")),
 ]
 
 